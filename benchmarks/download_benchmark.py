@@ -0,0 +1,258 @@
+'''
+Download throughput benchmark
+=============================
+
+Drives downloads from a local `MediaServer` through the application's own workers (yt-dlp's generic
+extractor for media files and feeds, `HTTPDownloader` for direct links, `DownloadQueueManager` for queues)
+and reports, per run:
+
+    - wall_s, bytes, throughput_bps: duration, bytes written and bytes per second
+    - ttfb_s: seconds from the start until the first progress record with downloaded bytes
+    - server_ttfb_s: seconds from the start until the server sent the first media byte
+    - progress_signals, progress_rate_hz: progress records delivered to the GUI thread and their rate
+    - lag_mean_ms, lag_p95_ms, lag_max_ms: how late a 10 ms GUI timer fired while downloading
+
+Results are printed and can be written as JSON (`--output`) and compared with an earlier run (`--baseline`).
+
+Usage (from the repository root)::
+
+    python -m benchmarks.download_benchmark --scenarios video,direct,queue --size 16M --rate 8M --repeat 3 --output run.json
+'''
+import os
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer, QEventLoop
+from importlib import import_module
+from statistics import mean, median
+import argparse
+import platform
+import tempfile
+import shutil
+import json
+import time
+import sys
+
+from benchmarks.media_server import MediaServer
+
+SCENARIOS = ('video', 'direct', 'playlist', 'queue')
+METRICS = ('throughput_bps', 'ttfb_s', 'progress_rate_hz', 'lag_p95_ms')
+
+
+def load_download_page():
+    '''Imports the download page, which needs `winsound` (Windows only) for its error beeps'''
+    try:
+        import winsound  # noqa: F401
+    except ImportError:
+        # The benchmarks never beep, an inert module lets them run on any platform
+        import types
+        sys.modules['winsound'] = types.SimpleNamespace(MessageBeep=lambda *args: None, MB_ICONHAND=0, MB_OK=0)
+    return import_module('gui.pages.download_page')
+
+
+def parse_size(text: str) -> int:
+    '''`8M`, `512K`, `1G` or a number of bytes'''
+    text = text.strip().upper().removesuffix('B')
+    factor = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}.get(text[-1:], 1)
+    return int(float(text[:-1] if factor > 1 else text) * factor)
+
+
+class LagMonitor:
+    """Fires a GUI timer every `interval` ms and records how late each tick was."""
+    def __init__(self, interval: int = 10):
+        self.interval = interval
+        self.lags = []
+        self._last = None
+        self.timer = QTimer()
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self._tick)
+
+    def start(self):
+        self._last = time.perf_counter()
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def _tick(self):
+        now = time.perf_counter()
+        self.lags.append(max(0.0, (now - self._last) * 1000 - self.interval))
+        self._last = now
+
+    def summary(self) -> dict:
+        lags = sorted(self.lags) or [0.0]
+        return {'lag_mean_ms': round(mean(lags), 3), 'lag_p95_ms': round(lags[int((len(lags) - 1) * 0.95)], 3),
+                'lag_max_ms': round(lags[-1], 3)}
+
+
+class Run:
+    """Collects the progress records and results of one benchmark run."""
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.first_byte = None
+        self.signals = 0
+        self.results = []
+
+    def on_progress(self, record):
+        self.signals += 1
+        if self.first_byte is None and record.get('downloaded'):
+            self.first_byte = time.perf_counter()
+
+
+def run_scenario(page, server: MediaServer, scenario: str, args, out_dir: str) -> dict:
+    '''Runs one download scenario to completion and returns its metrics'''
+    loop = QEventLoop()
+    run = Run()
+    base_opts = {'outtmpl': os.path.join(out_dir, '%(title)s.%(ext)s'), 'quiet': True, 'no_warnings': True,
+                 'concurrent_fragment_downloads': args.fragments}
+    workers = []
+
+    def finished(result):
+        run.results.append(result)
+        if len(run.results) >= expected:
+            loop.quit()
+
+    if scenario == 'queue':
+        queue = page.DownloadQueue(os.path.join(out_dir, 'queue.json'), max_concurrent=args.concurrent)
+        manager = page.DownloadQueueManager(queue, progress_rate=args.progress_rate)
+        manager.item_progress.connect(lambda item_id, record: run.on_progress(record))
+        manager.item_finished.connect(lambda item, result: finished(result))
+        expected = args.count
+        for n in range(1, args.count + 1):
+            manager.enqueue({'type': 'video', 'url': server.media_url(args.size, n), 'opts': dict(base_opts),
+                             'save_path': out_dir, 'title': f'Item {n}'})
+    else:
+        expected = 1
+        if scenario == 'direct':
+            worker = page.DirectDownloadWorker(server.media_url(args.size), os.path.join(out_dir, 'direct.mp4'),
+                                               args.connections, args.progress_rate)
+        elif scenario == 'playlist':
+            opts = dict(base_opts, ignoreerrors=True)
+            worker = page.DownloadWorker(server.feed_url(args.count, args.size), opts, args.progress_rate,
+                                         args.parallel)
+        else:
+            worker = page.DownloadWorker(server.media_url(args.size), base_opts, args.progress_rate)
+        worker.progress.connect(run.on_progress)
+        worker.finished.connect(finished)
+        workers.append(worker)
+        worker.start()
+
+    monitor = LagMonitor()
+    monitor.start()
+    QTimer.singleShot(int(args.timeout * 1000), loop.quit)
+    loop.exec()
+    monitor.stop()
+    wall = time.perf_counter() - run.started
+    for worker in workers:
+        worker.wait()
+
+    written = sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(out_dir)
+                  for name in names if name.endswith('.mp4'))
+    first_sent = min((r[2] for r in server.requests if r[2] is not None), default=None)
+    return {
+        'scenario': scenario,
+        'ok': len(run.results) == expected and all(r.get('State') for r in run.results),
+        'wall_s': round(wall, 4),
+        'bytes': written,
+        'throughput_bps': round(written / wall, 1) if wall else None,
+        'ttfb_s': round(run.first_byte - run.started, 4) if run.first_byte else None,
+        'server_ttfb_s': round(first_sent - run.started, 4) if first_sent else None,
+        'progress_signals': run.signals,
+        'progress_rate_hz': round(run.signals / wall, 2) if wall else None,
+        'requests': len(server.requests),
+        **monitor.summary(),
+    }
+
+
+def summarize(runs: list) -> dict:
+    '''Median of every numeric metric per scenario'''
+    summary = {}
+    for scenario in dict.fromkeys(r['scenario'] for r in runs):
+        rows = [r for r in runs if r['scenario'] == scenario]
+        summary[scenario] = {key: median(r[key] for r in rows) for key, value in rows[0].items()
+                             if key != 'run' and isinstance(value, (int, float)) and not isinstance(value, bool)
+                             and all(r[key] is not None for r in rows)}
+        summary[scenario]['ok'] = all(r['ok'] for r in rows)
+    return summary
+
+
+def compare(summary: dict, baseline: dict) -> list:
+    '''Lines with the relative change of the main metrics against a baseline summary'''
+    lines = []
+    for scenario, metrics in summary.items():
+        old = baseline.get(scenario)
+        if not old:
+            continue
+        changes = []
+        for key in METRICS:
+            if metrics.get(key) is not None and old.get(key):
+                changes.append(f"{key} {(metrics[key] - old[key]) / old[key] * 100:+.1f}%")
+        lines.append(f"{scenario}: " + ', '.join(changes))
+    return lines
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Local download throughput benchmark')
+    parser.add_argument('--scenarios', default='video,direct,playlist,queue',
+                        help=f'comma separated, from {", ".join(SCENARIOS)}')
+    parser.add_argument('--size', type=parse_size, default=parse_size('8M'), help='size of each file (e.g. 8M)')
+    parser.add_argument('--count', type=int, default=4, help='files per playlist / queue')
+    parser.add_argument('--rate', type=parse_size, default=0, help='server rate per connection, 0 for unthrottled')
+    parser.add_argument('--latency', type=float, default=0.0, help='server delay before each media response (s)')
+    parser.add_argument('--no-ranges', action='store_true', help='serve files without Range support')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--progress-rate', type=float, default=10, help='progress records per second per item')
+    parser.add_argument('--connections', type=int, default=4, help='connections of direct downloads')
+    parser.add_argument('--fragments', type=int, default=1, help='yt-dlp concurrent_fragment_downloads')
+    parser.add_argument('--parallel', type=int, default=1, help='playlist entries downloaded at the same time')
+    parser.add_argument('--concurrent', type=int, default=2, help='queue downloads running at the same time')
+    parser.add_argument('--timeout', type=float, default=300, help='seconds before a run is abandoned')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--baseline', help='JSON file of an earlier run to compare with')
+    args = parser.parse_args(argv)
+
+    scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f'unknown scenario(s): {", ".join(unknown)}')
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    page = load_download_page()
+
+    runs = []
+    for scenario in scenarios:
+        for n in range(args.repeat):
+            out_dir = tempfile.mkdtemp(prefix='mfm-bench-')
+            try:
+                with MediaServer(args.rate, not args.no_ranges, args.latency) as server:
+                    result = run_scenario(page, server, scenario, args, out_dir)
+            finally:
+                shutil.rmtree(out_dir, ignore_errors=True)
+            result['run'] = n + 1
+            runs.append(result)
+            print(f"{scenario:>8} #{n + 1}: {'ok' if result['ok'] else 'FAILED'} "
+                  f"{result['throughput_bps'] / 1024 / 1024:.2f} MiB/s, ttfb {result['ttfb_s']}s, "
+                  f"{result['progress_rate_hz']} progress/s, lag p95 {result['lag_p95_ms']} ms", flush=True)
+
+    summary = summarize(runs)
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': {'python': platform.python_version(), 'platform': platform.platform(),
+                        'yt_dlp': import_module('yt_dlp.version').__version__},
+        'arguments': {k: v for k, v in vars(args).items() if k not in ('output', 'baseline')},
+        'runs': runs,
+        'summary': summary,
+    }
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            for line in compare(summary, json.load(f).get('summary', {})):
+                print(f"vs baseline  {line}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    app.processEvents()
+    return 0 if all(r['ok'] for r in runs) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
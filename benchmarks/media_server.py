@@ -0,0 +1,152 @@
+'''
+Classes
+-------
+
+    - MediaServer:
+        Local HTTP server serving generated media files and playlist feeds for the benchmarks.
+'''
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import threading
+import random
+import time
+import re
+
+# Every generated file repeats this block, so the byte at offset `i` is `_block[i % len(_block)]`
+_block = random.Random(0).randbytes(64 * 1024)
+_media = re.compile(r'^/media/(\d+)(?:-\d+)?\.mp4$')
+_feed = re.compile(r'^/feed/(\d+)x(\d+)\.xml$')
+_range = re.compile(r'^bytes=(\d+)-(\d*)$')
+
+
+class MediaServer:
+    """
+    MediaServer
+    ===========
+
+    Serves generated files without touching the disk, in a background thread:
+
+        - `/media/<size>.mp4` (or `/media/<size>-<n>.mp4` for distinct names): `size` bytes of video/mp4
+        - `/feed/<count>x<size>.xml`: RSS feed of `count` such files, a playlist for yt-dlp's generic extractor
+
+    Attributes
+    ----------
+        rate (int): Bytes per second sent on each connection, 0 for unthrottled
+        ranges (bool): Whether Range requests are honoured (`Accept-Ranges: bytes`, `206` responses)
+        latency (float): Seconds waited before the response headers of a media request
+        requests (list): (path, Range header, time the first body byte was sent) of every media request
+
+    Methods
+    -------
+        start() -> MediaServer / stop() -> None:
+            Starts / stops the server, also usable as a context manager
+
+        url(str) -> str:
+            Absolute URL of a path on the server
+
+        media_url(int, int) -> str / feed_url(int, int) -> str:
+            URL of a file of `size` bytes / of a feed of `count` files
+    """
+    block_size = 64 * 1024
+
+    def __init__(self, rate: int = 0, ranges: bool = True, latency: float = 0.0, port: int = 0):
+        self.rate = rate
+        self.ranges = ranges
+        self.latency = latency
+        self.requests = []
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                if _feed.match(path):
+                    server._send_feed(self, *map(int, _feed.match(path).groups()))
+                elif _media.match(path):
+                    server._send_media(self, int(_media.match(path)[1]))
+                else:
+                    self.send_error(404)
+
+        return Handler
+
+    def start(self) -> 'MediaServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def url(self, path: str) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}{path}'
+
+    def media_url(self, size: int, n: int | None = None) -> str:
+        return self.url(f'/media/{size}.mp4' if n is None else f'/media/{size}-{n}.mp4')
+
+    def feed_url(self, count: int, size: int) -> str:
+        return self.url(f'/feed/{count}x{size}.xml')
+
+    def _send_feed(self, handler, count: int, size: int) -> None:
+        items = ''.join(f'<item><title>Entry {n}</title><link>{self.media_url(size, n)}</link>'
+                        f'<enclosure url="{self.media_url(size, n)}" type="video/mp4" length="{size}"/></item>'
+                        for n in range(1, count + 1))
+        body = (f'<?xml version="1.0"?><rss version="2.0"><channel><title>Benchmark {count}x{size}</title>'
+                f'<link>{self.url("/")}</link><description>generated</description>{items}</channel></rss>').encode()
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'application/rss+xml')
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _send_media(self, handler, size: int) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        start, end = 0, size - 1
+        header = handler.headers.get('Range', '')
+        match = _range.match(header) if self.ranges else None
+        if match and int(match[1]) < size:
+            start, end = int(match[1]), min(int(match[2]) if match[2] else size - 1, size - 1)
+            handler.send_response(206)
+            handler.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+        else:
+            handler.send_response(200)
+        if self.ranges:
+            handler.send_header('Accept-Ranges', 'bytes')
+        handler.send_header('Content-Type', 'video/mp4')
+        handler.send_header('Content-Length', str(end - start + 1))
+        handler.end_headers()
+
+        record = [handler.path, header or None, None]
+        with self._lock:
+            self.requests.append(record)
+        offset, left = start, end - start + 1
+        try:
+            while left > 0:
+                skip = offset % len(_block)
+                chunk = _block[skip:skip + min(self.block_size, left)]
+                sent = time.perf_counter()
+                handler.wfile.write(chunk)
+                if record[2] is None:
+                    record[2] = sent
+                offset += len(chunk)
+                left -= len(chunk)
+                if self.rate:
+                    # Hold the connection so it averages `rate` bytes per second
+                    time.sleep(max(0.0, len(chunk) / self.rate - (time.perf_counter() - sent)))
+        except (BrokenPipeError, ConnectionResetError):
+            pass
@@ -0,0 +1,135 @@
+'''
+Classes
+-------
+
+    - BandwidthScheduler:
+        Global token bucket sharing a total download rate between the running downloads.
+'''
+import threading
+import time
+
+
+class BandwidthScheduler:
+    """
+    BandwidthScheduler
+    ==================
+
+    Global token bucket shared by every download worker. Each running download is a client with a
+    weight, and gets `rate * weight / total weight` bytes per second. Clients report received bytes
+    with `consume`, which blocks the calling (download) thread while the client is over its share.
+    Blocking the thread that reads the socket also slows down the transfer itself.
+
+    The rate and the weights can be changed at any time: waiting clients pick up the new values
+    within `max_sleep` seconds. A rate of 0 disables the limit.
+
+    Attributes
+    ----------
+        rate (int): Total rate in bytes per second, 0 for unlimited
+        burst (float): Seconds of a client's share it may receive at once before being held back
+        max_sleep (float): Longest single sleep, bounds how late a rate change is applied
+
+    Methods
+    -------
+        set_rate(int) -> None:
+            Changes the total rate (bytes per second, 0 for unlimited)
+
+        register(str, float) -> None / unregister(str) -> None:
+            Adds a client with a weight / removes it
+
+        set_weight(str, float) -> None:
+            Changes the weight of a client
+
+        share(str) -> float:
+            Current rate of a client in bytes per second (0 when unlimited)
+
+        consume(str, int) -> None:
+            Reports received bytes, blocks while the client is over its share
+
+        weight_for_priority(int) -> float:
+            Weight of a queue priority, every priority step doubles the share
+    """
+
+    def __init__(self, rate: int = 0, burst: float = 0.5, max_sleep: float = 0.25):
+        self.rate = max(0, int(rate))
+        self.burst = burst
+        self.max_sleep = max_sleep
+        self._clients = {}  # client -> {'weight', 'tokens', 'stamp'}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def weight_for_priority(priority: int) -> float:
+        '''Weight of a queue priority, every priority step doubles the share (clamped to ±4 steps)'''
+        return 2.0 ** max(-4, min(4, priority))
+
+    def set_rate(self, rate: int) -> None:
+        '''Changes the total rate in bytes per second, 0 disables the limit'''
+        with self._lock:
+            self.rate = max(0, int(rate))
+
+    def register(self, client: str, weight: float = 1.0) -> None:
+        '''Adds a client (a running download) with a weight'''
+        with self._lock:
+            self._clients[client] = {'weight': max(weight, 1e-6), 'tokens': 0.0, 'stamp': time.monotonic()}
+
+    def unregister(self, client: str) -> None:
+        '''Removes a client, its share is given back to the others'''
+        with self._lock:
+            self._clients.pop(client, None)
+
+    def set_weight(self, client: str, weight: float) -> None:
+        '''Changes the weight of a client'''
+        with self._lock:
+            if client in self._clients:
+                self._clients[client]['weight'] = max(weight, 1e-6)
+
+    def _share(self, client: str) -> float:
+        if not self.rate or client not in self._clients:
+            return 0.0
+        total = sum(c['weight'] for c in self._clients.values())
+        return self.rate * self._clients[client]['weight'] / total
+
+    def share(self, client: str) -> float:
+        '''Current rate of a client in bytes per second, 0 when unlimited or unknown'''
+        with self._lock:
+            return self._share(client)
+
+    def consume(self, client: str, nbytes: int) -> None:
+        '''
+        Reports `nbytes` received by a client and blocks until they fit in its share.
+        Unknown clients and an unlimited rate never block.
+
+        Parameters
+        ----------
+            client : str
+                id the client was registered with
+            nbytes : int
+                number of bytes received since the previous call
+        '''
+        with self._lock:
+            state = self._clients.get(client)
+            if state is None:
+                return
+            self._refill(client, state)
+            state['tokens'] -= nbytes
+        # Sleep in short slices so rate and weight changes apply quickly
+        while True:
+            with self._lock:
+                state = self._clients.get(client)
+                if state is None or not self.rate:
+                    if state is not None:
+                        state['tokens'] = 0.0
+                    return
+                share = self._refill(client, state)
+                if state['tokens'] >= 0:
+                    return
+                wait = -state['tokens'] / share
+            time.sleep(min(wait, self.max_sleep))
+
+    def _refill(self, client: str, state: dict) -> float:
+        '''Adds the tokens earned since the last refill (caller holds the lock), returns the share'''
+        now = time.monotonic()
+        share = self._share(client)
+        if share:
+            state['tokens'] = min(state['tokens'] + (now - state['stamp']) * share, share * self.burst)
+        state['stamp'] = now
+        return share
@@ -0,0 +1,97 @@
+'''
+Functions
+---------
+
+    - parse_urls:
+        Extracts the URLs of a pasted list or text file.
+
+    - downloaded_keys:
+        Normalized URLs downloaded successfully according to the download log.
+
+    - deduplicate:
+        Splits URLs into new ones, duplicates and already downloaded ones.
+'''
+from cli.metadata_cache import normalize_url
+import csv
+import os
+import re
+
+DOWNLOAD_LOG = 'Media Files Manager/Logs/Download.csv'
+
+# Separators between URLs: whitespace, commas, semicolons and the quotes/brackets of copied lists
+_separators = re.compile(r'[\s,;"\'<>()\[\]]+')
+_host = re.compile(r'^(?:[\w-]+\.)+[a-z]{2,}(?:[/?#]|$)', re.IGNORECASE)
+
+
+def parse_urls(text: str) -> list:
+    '''
+    Extracts the URLs of a pasted list or text file, in order. Lines starting with `#` are comments.
+    Links without a scheme (`youtu.be/...`, `www.youtube.com/...`) get `https://`.
+
+    Parameters
+    ----------
+        text : str
+            one or more URLs per line, separated by whitespace, commas or semicolons
+    '''
+    urls = []
+    for line in text.splitlines():
+        if line.lstrip().startswith('#'):
+            continue
+        for token in _separators.split(line):
+            if token.lower().startswith(('http://', 'https://')):
+                urls.append(token)
+            elif _host.match(token):
+                urls.append(f'https://{token}')
+    return urls
+
+
+def downloaded_keys(log_path: str = DOWNLOAD_LOG) -> set:
+    '''
+    Normalized URLs (see `normalize_url`) of the successful downloads recorded in the download log,
+    keyed as the video or playlist they were downloaded as.
+    A later failed integrity check (`Integrity Check` row) cancels the download before it.
+    '''
+    keys = set()
+    if not os.path.exists(log_path):
+        return keys
+    with open(log_path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            if not row.get('URL'):
+                continue
+            media_type = {'Video/Audio Download': 'video', 'Playlist Download': 'playlist'}.get(row.get('Process'))
+            if row.get('State') in ('1', 'True'):
+                keys.add(normalize_url(row['URL'], media_type))
+            elif row.get('Process') == 'Integrity Check':
+                keys.difference_update({normalize_url(row['URL'], 'video'), normalize_url(row['URL'], 'playlist')})
+    return keys
+
+
+def deduplicate(urls: list, known: set = frozenset(), downloaded: set = frozenset()) -> dict:
+    '''
+    Splits URLs by their normalized form, so `youtu.be/<id>`, `youtube.com/watch?v=<id>&t=10`, ...
+    count as one video. The first spelling of a URL is kept. A URL counts as downloaded when it was
+    downloaded as a video or as a playlist (`watch?v=...&list=...` links can be either).
+
+    Parameters
+    ----------
+        urls : list
+            URLs in import order
+        known : set
+            normalized URLs already imported or queued, reported as duplicates
+        downloaded : set
+            normalized URLs downloaded before (see `downloaded_keys`)
+
+    **Return** dict with `new`, `duplicates` and `downloaded` lists of URLs
+    '''
+    result = {'new': [], 'duplicates': [], 'downloaded': []}
+    seen = set(known)
+    for url in urls:
+        key = normalize_url(url)
+        if key in seen:
+            result['duplicates'].append(url)
+        elif normalize_url(url, 'video') in downloaded or normalize_url(url, 'playlist') in downloaded:
+            result['downloaded'].append(url)
+        else:
+            result['new'].append(url)
+        seen.add(key)
+    return result
@@ -0,0 +1,131 @@
+'''
+Functions
+---------
+
+    - free_space:
+        Free bytes on the volume a (possibly not yet created) folder belongs to.
+
+    - estimate_format_size:
+        Estimated download size of a video for a yt-dlp format string or format constraints.
+
+    - estimate_playlist_size:
+        Estimated download size of playlist entries, extrapolated for entries without formats.
+
+    - preflight:
+        Compares an estimated download size with the free space of the target volume.
+'''
+from cli.format_selector import estimate_size, select_format
+import shutil
+import os
+
+# Preflight states
+SPACE_OK = 'OK'
+SPACE_LOW = 'Low'                    # Fits, but leaves less than the safety margin free
+SPACE_INSUFFICIENT = 'Insufficient'  # Does not fit
+
+
+def free_space(path: str) -> int:
+    '''Free bytes on the volume of `path`, the nearest existing parent folder is used if it does not exist'''
+    path = os.path.abspath(path)
+    while not os.path.exists(path) and os.path.dirname(path) != path:
+        path = os.path.dirname(path)
+    return shutil.disk_usage(path).free
+
+
+def estimate_format_size(info: dict, format_spec: str | None = None, section: list | None = None,
+                         **constraints) -> int | None:
+    '''
+    Estimated download size in bytes of a video, None if it cannot be estimated
+
+    Parameters
+    ----------
+        info : dict
+            trimmed info dict (with `formats` and `duration`)
+        format_spec : str | None
+            yt-dlp format string. Format ids (`137+140`) are summed directly, other selectors
+            are approximated with `select_format`
+        section : list | None
+            [start, end] seconds of a clip, the size is scaled to the clip length
+        constraints :
+            passed to `select_format` when the format string is not made of format ids
+    '''
+    formats = info.get('formats') or []
+    duration = info.get('duration')
+    by_id = {f.get('format_id'): f for f in formats}
+    ids = [i.strip() for i in (format_spec or '').split('+')]
+    if format_spec and all(i in by_id for i in ids):
+        sizes = [estimate_size(by_id[i], duration) for i in ids]
+        size = None if None in sizes else sum(sizes)
+    else:
+        if format_spec and format_spec.startswith(('bestaudio', 'ba')):
+            constraints.setdefault('audio_only', True)
+        choice = select_format(formats, duration, **constraints)
+        size = choice['size'] if choice else None
+    if size and section and duration:
+        start, end = section
+        end = duration if end is None else min(end, duration)
+        size = int(size * max(0.0, end - start) / duration)
+    return size
+
+
+def estimate_playlist_size(entries: list, **constraints) -> tuple:
+    '''
+    Estimated download size of playlist entries
+
+    Parameters
+    ----------
+        entries : list
+            (info, duration) pair of every entry to download, `info` is the trimmed info dict of
+            the entry or None if its formats are not known yet
+        constraints :
+            passed to `select_format` for the entries with known formats
+
+    Entries without formats are estimated from their duration and the byte rate of the known
+    entries, or from the average known entry size when their duration is unknown too.
+
+    **Return** (estimated bytes or None if no entry could be estimated, number of entries with known formats)
+    '''
+    known_sizes, rate_bytes, rate_seconds = [], 0, 0
+    unknown = []
+    for info, duration in entries:
+        size = estimate_format_size(info, **constraints) if info else None
+        if size is None:
+            unknown.append(duration)
+            continue
+        known_sizes.append(size)
+        if info.get('duration'):
+            rate_bytes += size
+            rate_seconds += info['duration']
+    if not known_sizes:
+        return None, 0
+    average = sum(known_sizes) / len(known_sizes)
+    rate = rate_bytes / rate_seconds if rate_seconds else None
+    total = sum(known_sizes) + sum(d * rate if d and rate else average for d in unknown)
+    return int(total), len(known_sizes)
+
+
+def preflight(path: str, needed: int, reserved: int = 0, margin: float = 0.05) -> tuple:
+    '''
+    Compares the bytes a download needs with the free space of the volume it is saved to
+
+    Parameters
+    ----------
+        path : str
+            folder the download is saved to
+        needed : int
+            estimated size of the download
+        reserved : int
+            bytes still to be written by other queued/running downloads on any volume
+            (counted against this one, to stay on the safe side)
+        margin : float
+            part of the volume's free space that should stay free, below it the state is `Low`
+
+    **Return** (state, free bytes) with state `SPACE_OK`, `SPACE_LOW` or `SPACE_INSUFFICIENT`
+    '''
+    free = free_space(path)
+    left = free - reserved - needed
+    if left < 0:
+        return SPACE_INSUFFICIENT, free
+    if left < free * margin:
+        return SPACE_LOW, free
+    return SPACE_OK, free
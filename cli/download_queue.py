@@ -0,0 +1,233 @@
+'''
+Classes
+-------
+
+    - DownloadQueue:
+        Ordered, prioritized and persistent list of pending downloads.
+'''
+import json
+import os
+import time
+import uuid
+
+# Item states
+QUEUED = 'Queued'
+PAUSED = 'Paused'
+RUNNING = 'Running'
+FAILED = 'Failed'
+INTERRUPTED = 'Interrupted'  # Was running when the application closed or crashed
+WAITING = 'Waiting'  # Failed, queued again once its retry time (`retry_at`) is reached
+
+
+class DownloadQueue:
+    """
+    DownloadQueue
+    =============
+
+    Ordered, prioritized and persistent list of pending downloads.
+
+    Every item is a dict holding the download parameters built by the download page
+    (`type`, `url`, `opts`, `save_path`, `title`) plus the queue fields `id`, `priority`,
+    `order` and `state`. Items are removed once they finish successfully.
+    Running items also record `downloaded` and `total` bytes. Items that were still running when the
+    queue was last saved (the application closed or crashed) are loaded as `Interrupted`, and are only
+    started again once resumed. Failed items waiting for an automatic retry are `Waiting`, with the
+    time of the retry in `retry_at`.
+
+    Attributes
+    ----------
+        path (str): Path of the JSON file the queue is persisted to
+        max_concurrent (int): Number of downloads allowed to run at the same time
+        rate_limit (int): Total download rate in bytes per second shared by all downloads, 0 for unlimited
+        postprocess_workers (int): Number of post-processing (ffmpeg) jobs allowed to run at the same time
+        verify_downloads (bool): Whether finished downloads are checked for truncated or broken files
+
+    Methods
+    -------
+        add(dict, int) -> str:
+            Adds a download to the end of the queue and returns its id
+
+        get(str) -> dict | None:
+            Returns the item of an id
+
+        items() -> list:
+            Returns all items, pending ones in the order they will be started
+
+        next() -> dict | None:
+            Returns the queued item that should be started next
+
+        set_state(str, str, **fields) -> None:
+            Updates the state (and optionally other fields) of an item
+
+        set_priority(str, int) -> None:
+            Changes the priority of an item, higher priorities start first
+
+        move(str, int) -> None:
+            Moves a pending item up (-1) or down (+1) in the queue
+
+        pause(str) -> None / resume(str) -> None:
+            Hold a queued item back / release it again
+
+        interrupted() -> list:
+            Returns the items interrupted by the end of the previous session
+
+        failed() -> list / waiting() -> list:
+            Return the failed items / the items waiting for a retry
+
+        remove(str) -> dict | None:
+            Removes an item from the queue
+
+        save() -> None / load() -> None:
+            Persist / restore the queue
+    """
+    default_path = 'Media Files Manager/Queue/queue.json'
+
+    def __init__(self, path: str = default_path, max_concurrent: int = 2, rate_limit: int = 0,
+                 postprocess_workers: int = 2, verify_downloads: bool = False):
+        self.path = path
+        self.max_concurrent = max_concurrent
+        self.rate_limit = rate_limit
+        self.postprocess_workers = postprocess_workers
+        self.verify_downloads = verify_downloads
+        self._items = {}
+        self._order = 0
+        self.load()
+
+    def add(self, item: dict, priority: int = 0) -> str:
+        '''
+        Adds a download to the end of the queue and returns its id
+
+        Parameters
+        ----------
+            item : dict
+                download parameters (`type`, `url`, `opts`, `save_path`, `title`)
+            priority : int
+                items with higher priority are started first
+        '''
+        item = dict(item)
+        item['id'] = uuid.uuid4().hex[:12]
+        item['priority'] = priority
+        item['order'] = self._next_order()
+        item['state'] = QUEUED
+        item['added'] = time.time()
+        self._items[item['id']] = item
+        return item['id']
+
+    def get(self, item_id: str) -> dict | None:
+        '''Returns the item of an id'''
+        return self._items.get(item_id)
+
+    def _next_order(self) -> int:
+        self._order += 1
+        return self._order
+
+    @staticmethod
+    def _sort_key(item: dict) -> tuple:
+        return (-item['priority'], item['order'])
+
+    def pending(self) -> list:
+        '''Returns queued and paused items in the order they will be started'''
+        return sorted((i for i in self._items.values() if i['state'] in (QUEUED, PAUSED, INTERRUPTED, WAITING)),
+                      key=self._sort_key)
+
+    def items(self) -> list:
+        '''Returns running items first, then pending ones in start order, then failed ones'''
+        rank = {RUNNING: 0, QUEUED: 1, PAUSED: 1, INTERRUPTED: 1, WAITING: 1, FAILED: 2}
+        return sorted(self._items.values(), key=lambda i: (rank.get(i['state'], 3),) + self._sort_key(i))
+
+    def running(self) -> list:
+        '''Returns the items currently being downloaded'''
+        return [i for i in self._items.values() if i['state'] == RUNNING]
+
+    def interrupted(self) -> list:
+        '''Returns the items interrupted by the end of the previous session, in start order'''
+        return [i for i in self.pending() if i['state'] == INTERRUPTED]
+
+    def failed(self) -> list:
+        '''Returns the items that failed and are not retried automatically'''
+        return [i for i in self._items.values() if i['state'] == FAILED]
+
+    def waiting(self) -> list:
+        '''Returns the items waiting for an automatic retry'''
+        return [i for i in self._items.values() if i['state'] == WAITING]
+
+    def next(self) -> dict | None:
+        '''Returns the queued item that should be started next'''
+        return next((i for i in self.pending() if i['state'] == QUEUED), None)
+
+    def set_state(self, item_id: str, state: str, **fields) -> None:
+        '''Updates the state (and optionally other fields) of an item'''
+        item = self._items.get(item_id)
+        if item is not None:
+            item['state'] = state
+            item.update(fields)
+
+    def set_priority(self, item_id: str, priority: int) -> None:
+        '''Changes the priority of an item, higher priorities start first'''
+        item = self._items.get(item_id)
+        if item is not None:
+            item['priority'] = priority
+
+    def move(self, item_id: str, step: int) -> None:
+        '''
+        Moves a pending item up (`step` = -1) or down (`step` = 1) in the queue.
+        Moving past an item of a different priority adopts that item's priority.
+        '''
+        pending = self.pending()
+        index = next((n for n, i in enumerate(pending) if i['id'] == item_id), None)
+        if index is None or not 0 <= index + step < len(pending):
+            return
+        item, other = pending[index], pending[index + step]
+        if item['priority'] == other['priority']:
+            item['order'], other['order'] = other['order'], item['order']
+        else:
+            item['priority'] = other['priority']
+            # Place it right before/after `other` by renumbering the whole pending list
+            pending.remove(item)
+            pending.insert(pending.index(other) + (1 if step > 0 else 0), item)
+            for i in pending:
+                i['order'] = self._next_order()
+
+    def pause(self, item_id: str) -> None:
+        '''Holds a queued item back so it is not started'''
+        item = self._items.get(item_id)
+        if item is not None and item['state'] in (QUEUED, FAILED, INTERRUPTED, WAITING):
+            item['state'] = PAUSED
+
+    def resume(self, item_id: str) -> None:
+        '''Releases a paused, failed, interrupted or waiting item so it can be started again'''
+        item = self._items.get(item_id)
+        if item is not None and item['state'] in (PAUSED, FAILED, INTERRUPTED, WAITING):
+            item['state'] = QUEUED
+
+    def remove(self, item_id: str) -> dict | None:
+        '''Removes an item from the queue'''
+        return self._items.pop(item_id, None)
+
+    def save(self) -> None:
+        '''Writes the queue to `path` (atomically, so a crash never leaves a half written file)'''
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp = self.path + '.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump({'max_concurrent': self.max_concurrent, 'rate_limit': self.rate_limit,
+                       'postprocess_workers': self.postprocess_workers,
+                       'verify_downloads': self.verify_downloads,
+                       'items': list(self._items.values())}, f, indent=1)
+        os.replace(temp, self.path)
+
+    def load(self) -> None:
+        '''Restores the queue from `path`, downloads that were running are marked as interrupted'''
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.max_concurrent = saved.get('max_concurrent', self.max_concurrent)
+        self.rate_limit = saved.get('rate_limit', self.rate_limit)
+        self.postprocess_workers = saved.get('postprocess_workers', self.postprocess_workers)
+        self.verify_downloads = saved.get('verify_downloads', self.verify_downloads)
+        for item in saved.get('items', []):
+            if item['state'] == RUNNING:
+                item['state'] = INTERRUPTED
+            self._items[item['id']] = item
+            self._order = max(self._order, item['order'])
@@ -0,0 +1,182 @@
+'''
+Functions
+---------
+
+    - estimate_size:
+        Estimated size in bytes of a format dict.
+
+    - codec_family:
+        Short codec name (`av1`, `vp9`, `h264`, `hevc`, `aac`, `opus`, ...) of a yt-dlp codec string.
+
+    - select_format:
+        Picks the best (or the smallest) format (pair) of a video that fits a set of constraints.
+
+    - playlist_format:
+        yt-dlp `format` / `format_sort` applying the same constraints to every playlist entry.
+'''
+
+# Codec preference orders, first is preferred
+SMALL_CODECS = ('av1', 'vp9', 'hevc', 'h264')        # best compression first
+COMPATIBLE_CODECS = ('h264', 'hevc', 'vp9', 'av1')   # widest device support first
+
+# yt-dlp's own video codec order (its `vcodec` sort field), as codec families
+YTDLP_CODEC_ORDER = ('av1', 'vp9', 'hevc', 'h264')
+_ytdlp_names = {'av1': 'av01', 'vp9': 'vp9', 'hevc': 'h265', 'h264': 'h264'}
+
+# Codecs that can be stream copied into an mp4 container
+MP4_VIDEO_CODECS = ('h264', 'hevc', 'av1')
+MP4_AUDIO_CODECS = ('aac',)
+
+_families = (('avc', 'h264'), ('h264', 'h264'), ('hev', 'hevc'), ('hvc', 'hevc'), ('h265', 'hevc'),
+             ('av01', 'av1'), ('av1', 'av1'), ('vp09', 'vp9'), ('vp9', 'vp9'), ('vp8', 'vp8'),
+             ('mp4a', 'aac'), ('aac', 'aac'), ('opus', 'opus'), ('vorbis', 'vorbis'), ('mp3', 'mp3'))
+
+
+def codec_family(codec: str | None) -> str | None:
+    '''Short codec name of a yt-dlp `vcodec`/`acodec` string, None for `none` or unknown codecs'''
+    codec = (codec or '').lower()
+    if codec in ('', 'none'):
+        return None
+    return next((family for prefix, family in _families if codec.startswith(prefix)), codec.split('.')[0])
+
+
+def estimate_size(fmt: dict, duration: float | None) -> int | None:
+    '''
+    Estimated size in bytes of a format: `filesize`, else `filesize_approx`,
+    else its total bitrate (`tbr`, kbit/s) times the duration. None if nothing is known.
+    '''
+    size = fmt.get('filesize') or fmt.get('filesize_approx')
+    if size:
+        return int(size)
+    if fmt.get('tbr') and duration:
+        return int(fmt['tbr'] * 1000 / 8 * duration)
+    return None
+
+
+def _has_video(fmt: dict) -> bool:
+    return codec_family(fmt.get('vcodec')) is not None or (fmt.get('height') and fmt.get('vcodec') is None)
+
+
+def _has_audio(fmt: dict) -> bool:
+    return codec_family(fmt.get('acodec')) is not None
+
+
+def select_format(formats: list, duration: float | None = None, max_size: int | None = None,
+                  max_height: int | None = None, prefer_codecs: tuple = (), mp4: bool = False,
+                  audio_only: bool = False, min_abr: float = 96, smallest: bool = False) -> dict | None:
+    '''
+    Picks the best format (or video + audio pair) that fits the constraints. The highest resolution that
+    fits wins, ties go to the preferred codec and then to the smallest estimated size, so `max_size` and
+    `max_height` are limits rather than targets: a smaller file is only picked at the same resolution.
+    With `smallest`, the smallest estimated size wins instead, ties go to the preferred codec and then
+    to the higher resolution.
+
+    Parameters
+    ----------
+        formats : list
+            format dicts of a yt-dlp info dict (as kept by `trim_info`)
+        duration : float | None
+            duration of the media in seconds, used to estimate sizes from bitrates
+        max_size : int | None
+            maximum estimated total size in bytes, formats of unknown size are skipped when given
+        max_height : int | None
+            maximum video height
+        prefer_codecs : tuple
+            video codec families in order of preference, e.g. `SMALL_CODECS`
+        mp4 : bool
+            only streams that can be merged into mp4 without re-encoding
+        audio_only : bool
+            pick an audio format only
+        min_abr : float
+            audio below this bitrate (kbit/s) is only used when there is nothing better
+        smallest : bool
+            pick the smallest matching format (pair) instead of the highest resolution
+
+    **Return** dict with `format` (yt-dlp format string), `video`, `audio` (format dicts or None),
+    `size` (estimated bytes or None) and `height`. None if no format matches.
+    '''
+    def rank(fmt):
+        family = codec_family(fmt.get('vcodec'))
+        return prefer_codecs.index(family) if family in prefer_codecs else len(prefer_codecs)
+
+    audios = [f for f in formats if _has_audio(f) and not _has_video(f)
+              and (not mp4 or codec_family(f.get('acodec')) in MP4_AUDIO_CODECS)]
+    good_audios = [f for f in audios if (f.get('abr') or f.get('tbr') or 0) >= min_abr] or audios
+
+    if audio_only:
+        candidates = [(None, a) for a in good_audios]
+    else:
+        videos = [f for f in formats if _has_video(f)
+                  and (not max_height or (f.get('height') or 0) <= max_height)
+                  and (not mp4 or codec_family(f.get('vcodec')) in MP4_VIDEO_CODECS)]
+        candidates = []
+        for v in videos:
+            if _has_audio(v):
+                if not mp4 or codec_family(v.get('acodec')) in MP4_AUDIO_CODECS:
+                    candidates.append((v, None))  # Progressive format, audio included
+            else:
+                candidates.extend((v, a) for a in good_audios)
+
+    best, best_key = None, None
+    for video, audio in candidates:
+        sizes = [estimate_size(f, duration) for f in (video, audio) if f is not None]
+        size = None if None in sizes else sum(sizes)
+        if max_size and (size is None or size > max_size):
+            continue
+        height = (video or {}).get('height') or 0
+        size_key = size if size is not None else float('inf')
+        codec_key = rank(video) if video else 0
+        key = (size_key, codec_key, -height) if smallest else (-height, codec_key, size_key)
+        if best_key is None or key < best_key:
+            best_key = key
+            best = {'format': '+'.join(f['format_id'] for f in (video, audio) if f is not None),
+                    'video': video, 'audio': audio, 'size': size,
+                    'height': (video or {}).get('height')}
+    return best
+
+
+def _codec_sort(prefer_codecs: tuple) -> str:
+    '''
+    yt-dlp `vcodec` sort field closest to a codec preference order. yt-dlp takes a single codec: `vcodec:X`
+    prefers X, then the codecs after it in `YTDLP_CODEC_ORDER`, `+vcodec:X` the codecs before it, so
+    every order that follows yt-dlp's one from its first codec (either way) is kept as a whole.
+    '''
+    first = prefer_codecs[0]
+    field = f'vcodec:{_ytdlp_names.get(first, first)}'
+    if first not in YTDLP_CODEC_ORDER:
+        return field
+    i = YTDLP_CODEC_ORDER.index(first)
+    forward = YTDLP_CODEC_ORDER[i:] + YTDLP_CODEC_ORDER[:i][::-1]
+    backward = YTDLP_CODEC_ORDER[:i + 1][::-1] + YTDLP_CODEC_ORDER[i + 1:]
+
+    def matched(order):
+        wanted = [c for c in prefer_codecs if c in order]
+        return next((n for n, (a, b) in enumerate(zip(wanted, order)) if a != b), len(wanted))
+
+    return '+' + field if matched(backward) > matched(forward) else field
+
+
+def playlist_format(max_size: int | None = None, max_height: int | None = None,
+                    prefer_codecs: tuple = (), smallest: bool = False) -> tuple:
+    '''
+    yt-dlp `format` and `format_sort` applying the constraints to every playlist entry (their formats
+    are only known at download time). `max_size` limits each stream, unknown sizes are allowed.
+    With `smallest`, the smallest formats are preferred over the highest resolution, as in `select_format`.
+
+    **Return** (format, format_sort)
+    '''
+    video, audio, single = 'bv*', 'ba', 'b'
+    if max_height:
+        video += f'[height<={max_height}]'
+        single += f'[height<={max_height}]'
+    if max_size:
+        limit = f'[filesize_approx<?{max_size}]'
+        video, audio, single = video + limit, audio + limit, single + limit
+    format_sort = ['+size'] if smallest else []
+    if max_height:
+        format_sort.append(f'res:{max_height}')
+    if prefer_codecs:
+        format_sort.append(_codec_sort(prefer_codecs))
+    if max_size and not smallest:
+        format_sort.append('+size')
+    return f'{video}+{audio}/{single}', format_sort
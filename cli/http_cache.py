@@ -0,0 +1,221 @@
+'''
+Classes
+-------
+
+    - HTTPCache:
+        Local HTTP cache keyed by URL, with freshness lifetimes and ETag/Last-Modified revalidation.
+
+Functions
+---------
+
+    - session:
+        Shared `requests.Session` whose pooled connections are reused by every request of the application.
+'''
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+import requests
+import threading
+import tempfile
+import hashlib
+import json
+import time
+import os
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def session() -> requests.Session:
+    '''Shared session (created on first use), keeps up to 8 open connections per host'''
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+        return _session
+
+
+class HTTPCache:
+    """
+    HTTPCache
+    =========
+
+    Stores response bodies in `directory`, one `<key>` file and one `<key>.json` metadata file per URL
+    (the key is the SHA-1 of the URL). A cached response is used without any request while it is fresh:
+    for `Cache-Control: max-age` / `Expires` when the server sends them, else for 10% of the time since
+    `Last-Modified` (at most a day), else for `default_ttl` seconds. A stale response is revalidated with
+    `If-None-Match` / `If-Modified-Since`, a `304 Not Modified` only renews it.
+
+    Bodies are streamed to disk and the request is aborted as soon as they exceed `max_bytes`.
+    The folder is kept under `max_total` bytes by deleting the least recently used entries.
+
+    Attributes
+    ----------
+        directory (str): Folder of the cached files
+        max_bytes (int): Largest accepted response body
+        max_total (int): Size limit of the whole cache folder, 0 for unlimited
+        default_ttl (float): Freshness lifetime in seconds when the server gives no hint
+        timeout (tuple): (connect, read) timeouts of the requests
+
+    Methods
+    -------
+        fetch(str, str) -> dict:
+            Returns `path`, `content_type` and `source` (`cache`, `revalidated` or `network`) of a URL
+
+        prune() -> None:
+            Deletes the least recently used entries until the folder fits in `max_total`
+    """
+    default_directory = 'Media Files Manager/Cache/Thumbnails'
+    block_size = 64 * 1024
+
+    def __init__(self, directory: str = default_directory, max_bytes: int = 20 * 1024 * 1024,
+                 max_total: int = 200 * 1024 * 1024, default_ttl: float = 3600, timeout: tuple = (5, 30)):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_total = max_total
+        self.default_ttl = default_ttl
+        self.timeout = timeout
+
+    def _paths(self, url: str) -> tuple:
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key), os.path.join(self.directory, key + '.json')
+
+    def _load(self, url: str) -> dict | None:
+        body, meta_path = self._paths(url)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get('url') == url and os.path.isfile(body) else None
+
+    def _save(self, url: str, meta: dict) -> None:
+        _, meta_path = self._paths(url)
+        temp = meta_path + '.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(temp, meta_path)
+
+    def fetch(self, url: str, accept: str | None = None) -> dict:
+        '''
+        Returns the cached body of a URL, downloading or revalidating it first when needed.
+
+        Parameters
+        ----------
+            url : str
+                URL of the resource
+            accept : str | None
+                required MIME major type (e.g. `image`), other responses raise `ValueError`
+
+        **Return** dict with `path` (cached body, do not modify), `content_type` and `source`.
+        Raises `requests.RequestException`, `OSError` or `ValueError` (bad type, too large).
+        '''
+        body, _ = self._paths(url)
+        meta = self._load(url)
+        if meta and time.time() < meta.get('expires', 0):
+            self._touch(body)
+            return {'path': body, 'content_type': meta['content_type'], 'source': 'cache'}
+
+        headers = {}
+        if meta and meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta and meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+        os.makedirs(self.directory, exist_ok=True)
+        with session().get(url, headers=headers, stream=True, timeout=self.timeout) as r:
+            if r.status_code == 304 and meta:
+                meta['expires'] = self._expires(r.headers, meta.get('last_modified'))
+                self._save(url, meta)
+                self._touch(body)
+                return {'path': body, 'content_type': meta['content_type'], 'source': 'revalidated'}
+            r.raise_for_status()
+
+            content_type = r.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            if accept and content_type.split('/')[0] != accept:
+                raise ValueError(f'Expected {accept} content, got "{content_type or "unknown"}"')
+            length = r.headers.get('Content-Length')
+            if length and length.isdigit() and int(length) > self.max_bytes:
+                raise ValueError(f'Response of {length} bytes exceeds the {self.max_bytes} bytes limit')
+
+            fd, temp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                received = 0
+                with os.fdopen(fd, 'wb') as f:
+                    for block in r.iter_content(self.block_size):
+                        received += len(block)
+                        if received > self.max_bytes:
+                            raise ValueError(f'Response exceeds the {self.max_bytes} bytes limit')
+                        f.write(block)
+                os.replace(temp, body)
+            except BaseException:
+                try:
+                    os.remove(temp)
+                except OSError:
+                    pass
+                raise
+
+            last_modified = r.headers.get('Last-Modified')
+            self._save(url, {'url': url, 'content_type': content_type, 'etag': r.headers.get('ETag'),
+                             'last_modified': last_modified,
+                             'expires': self._expires(r.headers, last_modified)})
+        self.prune(keep=body)
+        return {'path': body, 'content_type': content_type, 'source': 'network'}
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        '''Marks an entry as used, the modification time orders the entries for `prune`'''
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def prune(self, keep: str | None = None) -> None:
+        '''Deletes the least recently used entries until the folder fits in `max_total` (`keep` is never deleted)'''
+        if not self.max_total:
+            return
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and '.' not in entry.name:
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_total:
+                break
+            if path == keep:
+                continue
+            for name in (path, path + '.json'):
+                try:
+                    os.remove(name)
+                except OSError:
+                    pass
+            total -= size
+
+    def _expires(self, headers, last_modified: str | None) -> float:
+        '''Time until which a response stays fresh, from its caching headers'''
+        now = time.time()
+        directives = [d.strip().lower() for d in headers.get('Cache-Control', '').split(',')]
+        if 'no-cache' in directives or 'no-store' in directives:
+            return 0
+        for directive in directives:
+            if directive.startswith('max-age='):
+                try:
+                    return now + int(directive[8:])
+                except ValueError:
+                    break
+        if headers.get('Expires'):
+            try:
+                return parsedate_to_datetime(headers['Expires']).timestamp()
+            except (TypeError, ValueError):
+                return 0  # Invalid dates (often "0") mean already expired
+        if last_modified:
+            try:
+                age = now - parsedate_to_datetime(last_modified).timestamp()
+                return now + min(max(age, 0) * 0.1, 24 * 3600)
+            except (TypeError, ValueError):
+                pass
+        return now + self.default_ttl
@@ -0,0 +1,265 @@
+'''
+Classes
+-------
+
+    - HTTPDownloader:
+        Downloads a direct file URL in parallel Range chunks over pooled connections, with resume.
+
+    - DownloadAborted:
+        Raised inside `HTTPDownloader.download` when its `is_cancelled` callback returns True.
+'''
+from concurrent.futures import ThreadPoolExecutor
+import requests
+import threading
+import json
+import time
+import os
+
+
+class DownloadAborted(Exception):
+    '''The download was cancelled, the partial file and its resume data are kept'''
+
+
+class HTTPDownloader:
+    """
+    HTTPDownloader
+    ==============
+
+    Downloads a direct file URL. When the server supports Range requests and reports the size, the file
+    is split in `chunk_size` chunks fetched by `connections` threads in parallel. Each thread keeps its
+    own `requests.Session`, so its connection is reused for every chunk it downloads. Chunks are written
+    at their offset in a preallocated `<path>.part` file.
+
+    Finished chunks are recorded in `<path>.part.json`, together with the size and the `ETag` /
+    `Last-Modified` validators. A later download of the same URL to the same path continues from there
+    if the file did not change on the server. Servers without Range support get a single streamed request.
+    An existing file is never overwritten: the download is saved as `<name> (1).<ext>` (or the next free number).
+
+    `progress` is called with yt-dlp style progress dicts (`status`, `downloaded_bytes`, `total_bytes`,
+    `speed`, `eta`, `filename`, `tmpfilename`, `info_dict`), so the same hooks handle both downloaders.
+
+    Attributes
+    ----------
+        url (str): URL of the file
+        path (str): Final path of the downloaded file
+        connections (int): Number of parallel connections
+        chunk_size (int): Size of the Range requests in bytes
+
+    Methods
+    -------
+        probe() -> tuple:
+            Returns (size or None, Range support, validators) of the URL
+
+        download() -> dict:
+            Downloads the file, returns a dict with `State`, `Message`/`Error`, `Path` (where it was saved) and `Size`
+    """
+    block_size = 64 * 1024
+
+    def __init__(self, url: str, path: str, connections: int = 4, chunk_size: int = 4 * 1024 * 1024,
+                 progress=None, is_cancelled=None, limit_bandwidth=None, timeout: float = 30,
+                 headers: dict | None = None):
+        self.url = url
+        self.path = path
+        self.connections = max(1, connections)
+        self.chunk_size = max(self.block_size, chunk_size)
+        self.progress = progress
+        self.is_cancelled = is_cancelled or (lambda: False)
+        self.limit_bandwidth = limit_bandwidth
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.part_path = path + '.part'
+        self.state_path = self.part_path + '.json'
+        self._local = threading.local()
+        self._failed = threading.Event()  # Set when a chunk fails, so the other chunks stop too
+        self._sessions = []
+        self._lock = threading.Lock()
+        self._downloaded = 0
+        self._total = None
+        self._started = 0.0
+        self._resumed = 0
+        self._last_report = 0.0
+
+    def _session(self) -> requests.Session:
+        '''Session of the calling thread, created on first use and reused for all its chunks'''
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update(self.headers)
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def probe(self) -> tuple:
+        '''Returns (size or None, whether Range requests are supported, {'etag', 'last_modified'})'''
+        session = self._session()
+        r = session.get(self.url, headers={'Range': 'bytes=0-0'}, stream=True, timeout=self.timeout)
+        try:
+            r.raise_for_status()
+            validators = {'etag': r.headers.get('ETag'), 'last_modified': r.headers.get('Last-Modified')}
+            if r.status_code == 206 and '/' in r.headers.get('Content-Range', ''):
+                total = r.headers['Content-Range'].rsplit('/', 1)[1]
+                return (int(total) if total.isdigit() else None), True, validators
+            length = r.headers.get('Content-Length')
+            return (int(length) if length and length.isdigit() else None), False, validators
+        finally:
+            r.close()
+
+    def download(self) -> dict:
+        '''Downloads the file (resuming a previous attempt when possible) and moves it to `path`'''
+        try:
+            size, ranges, validators = self.probe()
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._total = size
+            self._started = time.monotonic()
+            if size and ranges:
+                self._download_chunks(size, validators)
+            else:
+                self._download_stream()
+            path = self.free_path(self.path)
+            os.replace(self.part_path, path)
+            self._remove(self.state_path)
+            self._report('finished', force=True)
+            return {'State': True, 'Message': 'Download completed successfully',
+                    'Path': path, 'Size': os.path.getsize(path), 'Expected': size}
+        except DownloadAborted:
+            return {'State': False, 'Cancelled': True, 'Error': 'Download cancelled', 'Path': self.path}
+        except (requests.RequestException, OSError, ValueError) as e:
+            return {'State': False, 'Error': f'Download Error: {e}', 'Path': self.path}
+        finally:
+            for session in self._sessions:
+                session.close()
+
+    def _download_chunks(self, size: int, validators: dict) -> None:
+        chunks = [(start, min(start + self.chunk_size, size) - 1) for start in range(0, size, self.chunk_size)]
+        state = self._load_state(size, validators)
+        done = {tuple(c) for c in state['done']} if state else set()
+        if not state or not os.path.exists(self.part_path):
+            done = set()
+            # Preallocate so every chunk can be written at its offset
+            with open(self.part_path, 'wb') as f:
+                f.truncate(size)
+        self._resumed = self._downloaded = sum(end - start + 1 for start, end in done)
+        state = {'url': self.url, 'size': size, **validators, 'done': [list(c) for c in done]}
+        self._save_state(state)
+
+        pending = [c for c in chunks if c not in done]
+        with ThreadPoolExecutor(min(self.connections, len(pending) or 1)) as pool:
+            futures = [pool.submit(self._download_chunk, start, end, state) for start, end in pending]
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        # Report the failure that stopped the download, not the chunks it aborted
+        for error in sorted(errors, key=lambda e: isinstance(e, DownloadAborted)):
+            raise error
+
+    def _stopped(self) -> bool:
+        return self._failed.is_set() or self.is_cancelled()
+
+    def _download_chunk(self, start: int, end: int, state: dict) -> None:
+        if self._stopped():
+            raise DownloadAborted()
+        received = 0
+        try:
+            r = self._session().get(self.url, headers={'Range': f'bytes={start}-{end}'}, stream=True,
+                                    timeout=self.timeout)
+            try:
+                r.raise_for_status()
+                if r.status_code != 206:
+                    raise ValueError('Server ignored the Range request')
+                with open(self.part_path, 'r+b') as f:
+                    f.seek(start)
+                    for block in r.iter_content(self.block_size):
+                        if self._stopped():
+                            raise DownloadAborted()
+                        f.write(block)
+                        received += len(block)
+                        self._add(len(block))
+            finally:
+                r.close()
+            if received != end - start + 1:
+                raise ValueError(f'Chunk {start}-{end} ended early ({received} bytes)')
+        except BaseException as e:
+            if not isinstance(e, DownloadAborted):
+                self._failed.set()
+            # Bytes of an unfinished chunk are downloaded again on resume
+            self._add(-received, report=False)
+            raise
+        with self._lock:
+            state['done'].append([start, end])
+            self._save_state(state)
+
+    def _download_stream(self) -> None:
+        '''Single connection fallback for servers without Range support (cannot be resumed)'''
+        self._remove(self.state_path)
+        r = self._session().get(self.url, stream=True, timeout=self.timeout)
+        try:
+            r.raise_for_status()
+            with open(self.part_path, 'wb') as f:
+                for block in r.iter_content(self.block_size):
+                    if self.is_cancelled():
+                        raise DownloadAborted()
+                    f.write(block)
+                    self._add(len(block))
+        finally:
+            r.close()
+
+    def _add(self, nbytes: int, report: bool = True) -> None:
+        with self._lock:
+            self._downloaded += nbytes
+        if report and nbytes > 0:
+            if self.limit_bandwidth:
+                self.limit_bandwidth(nbytes)
+            self._report('downloading')
+
+    def _report(self, status: str, force: bool = False) -> None:
+        if not self.progress:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_report < 0.1:
+            return
+        self._last_report = now
+        elapsed = max(now - self._started, 1e-6)
+        speed = (self._downloaded - self._resumed) / elapsed
+        total = self._total
+        name = os.path.basename(self.path)
+        self.progress({
+            'status': status, 'downloaded_bytes': self._downloaded, 'total_bytes': total,
+            'speed': speed, 'eta': (total - self._downloaded) / speed if total and speed else None,
+            'filename': self.path, 'tmpfilename': self.part_path,
+            'info_dict': {'id': name, 'title': os.path.splitext(name)[0]},
+        })
+
+    def _load_state(self, size: int, validators: dict) -> dict | None:
+        '''Resume data of a previous attempt, None if there is none or the file changed on the server'''
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get('url') != self.url or state.get('size') != size:
+            return None
+        for key in ('etag', 'last_modified'):
+            if state.get(key) and validators.get(key) and state[key] != validators[key]:
+                return None
+        return state
+
+    def _save_state(self, state: dict) -> None:
+        temp = self.state_path + '.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp, self.state_path)
+
+    @staticmethod
+    def free_path(path: str) -> str:
+        '''`path`, or `<name> (n).<ext>` with the first free number when a file already exists there'''
+        base, ext = os.path.splitext(path)
+        n = 0
+        while os.path.exists(path):
+            n += 1
+            path = f'{base} ({n}){ext}'
+        return path
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
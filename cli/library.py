@@ -0,0 +1,163 @@
+'''
+Classes
+-------
+
+    - MediaLibrary:
+        Local SQLite index of the downloaded files and their metadata, searchable with FTS5.
+
+Functions
+---------
+
+    - media_fields:
+        Metadata of a yt-dlp info dict kept in the library.
+'''
+import sqlite3
+import time
+import os
+import re
+
+# Metadata kept per file: library column -> yt-dlp info fields, first one present wins
+FIELDS = {
+    'url': ('webpage_url', 'original_url', 'url'),
+    'title': ('title',),
+    'description': ('description',),
+    'channel': ('channel', 'uploader', 'creator'),
+    'upload_date': ('upload_date',),
+    'duration': ('duration',),
+    'domain': ('webpage_url_domain',),
+    'extractor': ('extractor_key', 'extractor'),
+}
+COLUMNS = ('path', *FIELDS, 'size', 'added')
+
+
+def media_fields(info: dict) -> dict:
+    '''Metadata of a yt-dlp info dict kept in the library (see `FIELDS`), missing fields are None'''
+    return {column: next((info[k] for k in keys if info.get(k) not in (None, '')), None)
+            for column, keys in FIELDS.items()}
+
+
+class MediaLibrary:
+    """
+    MediaLibrary
+    ============
+
+    Every downloaded file is a row of the `media` table (its path, URL, title, description, channel,
+    upload date, duration, site, size and when it was added). An FTS5 index over title, description and
+    channel is kept in sync by triggers, so searching thousands of files takes milliseconds.
+    When SQLite was built without FTS5, searches fall back to `LIKE` over the same columns.
+
+    Attributes
+    ----------
+        path (str): Path of the SQLite database
+        fts (bool): Whether the FTS5 index is available
+
+    Methods
+    -------
+        add(str, dict) -> None:
+            Adds (or updates) a downloaded file with its metadata
+
+        remove(list) -> None:
+            Removes files from the library
+
+        search(str, int) -> list:
+            Files matching every word of a query, best matches first (latest files for an empty query)
+
+        missing() -> list:
+            Paths of the files that are no longer on disk
+
+        count() -> int:
+            Number of files in the library
+    """
+    default_path = 'Media Files Manager/Library/library.db'
+
+    def __init__(self, path: str = default_path):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('''CREATE TABLE IF NOT EXISTS media (
+            id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, url TEXT, title TEXT, description TEXT,
+            channel TEXT, upload_date TEXT, duration REAL, domain TEXT, extractor TEXT, size INTEGER, added REAL)''')
+        self._db.execute('CREATE INDEX IF NOT EXISTS media_added ON media(added)')
+        try:
+            self._db.executescript('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS media_fts USING fts5(
+                    title, description, channel, content='media', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2');
+                CREATE TRIGGER IF NOT EXISTS media_ai AFTER INSERT ON media BEGIN
+                    INSERT INTO media_fts(rowid, title, description, channel)
+                    VALUES (new.id, new.title, new.description, new.channel);
+                END;
+                CREATE TRIGGER IF NOT EXISTS media_ad AFTER DELETE ON media BEGIN
+                    INSERT INTO media_fts(media_fts, rowid, title, description, channel)
+                    VALUES ('delete', old.id, old.title, old.description, old.channel);
+                END;
+                CREATE TRIGGER IF NOT EXISTS media_au AFTER UPDATE ON media BEGIN
+                    INSERT INTO media_fts(media_fts, rowid, title, description, channel)
+                    VALUES ('delete', old.id, old.title, old.description, old.channel);
+                    INSERT INTO media_fts(rowid, title, description, channel)
+                    VALUES (new.id, new.title, new.description, new.channel);
+                END;''')
+            self.fts = True
+        except sqlite3.OperationalError:
+            self.fts = False
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def add(self, path: str, metadata: dict) -> None:
+        '''
+        Adds a downloaded file to the library, a file already in it gets the new metadata
+
+        Parameters
+        ----------
+            path : str
+                location of the file, stored as an absolute path
+            metadata : dict
+                library fields (see `media_fields`)
+        '''
+        path = os.path.abspath(path)
+        row = {column: metadata.get(column) for column in FIELDS}
+        row.update(path=path, size=os.path.getsize(path) if os.path.isfile(path) else None, added=time.time())
+        updates = ', '.join(f'{c} = excluded.{c}' for c in COLUMNS if c != 'path')
+        with self._db:
+            self._db.execute(f"INSERT INTO media ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))}) "
+                             f"ON CONFLICT(path) DO UPDATE SET {updates}", [row[c] for c in COLUMNS])
+
+    def remove(self, paths: list) -> None:
+        '''Removes files from the library (the files themselves are not touched)'''
+        with self._db:
+            self._db.executemany('DELETE FROM media WHERE path = ?', [(os.path.abspath(p),) for p in paths])
+
+    def search(self, query: str = '', limit: int = 200) -> list:
+        '''
+        Files whose title, description or channel contain every word of `query` (words are matched as
+        prefixes, so `tut pyth` finds "Python Tutorial"), titles and channels weigh more than descriptions.
+        An empty query returns the latest files.
+
+        **Return** list of dicts with the `media` columns
+        '''
+        words = re.findall(r'\w+', query)
+        if not words:
+            rows = self._db.execute('SELECT * FROM media ORDER BY added DESC LIMIT ?', (limit,))
+        elif self.fts:
+            match = ' '.join(f'"{w}"*' for w in words)
+            rows = self._db.execute('SELECT media.* FROM media_fts JOIN media ON media.id = media_fts.rowid '
+                                    'WHERE media_fts MATCH ? ORDER BY bm25(media_fts, 10.0, 1.0, 5.0) LIMIT ?',
+                                    (match, limit))
+        else:
+            condition = ' AND '.join(["(title LIKE ? OR description LIKE ? OR channel LIKE ?)"] * len(words))
+            args = [f'%{w}%' for w in words for _ in range(3)]
+            rows = self._db.execute(f'SELECT * FROM media WHERE {condition} ORDER BY added DESC LIMIT ?',
+                                    (*args, limit))
+        return [dict(row) for row in rows]
+
+    def missing(self) -> list:
+        '''Paths of the files in the library that were moved or deleted'''
+        return [row[0] for row in self._db.execute('SELECT path FROM media') if not os.path.exists(row[0])]
+
+    def count(self) -> int:
+        return self._db.execute('SELECT COUNT(*) FROM media').fetchone()[0]
@@ -41,7 +41,8 @@ def initialize_env() -> None:
             'Media Files Manager/Logs', 'Media Files Manager/Image Convertion',
             'Media Files Manager/Extract GIFs', 'Media Files Manager/Downloads',
             'Media Files Manager/Video Thumbnail', 'Media Files Manager/Audio Thumbnail',
-            'Media Files Manager/Temp', 'Media Files Manager/Extracted Audio']
+            'Media Files Manager/Temp', 'Media Files Manager/Extracted Audio',
+            'Media Files Manager/Cache']
 
     for i in dirs:
         d = Directory(i)
@@ -0,0 +1,219 @@
+'''
+Classes
+-------
+
+    - MetadataCache:
+        Persistent cache of `extract_info` results used by the download page.
+
+Functions
+---------
+
+    - normalize_url:
+        Reduce a media URL to a stable cache key.
+    - trim_info:
+        Keep only the parts of a yt-dlp info dict the application uses.
+'''
+from urllib.parse import urlparse, parse_qsl, urlencode
+from contextlib import contextmanager
+import sqlite3
+import json
+import time
+import os
+import re
+
+# Fields of a yt-dlp info dict / format dict that are worth keeping
+INFO_FIELDS = ('id', 'title', 'description', 'view_count', 'like_count', 'upload_date', 'modified_date',
+               'channel', 'uploader', 'duration', 'thumbnail', 'webpage_url', 'webpage_url_domain',
+               'playlist_count', 'extractor_key', '_type', 'direct', 'ext')
+FORMAT_FIELDS = ('format_id', 'ext', 'height', 'width', 'fps', 'vcodec', 'acodec', 'abr', 'tbr',
+                 'filesize', 'filesize_approx', 'format_note', 'quality', 'protocol')
+
+_youtube_id = re.compile(r'^[\w-]{11}$')
+
+
+def normalize_url(url: str, media_type: str | None = None) -> str:
+    '''
+    Reduce a media URL to a stable key so the same video/playlist always maps to the same entry
+        - YouTube links are reduced to their video or playlist id. A link with both (`watch?v=...&list=...`)
+          is the playlist, as yt-dlp downloads it, unless `media_type` is `video`
+        - Other links lose their fragment, tracking parameters and query ordering
+
+    Parameters
+    ----------
+        url : str
+            URL as typed/pasted by the user
+        media_type : str | None
+            `video` or `playlist` when the link is known to be used as one
+    '''
+    url = url.strip()
+    parsed = urlparse(url if '://' in url else f'https://{url}')
+    host = parsed.netloc.lower().removeprefix('www.').removeprefix('m.').removeprefix('music.')
+    query = dict(parse_qsl(parsed.query))
+
+    if (host == 'youtu.be' or host.endswith('youtube.com')) and query.get('list') and media_type != 'video':
+        return f'youtube:playlist:{query["list"]}'
+    if host == 'youtu.be':
+        video_id = parsed.path.strip('/').split('/')[0]
+        if _youtube_id.match(video_id):
+            return f'youtube:{video_id}'
+    if host.endswith('youtube.com'):
+        if query.get('v') and _youtube_id.match(query['v']):
+            return f'youtube:{query["v"]}'
+        parts = parsed.path.strip('/').split('/')
+        if len(parts) == 2 and parts[0] in ('shorts', 'live', 'embed') and _youtube_id.match(parts[1]):
+            return f'youtube:{parts[1]}'
+        if query.get('list'):
+            return f'youtube:playlist:{query["list"]}'
+
+    query = sorted((k, v) for k, v in query.items() if not k.startswith('utm_') and k not in ('si', 'feature'))
+    return f'{host}{parsed.path.rstrip("/")}' + (f'?{urlencode(query)}' if query else '')
+
+
+def trim_info(info: dict) -> dict:
+    '''
+    Keep only the parts of a yt-dlp info dict the application uses,
+    so it is small enough to keep in memory and store on disk.
+
+    Parameters
+    ----------
+        info : dict
+            Info dict returned by `YoutubeDL.extract_info`
+    '''
+    trimmed = {k: info.get(k) for k in INFO_FIELDS if info.get(k) is not None}
+    trimmed['formats'] = [{k: f.get(k) for k in FORMAT_FIELDS if f.get(k) is not None}
+                          for f in info.get('formats') or []]
+    return trimmed
+
+
+class MetadataCache:
+    """
+    MetadataCache
+    =============
+
+    Persistent cache of `extract_info` results stored in a SQLite database.
+    Each entry holds the trimmed info dict, the display `data` and the `formats` table of a URL.
+
+    `ttl` and `max_entries` are kept in `<path without extension>.json`. Values passed to the
+    constructor win over the saved ones, `configure` changes and saves them.
+
+    Attributes
+    ----------
+        path (str): Path of the SQLite database
+        ttl (int): Seconds after which an entry is considered expired
+        max_entries (int): Maximum number of entries, the least recently used are evicted first
+
+    Methods
+    -------
+        get(str, str) -> dict | None:
+            Returns the cached entry of a URL or None if missing/expired
+
+        put(str, str, dict, dict, list) -> None:
+            Stores (or refreshes) the entry of a URL
+
+        remove(str, str) -> None:
+            Removes the entry of a URL
+
+        clear() -> None:
+            Removes every entry
+
+        configure(int, int) -> None:
+            Changes and saves the expiry time and the maximum number of entries
+    """
+    default_path = 'Media Files Manager/Cache/metadata.sqlite'
+    default_ttl = 7 * 24 * 3600
+    default_max_entries = 500
+
+    def __init__(self, path: str = default_path, ttl: int | None = None, max_entries: int | None = None):
+        self.path = path
+        self.settings_path = os.path.splitext(path)[0] + '.json'
+        settings = self._load_settings()
+        self.ttl = ttl if ttl is not None else settings.get('ttl', self.default_ttl)
+        self.max_entries = max_entries if max_entries is not None else settings.get('max_entries',
+                                                                                    self.default_max_entries)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as db:
+            db.execute('''CREATE TABLE IF NOT EXISTS metadata (
+                            key TEXT PRIMARY KEY,
+                            info TEXT NOT NULL,
+                            data TEXT NOT NULL,
+                            formats TEXT NOT NULL,
+                            fetched_at REAL NOT NULL,
+                            accessed_at REAL NOT NULL)''')
+
+    @contextmanager
+    def _connect(self):
+        # A connection per call keeps the cache usable from worker threads
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    @staticmethod
+    def key(url: str, media_type: str) -> str:
+        '''Cache key of a URL for a media type (`video` or `playlist`)'''
+        return f'{media_type}:{normalize_url(url, media_type)}'
+
+    def get(self, url: str, media_type: str) -> dict | None:
+        '''
+        Returns the cached entry of a URL as a dict with `Info`, `Data`, `Formats` and `Age` (seconds)
+        or None if there is no entry or it is older than `ttl`
+        '''
+        key = self.key(url, media_type)
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute('SELECT info, data, formats, fetched_at FROM metadata WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            if now - row[3] > self.ttl:
+                db.execute('DELETE FROM metadata WHERE key = ?', (key,))
+                return None
+            db.execute('UPDATE metadata SET accessed_at = ? WHERE key = ?', (now, key))
+        return {'Info': json.loads(row[0]), 'Data': json.loads(row[1]),
+                'Formats': [tuple(f) for f in json.loads(row[2])], 'Age': now - row[3]}
+
+    def put(self, url: str, media_type: str, info: dict, data: dict, formats: list) -> None:
+        '''Stores (or refreshes) the entry of a URL and evicts the least recently used entries'''
+        now = time.time()
+        with self._connect() as db:
+            db.execute('INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?)',
+                       (self.key(url, media_type), json.dumps(info), json.dumps(data),
+                        json.dumps(formats), now, now))
+            db.execute('DELETE FROM metadata WHERE fetched_at < ?', (now - self.ttl,))
+            db.execute('''DELETE FROM metadata WHERE key NOT IN
+                            (SELECT key FROM metadata ORDER BY accessed_at DESC LIMIT ?)''', (self.max_entries,))
+
+    def remove(self, url: str, media_type: str) -> None:
+        '''Removes the entry of a URL'''
+        with self._connect() as db:
+            db.execute('DELETE FROM metadata WHERE key = ?', (self.key(url, media_type),))
+
+    def clear(self) -> None:
+        '''Removes every entry'''
+        with self._connect() as db:
+            db.execute('DELETE FROM metadata')
+
+    def configure(self, ttl: int | None = None, max_entries: int | None = None) -> None:
+        '''Changes the expiry time (seconds) and/or the maximum number of entries, saves them and evicts accordingly'''
+        if ttl is not None:
+            self.ttl = max(0, int(ttl))
+        if max_entries is not None:
+            self.max_entries = max(1, int(max_entries))
+        temp = self.settings_path + '.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump({'ttl': self.ttl, 'max_entries': self.max_entries}, f, indent=1)
+        os.replace(temp, self.settings_path)
+        with self._connect() as db:
+            db.execute('DELETE FROM metadata WHERE fetched_at < ?', (time.time() - self.ttl,))
+            db.execute('''DELETE FROM metadata WHERE key NOT IN
+                            (SELECT key FROM metadata ORDER BY accessed_at DESC LIMIT ?)''', (self.max_entries,))
+
+    def _load_settings(self) -> dict:
+        try:
+            with open(self.settings_path, encoding='utf-8') as f:
+                settings = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {k: int(v) for k, v in settings.items() if k in ('ttl', 'max_entries') and isinstance(v, (int, float))}
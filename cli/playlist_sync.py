@@ -0,0 +1,205 @@
+'''
+Classes
+-------
+
+    - PlaylistSync:
+        Saved list of playlists kept in sync with a per-playlist download archive.
+
+Functions
+---------
+
+    - sync_all:
+        Downloads the new entries of every saved playlist (no GUI needed).
+
+Running `python -m cli.playlist_sync` from the application folder syncs every saved playlist,
+so it can be scheduled (Task Scheduler / cron) for nightly refreshes.
+'''
+from cli.metadata_cache import normalize_url
+from cli.logs import write_log, initialize_env
+import yt_dlp
+import hashlib
+import shutil
+import json
+import os
+import time
+
+
+class PlaylistSync:
+    """
+    PlaylistSync
+    ============
+
+    Saved list of playlists. Each playlist keeps its own yt-dlp `download_archive`,
+    so a sync only enumerates and downloads the entries that are not on disk yet.
+
+    Every saved playlist is a dict with `url`, `title`, `opts` (yt-dlp options used for
+    the download, including `download_archive`), `save_path`, `added` and `last_synced`.
+
+    Attributes
+    ----------
+        path (str): Path of the JSON file holding the saved playlists
+        archive_dir (str): Folder of the per-playlist archive files
+
+    Methods
+    -------
+        playlists() -> list:
+            Returns the saved playlists
+
+        get(str) -> dict | None:
+            Returns the saved playlist of a URL
+
+        key(str) -> str:
+            Key of a playlist URL, its playlist id when it has one
+
+        archive_path(str) -> str:
+            Path of the download archive of a playlist URL
+
+        archived_count(str) -> int:
+            Number of entries recorded in the archive of a playlist URL
+
+        add(str, str, dict, str) -> dict:
+            Saves (or updates) a playlist with the yt-dlp options used to sync it
+
+        remove(str) -> None:
+            Removes a saved playlist (its archive is kept)
+
+        mark_synced(str) -> None:
+            Records the time of the last successful sync of a playlist
+    """
+    default_path = 'Media Files Manager/Sync/playlists.json'
+    default_archive_dir = 'Media Files Manager/Sync/Archives'
+
+    def __init__(self, path: str = default_path, archive_dir: str = default_archive_dir):
+        self.path = path
+        self.archive_dir = archive_dir
+        self._playlists = {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        migrated = False
+        for p in saved:
+            self._playlists[self.key(p['url'])] = p
+            migrated |= self._migrate_archive(p)
+        if migrated:
+            # Saved right away, so the archives are only copied once
+            self.save()
+
+    @staticmethod
+    def key(url: str) -> str:
+        '''Key of a playlist URL, `watch?v=...&list=...` links are keyed on their playlist'''
+        return normalize_url(url, 'playlist')
+
+    def _migrate_archive(self, playlist: dict) -> bool:
+        '''
+        Moves a playlist saved with an older archive name (`watch?v=...&list=...` links used to be keyed on
+        the video, so two playlists starting with the same video shared one archive) to its own archive,
+        starting from a copy of the old one. Returns whether the playlist was changed.
+        '''
+        old, new = playlist['opts'].get('download_archive'), self.archive_path(playlist['url'])
+        if not old or old == new:
+            return False
+        if os.path.exists(old) and not os.path.exists(new):
+            os.makedirs(self.archive_dir, exist_ok=True)
+            shutil.copyfile(old, new)
+        playlist['opts']['download_archive'] = new
+        return True
+
+    def playlists(self) -> list:
+        '''Returns the saved playlists, oldest first'''
+        return sorted(self._playlists.values(), key=lambda p: p['added'])
+
+    def get(self, url: str) -> dict | None:
+        '''Returns the saved playlist of a URL'''
+        return self._playlists.get(self.key(url))
+
+    def archive_path(self, url: str) -> str:
+        '''Path of the download archive of a playlist URL'''
+        name = hashlib.sha1(self.key(url).encode()).hexdigest()[:16]
+        return os.path.join(self.archive_dir, f'{name}.txt')
+
+    def archived_count(self, url: str) -> int:
+        '''Number of entries recorded in the archive of a playlist URL'''
+        try:
+            with open(self.archive_path(url), encoding='utf-8') as f:
+                return sum(1 for line in f if line.strip())
+        except OSError:
+            return 0
+
+    def add(self, url: str, title: str, opts: dict, save_path: str) -> dict:
+        '''
+        Saves (or updates) a playlist with the yt-dlp options used to sync it
+
+        Parameters
+        ----------
+            url : str
+                URL of the playlist
+            title : str
+                Title shown in the sync list
+            opts : dict
+                yt-dlp options, `download_archive` is set to the playlist's archive and
+                item limits are dropped so every sync covers the whole playlist
+            save_path : str
+                Folder the playlist is downloaded to
+        '''
+        os.makedirs(self.archive_dir, exist_ok=True)
+        opts = {k: v for k, v in opts.items() if k not in ('playlistend', 'playlist_items')}
+        opts['download_archive'] = self.archive_path(url)
+        key = self.key(url)
+        previous = self._playlists.get(key, {})
+        self._playlists[key] = {'url': url, 'title': title, 'opts': opts, 'save_path': save_path,
+                                'added': previous.get('added', time.time()),
+                                'last_synced': previous.get('last_synced')}
+        self.save()
+        return self._playlists[key]
+
+    def remove(self, url: str) -> None:
+        '''Removes a saved playlist (its archive is kept, so re-adding it does not download everything again)'''
+        self._playlists.pop(self.key(url), None)
+        self.save()
+
+    def mark_synced(self, url: str) -> None:
+        '''Records the time of the last successful sync of a playlist'''
+        playlist = self.get(url)
+        if playlist is not None:
+            playlist['last_synced'] = time.time()
+            self.save()
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp = self.path + '.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(self.playlists(), f, indent=1)
+        os.replace(temp, self.path)
+
+
+def sync_all(sync: PlaylistSync | None = None) -> list:
+    '''
+    Downloads the new entries of every saved playlist with yt-dlp, without the GUI.
+    Every playlist is logged in the `Download` log, returns the list of log records.
+    '''
+    sync = sync or PlaylistSync()
+    records = []
+    for playlist in sync.playlists():
+        now = time.ctime()
+        try:
+            with yt_dlp.YoutubeDL(dict(playlist['opts'], quiet=True, no_warnings=True, noprogress=True)) as ydl:
+                ydl.download([playlist['url']])
+            sync.mark_synced(playlist['url'])
+            record = {'URL': playlist['url'], 'Process': 'Playlist Sync', 'State': 1,
+                      'Message': 'Playlist Synced Successfully',
+                      'Save Location': os.path.abspath(playlist['save_path']),
+                      'Datetime': now}
+        except Exception as e:
+            record = {'URL': playlist['url'], 'Process': 'Playlist Sync', 'State': 0,
+                      'Error': str(e), 'Datetime': now}
+        write_log(record, 'Download')
+        records.append(record)
+    return records
+
+
+if __name__ == '__main__':
+    initialize_env()
+    for r in sync_all():
+        print(f"{'✅' if r['State'] else '❌'} {r['URL']}: {r.get('Message') or r.get('Error')}")
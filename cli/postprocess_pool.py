@@ -0,0 +1,114 @@
+'''
+Classes
+-------
+
+    - PostProcessPool:
+        Resizable pool running post-processing jobs next to the downloads.
+
+    - PostProcessHandoff:
+        yt-dlp postprocessor that hands every downloaded file over to be post-processed elsewhere.
+
+Functions
+---------
+
+    - run_postprocessors:
+        Runs a list of yt-dlp postprocessor definitions on an info dict.
+'''
+from concurrent.futures import ThreadPoolExecutor
+from yt_dlp.postprocessor import get_postprocessor, PostProcessor
+import threading
+import os
+
+
+class PostProcessPool:
+    """
+    PostProcessPool
+    ===============
+
+    Runs post-processing jobs (yt-dlp ffmpeg postprocessors) on their own threads, at most `workers`
+    at a time. The CPU work happens in the ffmpeg processes the jobs start, so jobs run in parallel
+    while the download threads keep transferring. `workers` can be changed at any time.
+
+    Attributes
+    ----------
+        workers (int): Number of jobs allowed to run at the same time
+
+    Methods
+    -------
+        set_workers(int) -> None:
+            Changes the number of jobs allowed to run at the same time
+
+        submit(callable, *args) -> Future:
+            Queues a job
+    """
+    max_workers = 16
+
+    def __init__(self, workers: int = 2):
+        self.workers = max(1, min(workers, self.max_workers))
+        self._running = 0
+        self._slots = threading.Condition()
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='postprocess')
+
+    def set_workers(self, workers: int) -> None:
+        '''Changes the number of jobs allowed to run at the same time, running jobs are not interrupted'''
+        with self._slots:
+            self.workers = max(1, min(workers, self.max_workers))
+            self._slots.notify_all()
+
+    def submit(self, fn, *args):
+        '''Queues `fn(*args)` and returns its `Future`'''
+        return self._executor.submit(self._run, fn, args)
+
+    def _run(self, fn, args):
+        with self._slots:
+            self._slots.wait_for(lambda: self._running < self.workers)
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._slots:
+                self._running -= 1
+                self._slots.notify_all()
+
+
+def run_postprocessors(ydl, info: dict, postprocessors: list) -> dict:
+    '''
+    Runs yt-dlp postprocessor definitions on a downloaded file the way yt-dlp does inline:
+    each one gets the info dict returned by the previous one, and the files it replaced are
+    deleted unless `keepvideo` is set. Returns the final info dict.
+
+    Parameters
+    ----------
+        ydl : YoutubeDL
+            instance whose options (`ffmpeg_location`, logger, ...) the postprocessors use
+        info : dict
+            info dict of the downloaded file, `filepath` is its final location
+        postprocessors : list
+            definitions as in the `postprocessors` option, e.g. `{'key': 'FFmpegMetadata'}`
+    '''
+    for definition in postprocessors:
+        args = {k: v for k, v in definition.items() if k not in ('key', 'when')}
+        pp = get_postprocessor(definition['key'])(ydl, **args)
+        files_to_delete, info = pp.run(info)
+        if not ydl.params.get('keepvideo'):
+            for path in files_to_delete:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+    return info
+
+
+class PostProcessHandoff(PostProcessor):
+    """
+    Registered with `when='after_move'`, so it runs once a file is complete at its final location.
+    Instead of running postprocessors inline (which blocks the next download), it passes the info dict
+    to `handoff`, which queues the work (see `PostProcessPool`) and returns immediately.
+    """
+    def __init__(self, ydl, handoff):
+        super().__init__(ydl)
+        self.handoff = handoff
+
+    def run(self, info):
+        self.handoff(dict(info))
+        return [], info
@@ -0,0 +1,75 @@
+'''
+Classes
+-------
+
+    - ProgressThrottle:
+        Coalesces yt-dlp progress hook events into compact records emitted at a bounded rate.
+'''
+import time
+
+
+class ProgressThrottle:
+    """
+    ProgressThrottle
+    ================
+
+    yt-dlp calls its progress hooks for every downloaded chunk, which can be thousands of times
+    per second. `update` merges those events per item and only returns a compact record when the
+    item was not reported during the last `1 / rate` seconds. Final states (`finished`, `error`)
+    are always returned.
+
+    Record keys: `id`, `title`, `playlist_index`, `filename`, `status`, `downloaded`, `total`, `speed`, `eta`
+
+    Attributes
+    ----------
+        interval (float): Minimum number of seconds between two records of the same item
+
+    Methods
+    -------
+        compact(dict) -> dict:
+            Builds the compact record of a yt-dlp progress dict
+
+        update(dict) -> dict | None:
+            Feeds an event, returns the record to emit or None if it was merged
+    """
+    final_states = ('finished', 'error')
+
+    def __init__(self, rate: float = 10.0):
+        self.interval = 1 / rate if rate > 0 else 0
+        self._last = {}
+
+    @staticmethod
+    def compact(d: dict) -> dict:
+        '''Builds the compact record of a yt-dlp progress dict, dropping `info_dict` and the preformatted strings'''
+        info = d.get('info_dict') or {}
+        return {
+            'id': info.get('id') or info.get('title'),
+            'title': info.get('title'),
+            'playlist_index': info.get('playlist_index'),
+            'filename': d.get('filename'),
+            'status': d.get('status'),
+            'downloaded': d.get('downloaded_bytes'),
+            'total': d.get('total_bytes') or d.get('total_bytes_estimate'),
+            'speed': d.get('speed'),
+            'eta': d.get('eta'),
+        }
+
+    def update(self, d: dict) -> dict | None:
+        '''
+        Feeds a yt-dlp progress dict, returns the compact record to emit or None if it was merged
+
+        Parameters
+        ----------
+            d : dict
+                dict passed by yt-dlp to the progress hooks
+        '''
+        record = self.compact(d)
+        now = time.monotonic()
+        key = record['id']
+        if record['status'] in self.final_states:
+            self._last.pop(key, None)
+            return record
+        if now - self._last.get(key, float('-inf')) < self.interval:
+            return None
+        self._last[key] = now
+        return record
@@ -0,0 +1,112 @@
+'''
+Classes
+-------
+
+    - RetryPolicy:
+        Backoff delays for failed downloads, growing while a site keeps throttling.
+
+Functions
+---------
+
+    - classify:
+        Kind of a download error: throttling, transient or permanent.
+'''
+from urllib.parse import urlsplit
+import random
+import re
+
+THROTTLED = 'throttled'
+TRANSIENT = 'transient'
+PERMANENT = 'permanent'
+
+_throttled = re.compile(r'HTTP Error 429|Too Many Requests|rate.?limit|throttl', re.IGNORECASE)
+# Checked before the transient patterns, so "HTTP Error 404: ... timed out" style mixes stay permanent
+_permanent = re.compile(
+    r'HTTP Error (?:400|401|404|410|451)|Video unavailable|Private video|members.only|'
+    r'Sign in to confirm your age|not available in your country|geo.?restrict|copyright|has been removed|'
+    r'account .* terminated|Unsupported URL|is not a valid URL|No video formats found|'
+    r'Requested format is not available|No space left on device|Permission denied|File name too long|'
+    r'Post-processing failed|ffmpeg (?:is )?not found', re.IGNORECASE)
+_transient = re.compile(
+    r'timed? ?out|Connection (?:reset|refused|aborted)|Remote end closed|IncompleteRead|ContentTooShort|'
+    r'Temporary failure|Name or service not known|getaddrinfo|Network is unreachable|No route to host|'
+    r'HTTP Error (?:403|408|5\d\d)|SSL|EOF occurred|Unable to download (?:webpage|JSON|API|video data)|'
+    r'fragment|did not match the expected|Broken pipe|Got error', re.IGNORECASE)
+
+
+def classify(error: str | None) -> str:
+    '''
+    Kind of a download error message:
+        - `THROTTLED`: the site asks to slow down (HTTP 429, rate limits)
+        - `TRANSIENT`: network or server trouble likely gone on a later attempt (timeouts, resets, 5xx)
+        - `PERMANENT`: retrying cannot help (removed or private media, 404, unsupported URL, full disk)
+
+    Unrecognized errors are permanent, so unknown failures are never retried in a loop.
+    '''
+    error = error or ''
+    if _throttled.search(error):
+        return THROTTLED
+    if _permanent.search(error):
+        return PERMANENT
+    if _transient.search(error):
+        return TRANSIENT
+    return PERMANENT
+
+
+class RetryPolicy:
+    """
+    RetryPolicy
+    ===========
+
+    Exponential backoff with jitter: attempt `n` (from 0) waits a random time between half and all of
+    `base * 2 ** n` seconds, at most `max_delay`. The jitter spreads retries of items that failed together.
+    Throttling starts from the longer `throttle_delay`, and every throttled failure of a site raises the
+    exponent for all items of that site until one of its downloads succeeds.
+
+    Attributes
+    ----------
+        max_attempts (int): Retries of an item before it is left failed
+        base_delay (float): Seconds before the first retry of a transient failure
+        throttle_delay (float): Seconds before the first retry of a throttled failure
+        max_delay (float): Longest wait
+
+    Methods
+    -------
+        should_retry(str, int) -> bool:
+            Whether a failure of a kind is retried after a number of retries
+
+        delay(str, int, str) -> float:
+            Seconds to wait before the next attempt of an item
+
+        succeeded(str) -> None:
+            Resets the throttling of the site of a URL
+    """
+    def __init__(self, max_attempts: int = 4, base_delay: float = 10.0, throttle_delay: float = 60.0,
+                 max_delay: float = 1800.0, rng: random.Random | None = None):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.throttle_delay = throttle_delay
+        self.max_delay = max_delay
+        self._rng = rng or random.Random()
+        self._throttled = {}  # site -> throttled failures since its last success
+
+    @staticmethod
+    def site(url: str | None) -> str:
+        return (urlsplit(url or '').hostname or '').removeprefix('www.')
+
+    def should_retry(self, kind: str, attempts: int) -> bool:
+        return kind != PERMANENT and attempts < self.max_attempts
+
+    def delay(self, kind: str, attempt: int, url: str | None = None) -> float:
+        '''Seconds to wait before retry number `attempt` (from 0) of a failure of `kind` on `url`'''
+        base = self.base_delay
+        if kind == THROTTLED:
+            site = self.site(url)
+            self._throttled[site] = self._throttled.get(site, 0) + 1
+            attempt = max(attempt, self._throttled[site] - 1)
+            base = self.throttle_delay
+        ceiling = min(self.max_delay, base * 2 ** attempt)
+        return self._rng.uniform(ceiling / 2, ceiling)
+
+    def succeeded(self, url: str | None) -> None:
+        self._throttled.pop(self.site(url), None)
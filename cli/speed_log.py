@@ -0,0 +1,161 @@
+'''
+Classes
+-------
+
+    - SpeedRecorder:
+        Records the speed and ETA of a download as a compact time series.
+
+Functions
+---------
+
+    - read_samples:
+        Reads the samples of a time-series file written by `SpeedRecorder`.
+'''
+from array import array
+import struct
+import math
+import time
+import sys
+import os
+
+MAGIC = b'MFMSPD1\n'
+# Columns of a time-series file, with their array type codes (fixed sizes: 8, 4, 4, 8, 2, 2 bytes)
+COLUMNS = (('time', 'd'), ('speed', 'f'), ('eta', 'f'), ('downloaded', 'Q'), ('entry', 'H'), ('retries', 'H'))
+
+
+class SpeedRecorder:
+    """
+    SpeedRecorder
+    =============
+
+    Samples the progress records of one download (see `ProgressThrottle`) at most once per
+    `interval` seconds per file into array-backed column buffers of `capacity` samples. A full buffer is
+    appended to the time-series file as one block and reused, so memory stays constant however long the
+    download runs. Running totals (bytes, peak and lowest speed, retries) are kept for the summary.
+
+    File layout: `MAGIC`, then blocks of a little-endian uint32 sample count followed by each column
+    of `COLUMNS` in turn. `time` is seconds since the download started, unknown ETAs are NaN, `entry` is
+    the playlist index (0 for single files) and `retries` the number of retries reported so far.
+    The file is only created once there is something to write.
+
+    Attributes
+    ----------
+        path (str): Time-series file
+        interval (float): Minimum seconds between two samples of the same file
+        retries (int): Retries reported (fragments or whole requests)
+
+    Methods
+    -------
+        sample(dict) -> None:
+            Feeds a progress record
+
+        retry() -> None:
+            Counts a retry
+
+        close() -> dict:
+            Writes the remaining samples and returns the summary
+    """
+    default_dir = 'Media Files Manager/Logs/Speed'
+
+    def __init__(self, path: str, interval: float = 1.0, capacity: int = 1024):
+        self.path = path
+        self.interval = interval
+        self.capacity = capacity
+        self.retries = 0
+        self.started = time.monotonic()
+        self._columns = [array(code) for _, code in COLUMNS]
+        self._last = {}  # file -> time of its last sample
+        self._downloaded = {}  # file -> bytes downloaded
+        self._samples = 0
+        self._speed_sum = 0.0
+        self._speed_max = 0.0
+        self._speed_min = None
+        self._created = False
+
+    def sample(self, record: dict) -> None:
+        '''Adds a sample for a progress record, unless its file was sampled less than `interval` seconds ago'''
+        key = record.get('filename') or record.get('id')
+        if record.get('downloaded') is not None:
+            self._downloaded[key] = record['downloaded']
+        speed = record.get('speed')
+        now = time.monotonic() - self.started
+        if speed is None or now - self._last.get(key, float('-inf')) < self.interval:
+            return
+        self._last[key] = now
+        eta = record.get('eta')
+        row = (now, speed, math.nan if eta is None else eta, record.get('downloaded') or 0,
+               min(record.get('playlist_index') or 0, 0xFFFF), min(self.retries, 0xFFFF))
+        for column, value in zip(self._columns, row):
+            column.append(value)
+        self._samples += 1
+        self._speed_sum += speed
+        self._speed_max = max(self._speed_max, speed)
+        self._speed_min = speed if self._speed_min is None else min(self._speed_min, speed)
+        if len(self._columns[0]) >= self.capacity:
+            self.flush()
+
+    def retry(self) -> None:
+        self.retries += 1
+
+    def flush(self) -> None:
+        '''Appends the buffered samples to the file as one block and empties the buffers'''
+        count = len(self._columns[0])
+        if not count:
+            return
+        if not self._created:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, 'wb') as f:
+                f.write(MAGIC)
+            self._created = True
+        with open(self.path, 'ab') as f:
+            f.write(struct.pack('<I', count))
+            for column in self._columns:
+                if sys.byteorder == 'big':
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                column.tofile(f)
+        for column in self._columns:
+            del column[:]
+
+    def close(self) -> dict:
+        '''
+        Writes the remaining samples.
+
+        **Return** dict with `wall_s`, `bytes`, `avg_speed` (bytes over wall time), `mean_speed`,
+        `peak_speed` and `min_speed` (of the samples), `samples`, `retries` and `file` (None without samples)
+        '''
+        self.flush()
+        wall = time.monotonic() - self.started
+        downloaded = sum(self._downloaded.values())
+        return {
+            'wall_s': round(wall, 2),
+            'bytes': downloaded,
+            'avg_speed': downloaded / wall if wall > 0 else None,
+            'mean_speed': self._speed_sum / self._samples if self._samples else None,
+            'peak_speed': self._speed_max if self._samples else None,
+            'min_speed': self._speed_min,
+            'samples': self._samples,
+            'retries': self.retries,
+            'file': self.path if self._created else None,
+        }
+
+
+def read_samples(path: str) -> dict:
+    '''
+    Reads a time-series file written by `SpeedRecorder`
+
+    **Return** dict of column name -> `array` of every sample (see `COLUMNS`)
+    '''
+    columns = {name: array(code) for name, code in COLUMNS}
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'Not a speed time-series file: {path}')
+        while header := f.read(4):
+            count = struct.unpack('<I', header)[0]
+            for name, code in COLUMNS:
+                block = array(code)
+                block.fromfile(f, count)
+                if sys.byteorder == 'big':
+                    block.byteswap()
+                columns[name].extend(block)
+    return columns
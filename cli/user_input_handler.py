@@ -68,4 +68,34 @@ def calculate_sec(start: str, end: str) -> str:
             difference += (float(e[i]) - float(s[i])) * 60
         elif i == -1:
             difference += float(e[i]) - float(s[i])
-    return str(difference)
\ No newline at end of file
+    return str(difference)
+
+def items_to_ranges(items: list) -> str:
+    '''Compress item numbers into the `1-3,5,8-9` format used by yt-dlp `playlist_items`
+    (the same pattern `pdf_pd_input` reads for pages)'''
+    items = sorted(set(items))
+    ranges = []
+    for i in items:
+        if ranges and i == ranges[-1][1] + 1:
+            ranges[-1][1] = i
+        else:
+            ranges.append([i, i])
+    return ','.join(str(a) if a == b else f'{a}-{b}' for a, b in ranges)
+
+def ranges_to_items(text: str) -> list:
+    '''Expand the `1-3,5,8-9` format used by yt-dlp `playlist_items` into sorted item numbers
+    (the inverse of `items_to_ranges`), invalid parts are ignored'''
+    items = set()
+    for part in text.replace(' ', '').split(','):
+        first, _, last = part.partition('-')
+        if first.isdigit() and (not last or last.isdigit()):
+            items.update(range(int(first), int(last or first) + 1))
+    return sorted(items)
+
+def format_duration(seconds: float | None, empty: str = '-') -> str:
+    '''Formats a duration in seconds as `H:MM:SS` or `M:SS`, `empty` when it is unknown'''
+    if not seconds:
+        return empty
+    m, s = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
@@ -0,0 +1,163 @@
+'''
+Classes
+-------
+
+    - DownloadVerifier:
+        Small thread pool checking downloaded files in the background.
+
+Functions
+---------
+
+    - expected_size:
+        Exact size in bytes a downloaded file should have, from its yt-dlp info dict.
+
+    - probe_media:
+        Container format, duration and stream types of a media file, read with ffprobe.
+
+    - verify_file:
+        Checks one downloaded file against its expected size and duration.
+
+    - forget_archived:
+        Removes entries from a yt-dlp download archive, so they are downloaded again.
+'''
+from concurrent.futures import ThreadPoolExecutor
+import subprocess
+import shutil
+import json
+import os
+
+# Files ffprobe is asked about, anything else (archives, documents, ...) only gets the size check
+MEDIA_EXTENSIONS = {'.mp4', '.mkv', '.webm', '.mov', '.avi', '.flv', '.m4v', '.ts', '.3gp', '.ogv',
+                    '.m4a', '.mp3', '.opus', '.ogg', '.oga', '.aac', '.flac', '.wav', '.wma', '.mka'}
+
+
+def expected_size(info: dict) -> int | None:
+    '''
+    Exact size of a downloaded file: the `filesize` of its format, or the sum over the merged formats.
+    None when a size is unknown or only approximate.
+    '''
+    formats = info.get('requested_formats') or [info]
+    sizes = [f.get('filesize') for f in formats]
+    return sum(sizes) if sizes and None not in sizes else None
+
+
+def probe_media(path: str, ffprobe: str = 'ffprobe', timeout: float = 30) -> dict:
+    '''
+    Reads the container of a media file with ffprobe (headers only, the streams are not decoded).
+
+    **Return** dict with `format` (container name), `duration` (seconds or None) and `streams` (codec types).
+    Raises `ValueError` with ffprobe's message when the file cannot be read, `OSError` when ffprobe is missing.
+    '''
+    command = [ffprobe, '-v', 'error', '-show_entries', 'format=format_name,duration:stream=codec_type',
+               '-of', 'json', path]
+    process = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    if process.returncode != 0:
+        raise ValueError(process.stderr.strip().splitlines()[-1] if process.stderr.strip() else
+                         f'ffprobe exited with code {process.returncode}')
+    data = json.loads(process.stdout or '{}')
+    fmt = data.get('format') or {}
+    try:
+        duration = float(fmt['duration'])
+    except (KeyError, TypeError, ValueError):
+        duration = None
+    return {'format': fmt.get('format_name'), 'duration': duration,
+            'streams': [s.get('codec_type') for s in data.get('streams') or []]}
+
+
+def verify_file(path: str, expected_size: int | None = None, expected_duration: float | None = None,
+                ffprobe: str | None = 'ffprobe', size_tolerance: float = 0.1) -> dict:
+    '''
+    Checks a downloaded file:
+        - it exists and is not empty
+        - it is not more than `size_tolerance` smaller than `expected_size` (merging and remuxing
+          change the size a little, a truncated download is much smaller)
+        - ffprobe can read its container and finds streams (media files only, skipped without ffprobe)
+        - its duration is not more than 2 seconds (or 2%) shorter than `expected_duration`
+
+    **Return** dict with `File`, `State`, `Message` or `Error`, `Size` and `Duration`
+    '''
+    result = {'File': path, 'State': False, 'Size': None, 'Duration': None}
+    if not path or not os.path.isfile(path):
+        return dict(result, Error='File is missing')
+    size = result['Size'] = os.path.getsize(path)
+    if size == 0:
+        return dict(result, Error='File is empty')
+    if expected_size and size < expected_size * (1 - size_tolerance):
+        return dict(result, Error=f'File is truncated: {size} of {expected_size} bytes')
+
+    if os.path.splitext(path)[1].lower() not in MEDIA_EXTENSIONS:
+        return dict(result, State=True, Message='Size verified')
+    if not ffprobe:
+        return dict(result, State=True, Message='Size verified (ffprobe not found, container not checked)')
+    try:
+        media = probe_media(path, ffprobe)
+    except (ValueError, subprocess.SubprocessError) as e:
+        return dict(result, Error=f'Broken container: {e}')
+    except OSError:
+        return dict(result, State=True, Message='Size verified (ffprobe not found, container not checked)')
+    result['Duration'] = media['duration']
+    if not media['streams']:
+        return dict(result, Error='No audio or video stream found')
+    if expected_duration and media['duration'] is not None:
+        if media['duration'] < expected_duration - max(2.0, expected_duration * 0.02):
+            return dict(result, Error=f"File is truncated: {media['duration']:.1f}s of {expected_duration:.1f}s")
+    return dict(result, State=True, Message=f"Verified ({media['format']}"
+                + (f", {media['duration']:.1f}s)" if media['duration'] is not None else ')'))
+
+
+def forget_archived(archive_path: str, archive_ids: set) -> None:
+    '''Removes the lines `<extractor> <id>` of `archive_ids` from a yt-dlp download archive file'''
+    try:
+        with open(archive_path, encoding='utf-8') as f:
+            lines = f.readlines()
+    except OSError:
+        return
+    with open(archive_path, 'w', encoding='utf-8') as f:
+        f.writelines(line for line in lines if line.strip() not in archive_ids)
+
+
+class DownloadVerifier:
+    """
+    DownloadVerifier
+    ================
+
+    Runs `verify_file` for the files of finished downloads on at most `workers` threads, next to the
+    running downloads. Each file is described by a dict with `path`, `expected_size` and `expected_duration`.
+
+    Attributes
+    ----------
+        workers (int): Number of files checked at the same time
+
+    Methods
+    -------
+        find_ffprobe(str | None) -> str | None:
+            ffprobe next to an ffmpeg location, else the one on the PATH
+
+        submit(list, str | None, callable) -> Future:
+            Checks a list of files and calls `callback(results)` on the verifying thread when done
+    """
+
+    def __init__(self, workers: int = 2):
+        self.workers = max(1, workers)
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='verify')
+
+    @staticmethod
+    def find_ffprobe(ffmpeg_location: str | None = None) -> str | None:
+        '''ffprobe in `ffmpeg_location` (yt-dlp option, a folder or the ffmpeg binary), else on the PATH'''
+        if ffmpeg_location:
+            folder = ffmpeg_location if os.path.isdir(ffmpeg_location) else os.path.dirname(ffmpeg_location)
+            found = shutil.which(os.path.join(folder, 'ffprobe'))
+            if found:
+                return found
+        return shutil.which('ffprobe')
+
+    def submit(self, files: list, ffmpeg_location: str | None = None, callback=None):
+        '''Checks `files` in the pool, returns the `Future` of the list of `verify_file` results'''
+        def run():
+            ffprobe = self.find_ffprobe(ffmpeg_location)
+            results = [dict(verify_file(f.get('path'), f.get('expected_size'), f.get('expected_duration'), ffprobe),
+                            Archive=f.get('archive_id')) for f in files]
+            if callback is not None:
+                callback(results)
+            return results
+        return self._executor.submit(run)
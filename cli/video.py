@@ -3,8 +3,14 @@ from cli.File import File, Directory
 from cli.images import ImageOperations
 from cli.user_input_handler import calculate_sec
 import time
+from cli.http_cache import HTTPCache
 from urllib.parse import urlparse
 import requests
+import shutil
+import os
+
+# Downloaded thumbnails, shared by every embedding operation
+_thumbnail_cache = HTTPCache()
 
 class Video(File):
     '''
@@ -478,6 +484,10 @@ def embed_thumbnail_in_folder(folder: Directory, image_file: File | ImageOperati
 def download_thumbnail(url: str) -> bool | ImageOperations:
     '''Downloads an Image from the internet
     
+    The image goes through the thumbnail `HTTPCache`: batches reusing the same cover URL download it once,
+    later runs only revalidate it (or skip the network entirely while it is fresh).
+    Returns a copy in `Media Files Manager/Temp` that the caller may delete, False on failure.
+
     Parameters
     ----------
         url : str
@@ -486,31 +496,23 @@ def download_thumbnail(url: str) -> bool | ImageOperations:
     parsed = urlparse(url)
 
     if parsed.scheme == "https" and parsed.netloc:
-        r = requests.get(url)
-        if r.status_code == 200:
-            content_type = r.headers.get('Content-Type', "")
-            if content_type:
-                type_file, ext = content_type.split("/")
-                if type_file == "image":
-                    name = Directory(f'{parsed.path}').basename or "downloaded_image"
-                    ext = '.' + ext
-                    name = name.rstrip(ext)
-                    file_name = name + ext
-
-                    image_file = ImageOperations(f"Media Files Manager/Temp/{file_name}")
-                    image_file.validate_name()
-                    try:
-                        with open(str(image_file), 'wb') as handler:
-                            handler.write(r.content)
-                        return image_file
-                    except Exception as e:
-                        print(f"Error: {e}")
-                        return False
-                else:
-                    return False
-            else:
-                 return False
-        else:
+        try:
+            cached = _thumbnail_cache.fetch(url, accept='image')
+        except (requests.RequestException, OSError, ValueError) as e:
+            print(f"Error: {e}")
+            return False
+        ext = '.' + cached['content_type'].split("/")[1]
+        name = os.path.splitext(Directory(f'{parsed.path}').basename)[0] or "downloaded_image"
+        file_name = name + ext
+
+        image_file = ImageOperations(f"Media Files Manager/Temp/{file_name}")
+        image_file.validate_name()
+        try:
+            os.makedirs(os.path.dirname(str(image_file)), exist_ok=True)
+            shutil.copyfile(cached['path'], str(image_file))
+            return image_file
+        except Exception as e:
+            print(f"Error: {e}")
             return False
     else:
-        return False
\ No newline at end of file
+        return False
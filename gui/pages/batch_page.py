@@ -0,0 +1,219 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton,
+                             QLabel, QSpinBox, QComboBox, QCheckBox, QTextEdit, QHeaderView, QAbstractItemView,
+                             QFileDialog)
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QColor
+from cli.batch_import import parse_urls, downloaded_keys, deduplicate
+from cli.metadata_cache import normalize_url
+
+PENDING, READY, FAILED = 'Pending', 'Ready', 'Failed'
+
+
+class BatchImportPage(QWidget):
+    """Imports many URLs at once, pasted or loaded from a text file. URLs are normalized and deduplicated
+    (against each other, the queue and the download history), then their metadata is prefetched in the
+    background. Ready items are queued together with one shared format policy.
+    The page only collects and shows the entries: prefetching and queueing are done by the download page.
+    """
+    back_requested = pyqtSignal()
+    prefetch_requested = pyqtSignal(list, int)  # new URLs, number of parallel fetches
+    queue_requested = pyqtSignal(list, dict)  # ready entries, format policy
+
+    def __init__(self, queued_urls=(), codec_choices=(), parent=None):
+        super().__init__(parent)
+        self.queued_keys = {normalize_url(url) for url in queued_urls}
+        self.entries = []  # dicts: url, key, status, title, type, info, error
+        self.rows = {}  # url -> row
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(8, 8, 8, 8)
+
+        top = QHBoxLayout()
+        back_btn = QPushButton("← Back")
+        back_btn.setFixedSize(100, 40)
+        back_btn.setProperty("class", "back")
+        back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        back_btn.clicked.connect(self.back_requested.emit)
+        top.addWidget(back_btn)
+        top.addStretch()
+        top.addWidget(QLabel("Parallel fetches:"))
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, 16)
+        self.workers_spin.setValue(4)
+        self.workers_spin.setToolTip("Metadata requests running at the same time")
+        top.addWidget(self.workers_spin)
+        self.skip_downloaded_check = QCheckBox("Skip URLs already downloaded")
+        self.skip_downloaded_check.setChecked(True)
+        top.addWidget(self.skip_downloaded_check)
+        self.layout.addLayout(top)
+
+        self.urls_input = QTextEdit()
+        self.urls_input.setPlaceholderText("Paste URLs here, one or more per line (lines starting with # are ignored)")
+        self.urls_input.setFixedHeight(110)
+        self.layout.addWidget(self.urls_input)
+
+        inputs = QHBoxLayout()
+        load_btn = QPushButton("Load Text File...")
+        load_btn.clicked.connect(self.load_file)
+        add_btn = QPushButton("Add URLs")
+        add_btn.setProperty("class", "primary")
+        add_btn.clicked.connect(lambda: self.add_urls(self.urls_input.toPlainText()))
+        for btn in (load_btn, add_btn):
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            inputs.addWidget(btn)
+        inputs.addStretch()
+        self.summary_label = QLabel("")
+        inputs.addWidget(self.summary_label)
+        self.layout.addLayout(inputs)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(4)
+        self.table.setHorizontalHeaderLabels(['Status', 'Type', 'Title', 'URL'])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        self.layout.addWidget(self.table)
+
+        # Format policy shared by every queued item
+        policy = QHBoxLayout()
+        policy.addWidget(QLabel("Best quality up to:"))
+        self.quality_combo = QComboBox()
+        self.quality_combo.addItems(['Best', '2160p', '1440p', '1080p', '720p', '480p', '360p', 'Audio Only'])
+        self.quality_combo.setCurrentText('1080p')
+        self.quality_combo.setToolTip("Highest resolution within the limits, then the preferred codec, then the smallest size")
+        policy.addWidget(self.quality_combo)
+        policy.addWidget(QLabel("Codec:"))
+        self.codec_combo = QComboBox()
+        self.codec_combo.addItems(list(codec_choices))
+        policy.addWidget(self.codec_combo)
+        policy.addWidget(QLabel("Container:"))
+        self.merge_combo = QComboBox()
+        self.merge_combo.addItems(['original', 'mp4', 'audio (original, no re-encode)', 'mp3 (re-encode)'])
+        policy.addWidget(self.merge_combo)
+        policy.addWidget(QLabel("Max size:"))
+        self.size_spin = QSpinBox()
+        self.size_spin.setRange(0, 100000)
+        self.size_spin.setSingleStep(100)
+        self.size_spin.setSuffix(" MB")
+        self.size_spin.setSpecialValueText("No limit")
+        self.size_spin.setToolTip("Largest download per video (per entry for playlists)")
+        policy.addWidget(self.size_spin)
+        self.smallest_check = QCheckBox("Smallest files")
+        self.smallest_check.setToolTip("Prefer the smallest matching format over the highest resolution")
+        policy.addWidget(self.smallest_check)
+        self.layout.addLayout(policy)
+
+        actions = QHBoxLayout()
+        remove_btn = QPushButton("Remove Selected")
+        remove_btn.clicked.connect(self.remove_selected)
+        retry_btn = QPushButton("Retry Failed")
+        retry_btn.clicked.connect(self.retry_failed)
+        queue_btn = QPushButton("Queue Ready Items")
+        queue_btn.setProperty("class", "success")
+        queue_btn.clicked.connect(lambda: self.queue_requested.emit(self.ready_entries(), self.policy()))
+        for btn in (remove_btn, retry_btn, queue_btn):
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            actions.addWidget(btn)
+        self.layout.addLayout(actions)
+
+    def load_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Load URL List", "", "Text Files (*.txt *.csv);;All Files (*)")
+        if not path:
+            return
+        try:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                self.add_urls(f.read())
+        except OSError as e:
+            self.summary_label.setText(f"❌ Could not read file: {e}")
+
+    def add_urls(self, text):
+        """Adds the new URLs of `text` to the table and asks for their metadata."""
+        urls = parse_urls(text)
+        known = self.queued_keys | {e['key'] for e in self.entries}
+        downloaded = downloaded_keys() if self.skip_downloaded_check.isChecked() else set()
+        result = deduplicate(urls, known, downloaded)
+        for url in result['new']:
+            self.entries.append({'url': url, 'key': normalize_url(url), 'status': PENDING, 'title': None,
+                                 'type': None, 'info': None, 'error': None})
+        self.refresh()
+        parts = [f"{len(result['new'])} added"]
+        if result['duplicates']:
+            parts.append(f"{len(result['duplicates'])} duplicates skipped")
+        if result['downloaded']:
+            parts.append(f"{len(result['downloaded'])} already downloaded")
+        if len(urls) == 0:
+            parts = ["No URLs found"]
+        self.summary_label.setText(" · ".join(parts))
+        self.urls_input.clear()
+        if result['new']:
+            self.prefetch_requested.emit(result['new'], self.workers_spin.value())
+
+    def set_result(self, url, result):
+        """Applies a prefetch result (`State`, `Type`, `Info` or `Error`) to the entry of `url`."""
+        if url not in self.rows:
+            return  # Removed while it was being fetched
+        entry = self.entries[self.rows[url]]
+        if result.get('State'):
+            entry.update(status=READY, type=result['Type'], info=result['Info'], error=None,
+                         title=result['Info'].get('title'))
+        else:
+            entry.update(status=FAILED, error=result.get('Error'))
+        self.update_row(entry)
+
+    def ready_entries(self):
+        return [e for e in self.entries if e['status'] == READY]
+
+    def remove_entries(self, urls):
+        urls = set(urls)
+        self.entries = [e for e in self.entries if e['url'] not in urls]
+        self.refresh()
+
+    def remove_selected(self):
+        rows = {i.row() for i in self.table.selectionModel().selectedRows()}
+        self.remove_entries(self.entries[r]['url'] for r in rows)
+
+    def retry_failed(self):
+        failed = [e['url'] for e in self.entries if e['status'] == FAILED]
+        for entry in self.entries:
+            if entry['status'] == FAILED:
+                entry.update(status=PENDING, error=None)
+        self.refresh()
+        if failed:
+            self.prefetch_requested.emit(failed, self.workers_spin.value())
+
+    def policy(self):
+        """Format policy applied to every queued item."""
+        quality = self.quality_combo.currentText()
+        return {
+            'max_height': int(quality[:-1]) if quality.endswith('p') else None,
+            'audio_only': quality == 'Audio Only',
+            'codec': self.codec_combo.currentText(),
+            'merge_format': self.merge_combo.currentText().split()[0],
+            'max_size': self.size_spin.value() * 1024 * 1024 or None,
+            'smallest': self.smallest_check.isChecked(),
+        }
+
+    def refresh(self):
+        self.table.setRowCount(len(self.entries))
+        self.rows = {}
+        for r, entry in enumerate(self.entries):
+            self.rows[entry['url']] = r
+            self.update_row(entry)
+
+    def update_row(self, entry):
+        r = self.rows.get(entry['url'])
+        if r is None:
+            return
+        status = entry['status'] if entry['status'] != FAILED else f"Failed: {entry['error']}"
+        values = [status, (entry['type'] or '').title(), entry['title'] or '', entry['url']]
+        for c, value in enumerate(values):
+            cell = QTableWidgetItem(value)
+            cell.setToolTip(value)
+            if entry['status'] == FAILED:
+                cell.setBackground(QColor(243, 139, 168, 60))
+            self.table.setItem(r, c, cell)
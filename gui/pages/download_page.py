@@ -2,17 +2,45 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QLabel, QLineEdit, QComboBox, QCheckBox, QTextEdit,
                              QGroupBox, QScrollArea, QFrame, QTableWidget, QTableWidgetItem,
                              QProgressBar, QDialog, QDialogButtonBox, QSpinBox, QMessageBox,
-                             QHeaderView, QAbstractItemView, QSizePolicy)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QItemSelectionModel
-from PyQt6.QtGui import QFont, QColor, QCursor, QFontMetrics
+                             QHeaderView, QAbstractItemView, QSizePolicy, QListView, QStyledItemDelegate,
+                             QTableView)
+from PyQt6.QtCore import (Qt, QObject, QThread, pyqtSignal, QSize, QItemSelectionModel,
+                          QAbstractListModel, QAbstractTableModel, QModelIndex, QRect,
+                          QRunnable, QThreadPool, QTimer)
+from PyQt6.QtGui import QFont, QColor, QCursor, QFontMetrics, QPainter, QImage, QPixmap
 import yt_dlp
 import re
 import os
+import time
+import glob
+import sqlite3
 import winsound  # For sound notifications
 from time import ctime
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait as wait_futures
+from collections import OrderedDict
 from cli.logs import write_log
 from cli.File import Directory
+from cli.metadata_cache import MetadataCache, trim_info, normalize_url
+from cli.download_queue import DownloadQueue, QUEUED, RUNNING, FAILED, PAUSED, WAITING
+from cli.progress import ProgressThrottle
+from cli.bandwidth import BandwidthScheduler
+from cli.postprocess_pool import PostProcessPool, PostProcessHandoff, run_postprocessors
+from cli.http_downloader import HTTPDownloader
+from cli.http_cache import HTTPCache
+from cli.verify import DownloadVerifier, expected_size, forget_archived
+from cli.library import MediaLibrary, media_fields
+from cli.speed_log import SpeedRecorder
+from cli.retry import RetryPolicy, classify, THROTTLED, TRANSIENT, PERMANENT
+from cli.user_input_handler import items_to_ranges, ranges_to_items, calculate_sec, format_duration
+from cli.playlist_sync import PlaylistSync
+from cli.format_selector import select_format, playlist_format, SMALL_CODECS, COMPATIBLE_CODECS
+from cli.disk_space import (estimate_format_size, estimate_playlist_size, preflight, free_space,
+                            SPACE_LOW, SPACE_INSUFFICIENT)
 from .history_page import HistoryPage
+from .queue_page import QueuePage
+from .sync_page import SyncPage
+from .batch_page import BatchImportPage
+from .library_page import LibraryPage
 
 # --- GLOBAL STYLESHEET VARIABLES ---
 THEME_BG = "#1e1e2e"       
@@ -25,6 +53,13 @@ THEME_ERROR = "#f38ba8"
 THEME_INPUT_BG = "#313244" 
 THEME_BORDER = "#A6ADC8"
 
+# Codec preferences offered by the automatic format selection
+CODEC_PREFERENCES = {'Any codec': (), 'Smaller files (AV1/VP9)': SMALL_CODECS,
+                     'Most compatible (H.264)': COMPATIBLE_CODECS}
+
+# Best native audio stream: AAC in m4a first, then Opus, so "audio" downloads never need a re-encode
+NATIVE_AUDIO_FORMAT = 'bestaudio[ext=m4a]/bestaudio[acodec=opus]/bestaudio/best'
+
 STYLESHEET = f"""
     QWidget {{
         background-color: {THEME_BG};
@@ -171,12 +206,21 @@ STYLESHEET = f"""
 """
 
 class YtdlpLogger:
-    """Custom logger to capture yt-dlp output and emit it as a signal."""
-    def __init__(self, log_signal):
+    """Custom logger to capture yt-dlp output and emit it as a signal.
+    If `is_cancelled` is given, every message is also used as a checkpoint to abort yt-dlp.
+    If `errors` (a list) is given, error messages are also appended to it."""
+    def __init__(self, log_signal, is_cancelled=None, errors=None):
         self.log_signal = log_signal
+        self.is_cancelled = is_cancelled
+        self.errors = errors
 
     def debug(self, msg):
+        if self.is_cancelled and self.is_cancelled():
+            raise yt_dlp.utils.DownloadCancelled()
         if msg.startswith('[download]'):
+            # Progress lines are shown by the progress bars, only retries are worth a log line
+            if msg.startswith('[download] Got error:') and 'Retrying' in msg:
+                self.log_signal.emit(f"⚠️ {msg.removeprefix('[download] ')}")
             return
         self.log_signal.emit(msg)
 
@@ -184,6 +228,8 @@ class YtdlpLogger:
         self.log_signal.emit(f"⚠️ {msg}")
 
     def error(self, msg):
+        if self.errors is not None:
+            self.errors.append(msg)
         self.log_signal.emit(f"❌ {msg}")
 
 class DownloadWorker(QThread):
@@ -191,35 +237,911 @@ class DownloadWorker(QThread):
     progress = pyqtSignal(dict)
     log_message = pyqtSignal(str)
     
-    def __init__(self, url, ydl_opts):
+    def __init__(self, url, ydl_opts, progress_rate=10, parallel_entries=1, limit_bandwidth=None, section=None,
+                 postprocess_pool=None):
         super().__init__()
         self.url = url
-        self.ydl_opts = ydl_opts
+        # Copy so the runtime-only entries added in run() never leak into the caller's (persisted) opts
+        self.ydl_opts = dict(ydl_opts)
+        # Progress is merged to `progress_rate` compact records per second per item
+        self.throttle = ProgressThrottle(progress_rate)
+        # Number of playlist entries downloaded at the same time
+        self.parallel_entries = max(1, parallel_entries)
+        # Called with the bytes received since the last progress event, blocks to hold the download back
+        self.limit_bandwidth = limit_bandwidth
+        self._received = {}  # file -> bytes already reported to `limit_bandwidth`
+        # [start, end] seconds of the clip to download, end None means until the end of the media
+        self.section = section
+        # With a pool, the configured postprocessors run there and the next download starts right away
+        self.postprocess_pool = postprocess_pool
+        self.postprocessors = []
+        self._post_jobs = []  # (title, archive id, future) of the files handed to the pool
+        self._post_opts = None
+        # Final files with the size and duration they should have, reported for the integrity check
+        self.files = []
+        # Errors of the entries skipped by `ignoreerrors`, reported so they can be retried
+        self.entry_errors = []
+        self._cancelled = False
+        self.keep_partial = True
+        self._partials = set()  # (temporary file, final file) pairs seen by the progress hook
+
+    def cancel(self, keep_partial=True):
+        """Asks the download to stop at the next progress event or log message.
+        With `keep_partial` the `.part` files stay on disk so the download can be resumed later."""
+        self.keep_partial = keep_partial
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
         
     def run(self):
         try:
-            self.ydl_opts['logger'] = YtdlpLogger(self.log_message)
+            self.ydl_opts['logger'] = YtdlpLogger(self.log_message, self.is_cancelled, self.entry_errors)
             self.ydl_opts['quiet'] = False 
             self.ydl_opts['progress_hooks'] = [self.progress_hook]
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-                ydl.download([self.url])
-            self.finished.emit({'State': True, 'Message': 'Download completed successfully'})
+            if self.section:
+                # Only the range is fetched. Cuts land on keyframes, so the streams are copied, not re-encoded
+                start, end = self.section
+                self.ydl_opts['download_ranges'] = yt_dlp.utils.download_range_func(
+                    None, [(start, float('inf') if end is None else end)])
+                self.ydl_opts['force_keyframes_at_cuts'] = False
+            if self.postprocess_pool is not None and self.ydl_opts.get('postprocessors'):
+                # Formats are still merged inline (the merge produces the file), everything else is handed off
+                self.postprocessors = self.ydl_opts.pop('postprocessors')
+                self._post_opts = {k: v for k, v in self.ydl_opts.items() if k != 'download_archive'}
+            try:
+                if self.parallel_entries > 1:
+                    self.download_entries_parallel()
+                else:
+                    self.download(self.ydl_opts)
+                self.wait_postprocessing()
+            finally:
+                self.close_postprocessing()
+            result = {'State': True, 'Message': 'Download completed successfully', 'Files': self.files}
+            if self.ydl_opts.get('ignoreerrors') and self.entry_errors:
+                result['EntryErrors'] = self.entry_errors
+            self.finished.emit(result)
+        except yt_dlp.utils.DownloadCancelled:
+            if not self.keep_partial:
+                self.remove_partials()
+            self.finished.emit({'State': False, 'Cancelled': True, 'Partial': self.keep_partial,
+                                'Error': 'Download cancelled'})
         except yt_dlp.utils.DownloadError as e:
+            if self._cancelled:
+                if not self.keep_partial:
+                    self.remove_partials()
+                self.finished.emit({'State': False, 'Cancelled': True, 'Partial': self.keep_partial,
+                                    'Error': 'Download cancelled'})
+                return
             self.finished.emit({'State': False, 'Error': f'Download Error: {str(e)}'})
         except Exception as e:
             self.finished.emit({'State': False, 'Error': f'Unexpected error: {str(e)}'})
     
+    def download_entries_parallel(self):
+        """Lists the requested playlist entries with a flat extraction, then splits them round-robin
+        between `parallel_entries` YoutubeDL instances running in their own threads.
+        Each instance gets its part of the listed entries, so the playlist is only extracted once.
+        Progress records carry the entry id, so they still reach the right row."""
+        with yt_dlp.YoutubeDL(dict(self.ydl_opts, extract_flat='in_playlist')) as ydl:
+            info = ydl.extract_info(self.url, download=False) or {}
+        entries = list(info.get('entries') or [])
+        indices = list(info.get('requested_entries') or range(1, len(entries) + 1))
+        if info.get('_type') != 'playlist' or len(indices) < 2:
+            self.download(self.ydl_opts)
+            return
+
+        by_index = dict(zip(indices, entries))
+        shares = [indices[n::self.parallel_entries] for n in range(self.parallel_entries)]
+        shares = [share for share in shares if share]
+        self.log_message.emit(f"⚡ Downloading {len(indices)} entries, {len(shares)} at a time")
+
+        def download_share(share):
+            # A copy per share, yt-dlp rewrites the entries of the playlist it processes
+            part = dict(info, entries=[by_index[i] for i in share], requested_entries=share)
+            self.download(dict(self.ydl_opts, playlist_items=items_to_ranges(share)), part)
+
+        with ThreadPoolExecutor(len(shares)) as pool:
+            for future in [pool.submit(download_share, share) for share in shares]:
+                future.result()
+
+    def download(self, ydl_opts, info=None):
+        """Downloads the URL, or the already extracted (flat) playlist `info` without extracting it again."""
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            if self.postprocessors:
+                ydl.add_post_processor(PostProcessHandoff(ydl, self.hand_off), when='after_move')
+            else:
+                ydl.add_post_processor(PostProcessHandoff(ydl, self.add_file), when='after_move')
+            if info is None:
+                ydl.download([self.url])
+            else:
+                ydl.process_ie_result(info, download=True)
+
+    def hand_off(self, info):
+        """Queues the postprocessors of a downloaded file on the pool (called on the download thread)."""
+        title = info.get('title') or info.get('id')
+        self.log_message.emit(f"⚙️ Post-processing in the background: {title}")
+        future = self.postprocess_pool.submit(self.postprocess, info)
+        self._post_jobs.append((title, self.archive_id(info), future))
+
+    def postprocess(self, info):
+        """Pool job: runs the handed off postprocessors of one file with a YoutubeDL of its own,
+        so jobs of the same download never share one instance."""
+        with yt_dlp.YoutubeDL(self._post_opts) as ydl:
+            return run_postprocessors(ydl, info, self.postprocessors)
+
+    @staticmethod
+    def archive_id(info):
+        """Line of a file in a yt-dlp download archive."""
+        return f"{(info.get('extractor_key') or '').lower()} {info.get('id')}"
+
+    def add_file(self, info):
+        """Records a finished file (final info dict) for the integrity check.
+        Sizes are only known when the streams are kept as downloaded, clips and audio conversion change them."""
+        converted = any(pp.get('key') == 'FFmpegExtractAudio'
+                        for pp in self.postprocessors or self.ydl_opts.get('postprocessors') or [])
+        duration = info.get('duration')
+        if self.section:
+            start, end = self.section
+            duration = (end if end is not None else duration or 0) - start
+        self.files.append({'path': info.get('filepath'),
+                           'expected_size': None if converted or self.section else expected_size(info),
+                           'expected_duration': duration,
+                           'archive_id': self.archive_id(info),
+                           'metadata': media_fields(info)})
+
+    def wait_postprocessing(self):
+        """Waits for the handed off jobs. A failed job fails a single download,
+        playlists (`ignoreerrors`) only log it like any other failed entry."""
+        futures = [future for _, _, future in self._post_jobs]
+        while wait_futures(futures, timeout=0.2).not_done:
+            if self._cancelled:
+                raise yt_dlp.utils.DownloadCancelled()
+        errors = []
+        for title, _, future in self._post_jobs:
+            if future.exception() is not None:
+                errors.append(f"{title}: {future.exception()}")
+                self.log_message.emit(f"❌ Post-processing failed: {title}: {future.exception()}")
+            else:
+                self.add_file(future.result())
+        if errors and not self.ydl_opts.get('ignoreerrors'):
+            raise yt_dlp.utils.DownloadError(f"Post-processing failed: {'; '.join(errors)}")
+
+    def close_postprocessing(self):
+        """Drops the jobs that did not start and lets the running ones finish.
+        yt-dlp archives a file as soon as it is handed off, so the files whose post-processing failed or
+        never ran are removed from the download archive again, to be downloaded by the next attempt or sync."""
+        for _, _, future in self._post_jobs:
+            future.cancel()
+        wait_futures([future for _, _, future in self._post_jobs])
+        unfinished = {archive_id for _, archive_id, future in self._post_jobs
+                      if future.cancelled() or future.exception() is not None}
+        if unfinished and self.ydl_opts.get('download_archive'):
+            forget_archived(self.ydl_opts['download_archive'], unfinished)
+
+    def remove_partials(self):
+        """Deletes the partial files (and fragment/resume files) of the downloads seen so far."""
+        for tmp, final in self._partials:
+            if not tmp or tmp == final:
+                continue
+            for path in [tmp, f"{final}.ytdl", *glob.glob(f"{glob.escape(tmp)}-Frag*")]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
     def progress_hook(self, d):
+        if self._cancelled:
+            raise yt_dlp.utils.DownloadCancelled()
         if d['status'] == 'downloading':
-            self.progress.emit(d)
+            self._partials.add((d.get('tmpfilename'), d.get('filename')))
+        if self.limit_bandwidth and d['status'] == 'downloading':
+            key = d.get('tmpfilename') or d.get('filename')
+            downloaded = d.get('downloaded_bytes') or 0
+            delta = downloaded - self._received.get(key, 0)
+            self._received[key] = downloaded
+            if delta > 0:
+                self.limit_bandwidth(delta)
+        if d['status'] in ('downloading', 'finished'):
+            record = self.throttle.update(d)
+            if record is not None:
+                self.progress.emit(record)
+
+class DirectDownloadWorker(QThread):
+    """Downloads a direct file link with `HTTPDownloader` (parallel Range requests, resumable).
+    Same signals and cancel interface as `DownloadWorker`, so the queue treats both alike."""
+    finished = pyqtSignal(dict)
+    progress = pyqtSignal(dict)
+    log_message = pyqtSignal(str)
+
+    def __init__(self, url, path, connections=4, progress_rate=10, limit_bandwidth=None):
+        super().__init__()
+        self.url = url
+        self.path = path
+        self.connections = connections
+        self.throttle = ProgressThrottle(progress_rate)
+        self.limit_bandwidth = limit_bandwidth
+        self._cancelled = False
+        self.keep_partial = True
+
+    def cancel(self, keep_partial=True):
+        """Asks the download to stop at the next received block.
+        With `keep_partial` the `.part` file and its resume data stay on disk."""
+        self.keep_partial = keep_partial
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        try:
+            downloader = HTTPDownloader(self.url, self.path, self.connections, progress=self.progress_hook,
+                                        is_cancelled=self.is_cancelled, limit_bandwidth=self.limit_bandwidth)
+            self.log_message.emit(f"⚡ Direct download over {self.connections} connections: {self.path}")
+            result = downloader.download()
+            if result.get('Cancelled'):
+                if not self.keep_partial:
+                    for path in (downloader.part_path, downloader.state_path):
+                        try:
+                            os.remove(path)
+                        except OSError:
+                            pass
+                result = {'State': False, 'Cancelled': True, 'Partial': self.keep_partial,
+                          'Error': 'Download cancelled'}
+            elif result.get('State'):
+                self.log_message.emit(f"✅ Saved {result['Path']} ({DownloadPage._format_bytes(result['Size'])})")
+                result['Files'] = [{'path': result['Path'], 'expected_size': result['Expected'],
+                                    'expected_duration': None}]
+            self.finished.emit(result)
+        except Exception as e:
+            self.finished.emit({'State': False, 'Error': f'Unexpected error: {str(e)}'})
+
+    def progress_hook(self, d):
+        record = self.throttle.update(d)
+        if record is not None:
+            self.progress.emit(record)
+
+class MetadataFetchWorker(QThread):
+    """
+    Runs `extract_info` for a video or playlist URL off the GUI thread.
+    Emits `finished` with the raw info plus the `data`/`formats` used by
+    `MetadataDisplayWidget` and `FormatSelectionDialog`.
+    """
+    finished = pyqtSignal(dict)
+    log_message = pyqtSignal(str)
+
+    def __init__(self, url, media_type):
+        super().__init__()
+        self.url = url
+        self.media_type = media_type
+        self._cancelled = False
+
+    def cancel(self):
+        """Ask the worker to stop; yt-dlp is aborted at its next log message."""
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        try:
+            ydl_opts = {'skip_download': True, 'playlistend': 1, 'quiet': True,
+                        'logger': YtdlpLogger(self.log_message, self.is_cancelled)}
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(self.url, download=False)
+            if self._cancelled:
+                self.finished.emit({'State': False, 'Cancelled': True, 'URL': self.url})
+                return
+
+            if self.media_type == 'playlist':
+                data, formats = self.playlist_data(info), []
+            else:
+                data, formats = self.video_data(info), self.video_formats(info)
+            self.finished.emit({'State': True, 'URL': self.url, 'Info': trim_info(info), 'Data': data, 'Formats': formats})
+        except yt_dlp.utils.DownloadCancelled:
+            self.finished.emit({'State': False, 'Cancelled': True, 'URL': self.url})
+        except Exception as e:
+            self.finished.emit({'State': False, 'URL': self.url, 'Error': str(e)})
+
+    @staticmethod
+    def video_data(info):
+        return {
+            "title": info.get("title"),
+            "description": info.get("description"),
+            "view_count": info.get("view_count"),
+            "like_count": info.get("like_count"),
+            "upload_date": info.get("upload_date"),
+            "channel": info.get("channel"),
+            "uploader": info.get("uploader"),
+            'duration': info.get("duration"),
+            'thumbnail': info.get("thumbnail"),
+            "webpage_url_domain": info.get("webpage_url_domain"),
+            "_type": info.get("_type")
+        }
+
+    @staticmethod
+    def playlist_data(info):
+        return {
+            "title": info.get("title"),
+            "description": info.get("description"),
+            "modified_date": info.get("modified_date"),
+            "view_count": info.get("view_count"),
+            "playlist_count": info.get("playlist_count"),
+            "channel": info.get("channel"),
+            'uploader': info.get("uploader"),
+            'thumbnail': info.get("thumbnail"),
+            "webpage_url_domain": info.get("webpage_url_domain"),
+            "_type": info.get("_type")
+        }
+
+    @staticmethod
+    def video_formats(info):
+        formats = []
+        for f in info.get('formats', []):
+            fs = f.get('filesize')
+            fs_str = f"{round(fs / (1024*1024), 2)}MB" if fs else 'N/A'
+            formats.append((
+                f.get('format_id', 'N/A'),
+                f.get('ext', 'N/A'),
+                f.get('height', 'N/A'),
+                f.get('format_note', 'N/A'),
+                f.get('quality', 'N/A'), 
+                fs_str
+            ))
+        return formats
+
+class BatchPrefetchWorker(QThread):
+    """
+    Fetches the metadata of many URLs with at most `workers` `extract_info` calls at a time.
+    Cached entries are used as they are, fetched ones are added to the metadata cache, so opening
+    an imported URL in the single video/playlist view afterwards is instant.
+    Emits `fetched` per URL with `State`, `Type` (`video`/`playlist`) and `Info` or `Error`.
+    """
+    fetched = pyqtSignal(str, dict)
+    finished = pyqtSignal(dict)
+    log_message = pyqtSignal(str)
+
+    def __init__(self, urls, cache, workers=4):
+        super().__init__()
+        self.urls = list(urls)
+        self.cache = cache
+        self.workers = max(1, workers)
+        self._cancelled = False
+
+    def cancel(self):
+        """Stops starting new fetches, the running ones are aborted at their next log message."""
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        counts = {'ok': 0, 'failed': 0, 'cached': 0}
+        with ThreadPoolExecutor(self.workers) as pool:
+            futures = {pool.submit(self.fetch, url): url for url in self.urls}
+            for future in as_completed(futures):
+                if self._cancelled:
+                    pool.shutdown(cancel_futures=True)
+                    break
+                result = future.result()
+                counts['ok' if result['State'] else 'failed'] += 1
+                counts['cached'] += bool(result.get('Cached'))
+                self.fetched.emit(futures[future], result)
+        self.finished.emit(dict(counts, Cancelled=self._cancelled))
+
+    def fetch(self, url):
+        if self._cancelled:
+            return {'State': False, 'Error': 'Cancelled'}
+        # Links with both a video and a playlist (`watch?v=...&list=...`) are playlists, as in `normalize_url`
+        is_playlist = normalize_url(url) != normalize_url(url, 'video')
+        for media_type in (('playlist', 'video') if is_playlist else ('video', 'playlist')):
+            cached = self.cache.get(url, media_type)
+            if cached is not None:
+                return {'State': True, 'Type': media_type, 'Info': cached['Info'], 'Cached': True}
+        try:
+            ydl_opts = {'skip_download': True, 'playlistend': 1, 'quiet': True, 'no_warnings': True,
+                        'logger': YtdlpLogger(self.log_message, self.is_cancelled)}
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(url, download=False)
+            if info.get('_type') == 'playlist' or info.get('playlist_count'):
+                media_type, data, formats = 'playlist', MetadataFetchWorker.playlist_data(info), []
+            else:
+                media_type = 'video'
+                data, formats = MetadataFetchWorker.video_data(info), MetadataFetchWorker.video_formats(info)
+            trimmed = trim_info(info)
+            try:
+                self.cache.put(url, media_type, trimmed, data, formats)
+            except Exception:
+                pass
+            return {'State': True, 'Type': media_type, 'Info': trimmed}
+        except yt_dlp.utils.DownloadCancelled:
+            return {'State': False, 'Error': 'Cancelled'}
+        except Exception as e:
+            return {'State': False, 'Error': str(e)}
+
+class PlaylistEntriesWorker(QThread):
+    """
+    Lists the entries of a playlist with flat extraction (id, title, duration only).
+    Entries are emitted in small batches as yt-dlp pages through the playlist,
+    so the UI can show them long before the whole playlist is enumerated.
+    """
+    entries_found = pyqtSignal(list)
+    finished = pyqtSignal(dict)
+    log_message = pyqtSignal(str)
+    BATCH_SIZE = 50
+    BATCH_INTERVAL = 0.3
+
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        count = 0
+        try:
+            ydl_opts = {'extract_flat': 'in_playlist', 'skip_download': True, 'quiet': True,
+                        'logger': YtdlpLogger(self.log_message, self.is_cancelled)}
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(self.url, download=False, process=False)
+                # Some links (e.g. watch?v=...&list=...) first resolve to the playlist URL
+                for _ in range(3):
+                    if info.get('_type') not in ('url', 'url_transparent'):
+                        break
+                    info = ydl.extract_info(info['url'], download=False, process=False)
+
+                batch, last_emit = [], time.monotonic()
+                for entry in info.get('entries') or []:
+                    if self._cancelled:
+                        raise yt_dlp.utils.DownloadCancelled()
+                    count += 1
+                    if not entry:
+                        continue
+                    batch.append({
+                        'index': count,
+                        'id': entry.get('id') or str(count),
+                        'title': entry.get('title') or entry.get('url'),
+                        'duration': entry.get('duration'),
+                        'url': entry.get('webpage_url') or entry.get('url'),
+                    })
+                    if len(batch) >= self.BATCH_SIZE or time.monotonic() - last_emit >= self.BATCH_INTERVAL:
+                        self.entries_found.emit(batch)
+                        batch, last_emit = [], time.monotonic()
+                if batch:
+                    self.entries_found.emit(batch)
+            self.finished.emit({'State': True, 'Count': count})
+        except yt_dlp.utils.DownloadCancelled:
+            self.finished.emit({'State': False, 'Cancelled': True})
+        except Exception as e:
+            self.finished.emit({'State': False, 'Error': str(e), 'Count': count})
+
+class EntryDetailsSignals(QObject):
+    resolved = pyqtSignal(int, str, dict)
+
+class EntryDetailsTask(QRunnable):
+    """
+    Resolves the full metadata of one playlist entry on a `QThreadPool` thread.
+    The result is stored in the metadata cache, so opening the entry as a single video is instant.
+    """
+    def __init__(self, generation, entry_id, url, signals, cache):
+        super().__init__()
+        self.generation = generation
+        self.entry_id = entry_id
+        self.url = url
+        self.signals = signals
+        self.cache = cache
+
+    def run(self):
+        try:
+            with yt_dlp.YoutubeDL({'skip_download': True, 'quiet': True, 'no_warnings': True}) as ydl:
+                info = ydl.extract_info(self.url, download=False)
+            trimmed = trim_info(info)
+            try:
+                self.cache.put(self.url, 'video', trimmed, MetadataFetchWorker.video_data(info),
+                               MetadataFetchWorker.video_formats(info))
+            except Exception:
+                pass
+            self.signals.resolved.emit(self.generation, self.entry_id, trimmed)
+        except Exception as e:
+            self.signals.resolved.emit(self.generation, self.entry_id, {'Error': str(e)})
+
+class ThumbnailSignals(QObject):
+    decoded = pyqtSignal(str, QImage)
+
+class ThumbnailTask(QRunnable):
+    """
+    Downloads (through the disk `HTTPCache`), decodes and scales one thumbnail on a `QThreadPool` thread.
+    Emits a null `QImage` on failure. Only the `QPixmap` conversion is left for the GUI thread.
+    """
+    def __init__(self, url, size, cache, signals):
+        super().__init__()
+        self.url = url
+        self.size = size
+        self.cache = cache
+        self.signals = signals
+
+    def run(self):
+        image = QImage()
+        try:
+            cached = self.cache.fetch(self.url, accept='image')
+            with open(cached['path'], 'rb') as f:
+                if image.loadFromData(f.read()):
+                    image = image.scaled(self.size, Qt.AspectRatioMode.KeepAspectRatio,
+                                         Qt.TransformationMode.SmoothTransformation)
+        except Exception:
+            image = QImage()
+        self.signals.decoded.emit(self.url, image)
+
+class ThumbnailLoader(QObject):
+    """
+    Loads thumbnail previews without blocking the GUI. Scaled pixmaps of the last `capacity` URLs are kept
+    in memory (least recently used dropped first), the downloaded images in the disk `HTTPCache`, so previews
+    seen before show instantly and previews of earlier sessions cost no network while fresh.
+    """
+    loaded = pyqtSignal(str, QPixmap)
+
+    def __init__(self, parent=None, size=QSize(320, 180), capacity=64):
+        super().__init__(parent)
+        self.size = size
+        self.capacity = capacity
+        self.memory = OrderedDict()  # url -> QPixmap, most recently used last
+        self.pending = set()
+        self.cache = HTTPCache()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self.signals = ThumbnailSignals(self)
+        self.signals.decoded.connect(self._on_decoded)
+
+    def request(self, url):
+        """Returns the cached pixmap of `url`, or None and emits `loaded` once it is ready."""
+        pixmap = self.memory.get(url)
+        if pixmap is not None:
+            self.memory.move_to_end(url)
+            return pixmap
+        if url not in self.pending:
+            self.pending.add(url)
+            self.pool.start(ThumbnailTask(url, self.size, self.cache, self.signals))
+        return None
+
+    def _on_decoded(self, url, image):
+        self.pending.discard(url)
+        pixmap = QPixmap.fromImage(image)  # Null for failed loads, the display keeps its placeholder
+        if not pixmap.isNull():
+            self.memory[url] = pixmap
+            while len(self.memory) > self.capacity:
+                self.memory.popitem(last=False)
+        self.loaded.emit(url, pixmap)
+
+class DownloadQueueManager(QObject):
+    """
+    Runs the items of a `DownloadQueue` with at most `max_concurrent` workers at a time: `DownloadWorker`,
+    or `DirectDownloadWorker` for items marked `direct` (plain file links).
+    Workers are released as soon as they finish and the queue is saved after every change.
+    Running workers share the queue's `rate_limit` through a `BandwidthScheduler`, weighted by priority,
+    and hand their post-processing to one `PostProcessPool` of `postprocess_workers` jobs.
+    The bytes done by running items are saved every `save_interval` seconds, so a crash loses little.
+    With `verify_downloads`, the files of finished items are checked by a `DownloadVerifier` while the
+    next downloads run. Broken files are deleted and their item queued again, at most `verify_retries` times.
+    The speed, ETA and retries of every item are recorded by a `SpeedRecorder`, its summary is added to the
+    result as `Stats`.
+    Failures (and playlist entries skipped by `ignoreerrors`) are classified by `classify`: throttled and
+    transient ones wait in the queue (`Waiting`) for a `RetryPolicy` backoff delay, then run again.
+    Permanent failures, and items out of retries, stay `Failed` with their `failure` kind until
+    `retry_failed` queues them again. While an item waits, `item_finished` is not emitted.
+    """
+    item_started = pyqtSignal(str)
+    item_progress = pyqtSignal(str, dict)
+    item_log = pyqtSignal(str, str)
+    item_finished = pyqtSignal(dict, dict)
+    item_verified = pyqtSignal(dict, dict)
+    queue_changed = pyqtSignal()
+    _files_checked = pyqtSignal(dict, list)  # emitted on a verifier thread, handled on the GUI thread
+
+    save_interval = 2.0
+    verify_retries = 2
+    # Queue bookkeeping, not part of the download parameters queued again after a failed check
+    queue_fields = ('id', 'priority', 'order', 'state', 'added', 'downloaded', 'total', 'error',
+                    'retry_attempts', 'retry_at', 'failure')
+
+    def __init__(self, queue, parent=None, progress_rate=10):
+        super().__init__(parent)
+        self.queue = queue
+        self.progress_rate = progress_rate
+        self.workers = {}
+        self._last_save = 0.0
+        self.bandwidth = BandwidthScheduler(queue.rate_limit)
+        self.postprocess_pool = PostProcessPool(queue.postprocess_workers)
+        self.verifier = DownloadVerifier()
+        self.speed_logs = {}  # item id -> SpeedRecorder
+        self._files_checked.connect(self._on_files_checked)
+        self.retry_policy = RetryPolicy()
+        self.retry_timers = {}  # item id -> QTimer of its retry
+        # Retries scheduled by the previous session keep their time (overdue ones run right away)
+        for item in self.queue.waiting():
+            self._arm_retry(item['id'], item.get('retry_at', 0) - time.time())
+
+    def enqueue(self, params, priority=0):
+        """Adds a download to the queue and starts it if a slot is free. Returns the item id."""
+        item_id = self.queue.add(params, priority)
+        self._changed()
+        return item_id
+
+    def set_max_concurrent(self, count):
+        self.queue.max_concurrent = max(1, count)
+        self._changed()
+
+    def set_rate_limit(self, rate):
+        """Changes the total download rate (bytes per second, 0 for unlimited), running downloads included."""
+        self.queue.rate_limit = max(0, rate)
+        self.bandwidth.set_rate(self.queue.rate_limit)
+        self._changed()
+
+    def set_postprocess_workers(self, count):
+        """Changes how many post-processing (ffmpeg) jobs run at the same time, for all downloads."""
+        self.queue.postprocess_workers = max(1, count)
+        self.postprocess_pool.set_workers(self.queue.postprocess_workers)
+        self._changed()
+
+    def set_verify_downloads(self, enabled):
+        """Turns the integrity check of finished downloads on or off."""
+        self.queue.verify_downloads = bool(enabled)
+        self._changed()
+
+    def set_priority(self, item_id, priority):
+        self.queue.set_priority(item_id, priority)
+        self.bandwidth.set_weight(item_id, BandwidthScheduler.weight_for_priority(priority))
+        self._changed()
+
+    def move(self, item_id, step):
+        self.queue.move(item_id, step)
+        item = self.queue.get(item_id)
+        if item is not None:
+            self.bandwidth.set_weight(item_id, BandwidthScheduler.weight_for_priority(item['priority']))
+        self._changed()
+
+    def pause(self, item_id):
+        self.queue.pause(item_id)
+        self._changed()
+
+    def resume(self, item_id):
+        self.queue.resume(item_id)
+        self._changed()
+
+    def resume_interrupted(self):
+        """Queues again every download interrupted by the end of the previous session."""
+        for item in self.queue.interrupted():
+            self.queue.resume(item['id'])
+        self._changed()
+
+    def remove(self, item_id):
+        if item_id not in self.workers:
+            self.queue.remove(item_id)
+            self._changed()
+
+    def cancel(self, item_id, keep_partial=True):
+        """Stops a download. A running one keeps its partial files (and is paused in the queue) when
+        `keep_partial` is set, otherwise the partial files are deleted and the item is removed.
+        Pending items are simply removed."""
+        worker = self.workers.get(item_id)
+        if worker is None:
+            item = self.queue.get(item_id)
+            if item is not None and item['state'] == WAITING:
+                # Ends a download waiting for its retry as if it had been cancelled while running
+                self._stop_retry(item_id)
+                if keep_partial:
+                    self.queue.set_state(item_id, PAUSED)
+                else:
+                    self.queue.remove(item_id)
+                self.item_finished.emit(item, {'State': False, 'Cancelled': True, 'Partial': keep_partial,
+                                               'Error': 'Download cancelled'})
+                self._changed()
+                return
+            self.remove(item_id)
+            return
+        worker.cancel(keep_partial)
+        # Release a worker waiting for bandwidth right away
+        self.bandwidth.unregister(item_id)
+
+    def retry_failed(self):
+        """Queues again every failed item (and only those), with a fresh set of automatic retries."""
+        for item in self.queue.failed():
+            self.queue.resume(item['id'])
+            item.update(retry_attempts=0, failure=None)
+        self._changed()
+
+    def _retry_later(self, item, errors):
+        """Puts a failed item in `Waiting` for a backoff delay when its errors can be retried.
+        Returns False (and records the failure kind) when it cannot."""
+        kinds = {classify(e) for e in errors}
+        kind = THROTTLED if THROTTLED in kinds else TRANSIENT if TRANSIENT in kinds else PERMANENT
+        attempts = item.get('retry_attempts', 0)
+        if not self.retry_policy.should_retry(kind, attempts):
+            item['failure'] = kind if kind == PERMANENT else 'retries exhausted'
+            return False
+        delay = self.retry_policy.delay(kind, attempts, item.get('url'))
+        error = next(e for e in errors if classify(e) == kind)
+        self.queue.set_state(item['id'], WAITING, retry_attempts=attempts + 1, retry_at=time.time() + delay,
+                             error=error, failure=kind)
+        self._arm_retry(item['id'], delay)
+        what = f"{len(errors)} entries failed" if item.get('type') == 'playlist' else f"{kind.capitalize()} failure"
+        self.item_log.emit(item['id'], f"🔁 {what}, retry {attempts + 1}/{self.retry_policy.max_attempts} "
+                                       f"in {delay:.0f}s: {error}")
+        return True
+
+    def _arm_retry(self, item_id, delay):
+        self._stop_retry(item_id)
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda i=item_id: self._retry_due(i))
+        timer.start(int(max(0, delay) * 1000))
+        self.retry_timers[item_id] = timer
+
+    def _stop_retry(self, item_id):
+        timer = self.retry_timers.pop(item_id, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+
+    def _retry_due(self, item_id):
+        self._stop_retry(item_id)
+        item = self.queue.get(item_id)
+        # Paused, resumed or removed while waiting: nothing to do
+        if item is not None and item['state'] == WAITING:
+            self.queue.resume(item_id)
+            self._changed()
+
+    def _changed(self):
+        self.schedule()
+        self.save()
+        self.queue_changed.emit()
+
+    def save(self):
+        try:
+            self.queue.save()
+        except OSError as e:
+            self.item_log.emit('', f"⚠️ Could not save download queue: {e}")
+
+    def schedule(self):
+        """Starts queued items while there are free download slots."""
+        while len(self.workers) < self.queue.max_concurrent:
+            item = self.queue.next()
+            if item is None:
+                break
+            self._start(item)
+
+    def _start(self, item):
+        item_id = item['id']
+        try:
+            self.bandwidth.register(item_id, BandwidthScheduler.weight_for_priority(item.get('priority', 0)))
+            limit_bandwidth = lambda n, i=item_id: self.bandwidth.consume(i, n)
+            if item.get('direct'):
+                worker = DirectDownloadWorker(item['url'], item['opts']['path'], item['opts']['connections'],
+                                              self.progress_rate, limit_bandwidth)
+            else:
+                worker = DownloadWorker(item['url'], item['opts'], self.progress_rate,
+                                        item.get('parallel_entries', 1), limit_bandwidth,
+                                        item.get('section'), self.postprocess_pool)
+            worker.progress.connect(lambda d, i=item_id: self._on_worker_progress(i, d))
+            worker.log_message.connect(lambda m, i=item_id: self._on_worker_log(i, m))
+            worker.finished.connect(lambda r, i=item_id: self._on_worker_finished(i, r))
+            self.workers[item_id] = worker
+            self.speed_logs[item_id] = SpeedRecorder(os.path.join(
+                SpeedRecorder.default_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{item_id}.spd"))
+            self.queue.set_state(item_id, RUNNING)
+            worker.start()
+            self.item_started.emit(item_id)
+            if item.get('downloaded'):
+                # The `.part` files left on disk are continued instead of downloaded again
+                self.item_log.emit(item_id, f"↩️ Resuming, {DownloadPage._format_bytes(item['downloaded'])} "
+                                            f"were already downloaded")
+        except Exception as e:
+            self.workers.pop(item_id, None)
+            self.speed_logs.pop(item_id, None)
+            self.bandwidth.unregister(item_id)
+            self.queue.set_state(item_id, FAILED, error=str(e))
+            self.item_finished.emit(item, {'State': False, 'Error': f'Failed to start background process: {e}'})
+
+    def _on_worker_progress(self, item_id, d):
+        if item_id in self.speed_logs:
+            self.speed_logs[item_id].sample(d)
+        item = self.queue.get(item_id)
+        if item is not None and d.get('downloaded'):
+            item['downloaded'], item['total'] = d['downloaded'], d.get('total')
+            now = time.monotonic()
+            if now - self._last_save >= self.save_interval:
+                self._last_save = now
+                self.save()
+        self.item_progress.emit(item_id, d)
+
+    def _on_worker_log(self, item_id, msg):
+        if 'Retrying' in msg and item_id in self.speed_logs:
+            self.speed_logs[item_id].retry()
+        self.item_log.emit(item_id, msg)
+
+    def _on_worker_finished(self, item_id, result):
+        worker = self.workers.pop(item_id, None)
+        self.bandwidth.unregister(item_id)
+        recorder = self.speed_logs.pop(item_id, None)
+        if recorder is not None:
+            try:
+                result = dict(result, Stats=recorder.close())
+            except OSError as e:
+                self.item_log.emit(item_id, f"⚠️ Could not save the speed samples: {e}")
+        if worker is not None:
+            worker.wait()
+            worker.deleteLater()
+        item = self.queue.get(item_id) or {'id': item_id}
+        if result.get('Cancelled'):
+            # Kept partial files are resumed when the item is resumed (both workers continue `.part` files)
+            if result.get('Partial'):
+                self.queue.set_state(item_id, PAUSED, error=None)
+            else:
+                self.queue.remove(item_id)
+        elif result.get('State'):
+            errors = result.get('EntryErrors')
+            if errors and self._retry_later(item, errors):
+                self._changed()
+                return
+            self.retry_policy.succeeded(item.get('url'))
+            if errors:
+                # Kept as failed so a later "retry failed" runs the playlist again, skipping the files on disk
+                self.queue.set_state(item_id, FAILED, error=f"{len(errors)} entries failed: {errors[0]}")
+            else:
+                self.queue.remove(item_id)
+                item.pop('failure', None)
+            if self.queue.verify_downloads and result.get('Files'):
+                self.verifier.submit(result['Files'], (item.get('opts') or {}).get('ffmpeg_location'),
+                                     lambda results, i=item: self._files_checked.emit(i, results))
+        else:
+            if self._retry_later(item, [result.get('Error')]):
+                self._changed()
+                return
+            self.queue.set_state(item_id, FAILED, error=result.get('Error'))
+        self.item_finished.emit(item, result)
+        self._changed()
+
+    def _on_files_checked(self, item, results):
+        """Reports the integrity check of a finished item, and queues it again when a file is broken.
+        Only the broken files are deleted, so a playlist downloads just those entries again."""
+        broken = [r for r in results if not r['State']]
+        attempts = item.get('verify_attempts', 0)
+        requeue = bool(broken) and attempts < self.verify_retries
+        if requeue:
+            for r in broken:
+                try:
+                    os.remove(r['File'])
+                except (OSError, TypeError):
+                    pass
+            archive = (item.get('opts') or {}).get('download_archive')
+            if archive:
+                # Archived entries are skipped, the broken ones have to be downloaded again
+                forget_archived(archive, {r['Archive'] for r in broken if r.get('Archive')})
+            params = {k: v for k, v in item.items() if k not in self.queue_fields}
+            params['verify_attempts'] = attempts + 1
+            self.enqueue(params, item.get('priority', 0))
+        if broken:
+            summary = {'State': False, 'Requeued': requeue, 'Results': results,
+                       'Error': '; '.join(f"{os.path.basename(r['File'] or '?')}: {r['Error']}" for r in broken)}
+        else:
+            summary = {'State': True, 'Requeued': False, 'Results': results,
+                       'Message': f"{len(results)} file(s) verified: "
+                                  + '; '.join(f"{os.path.basename(r['File'])}: {r['Message']}" for r in results)}
+        self.item_verified.emit(item, summary)
 
 class FormatSelectionDialog(QDialog):
-    def __init__(self, formats, parent=None):
+    def __init__(self, formats, parent=None, info=None):
         super().__init__(parent)
         self.setWindowTitle("Select Format")
         self.setMinimumSize(900, 600)
         self.setStyleSheet(STYLESHEET)
         self.available_ids = set() 
+        # Raw format dicts and duration (trimmed info) used by the automatic selection
+        self.info = info or {}
+        self.auto_mp4 = False
         
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
@@ -250,6 +1172,46 @@ class FormatSelectionDialog(QDialog):
         self.table.itemSelectionChanged.connect(self.on_selection_changed)
         layout.addWidget(self.table)
         
+        # Automatic Selection from constraints
+        if self.info.get('formats'):
+            auto_frame = QFrame()
+            auto_frame.setProperty("class", "card")
+            auto_layout = QVBoxLayout(auto_frame)
+            auto_row = QHBoxLayout()
+            auto_row.addWidget(QLabel("Max size:"))
+            self.auto_size_spin = QSpinBox()
+            self.auto_size_spin.setRange(0, 100000)
+            self.auto_size_spin.setSingleStep(50)
+            self.auto_size_spin.setSuffix(" MB")
+            self.auto_size_spin.setSpecialValueText("No limit")
+            auto_row.addWidget(self.auto_size_spin)
+            auto_row.addWidget(QLabel("Best up to:"))
+            self.auto_height_combo = QComboBox()
+            self.auto_height_combo.addItems(['Any resolution', '2160p', '1440p', '1080p', '720p', '480p', '360p'])
+            auto_row.addWidget(self.auto_height_combo)
+            self.auto_codec_combo = QComboBox()
+            self.auto_codec_combo.addItems(list(CODEC_PREFERENCES))
+            auto_row.addWidget(self.auto_codec_combo)
+            self.auto_mp4_check = QCheckBox("MP4 without re-encode")
+            auto_row.addWidget(self.auto_mp4_check)
+            self.auto_audio_check = QCheckBox("Audio only")
+            auto_row.addWidget(self.auto_audio_check)
+            auto_btn = QPushButton("Pick Best That Fits")
+            auto_btn.setToolTip("Highest resolution within the limits, then the preferred codec, then the smallest size")
+            auto_btn.setProperty("class", "primary")
+            auto_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            auto_btn.clicked.connect(lambda: self.pick_automatically())
+            auto_row.addWidget(auto_btn)
+            small_btn = QPushButton("Pick Smallest")
+            small_btn.setToolTip("Smallest estimated size within the limits, then the preferred codec")
+            small_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            small_btn.clicked.connect(lambda: self.pick_automatically(smallest=True))
+            auto_row.addWidget(small_btn)
+            auto_layout.addLayout(auto_row)
+            self.auto_result_label = QLabel("Pick the best format that fits the constraints")
+            auto_layout.addWidget(self.auto_result_label)
+            layout.addWidget(auto_frame)
+        
         # Manual Input
         input_frame = QFrame()
         input_frame.setProperty("class", "card")
@@ -306,6 +1268,34 @@ class FormatSelectionDialog(QDialog):
         self.format_input.setText('+'.join(format_ids))
         self.error_label.setVisible(False) 
 
+    def pick_automatically(self, smallest=False):
+        height = self.auto_height_combo.currentText()
+        choice = select_format(
+            self.info['formats'], self.info.get('duration'),
+            max_size=self.auto_size_spin.value() * 1024 * 1024 or None,
+            max_height=int(height[:-1]) if height.endswith('p') else None,
+            prefer_codecs=CODEC_PREFERENCES[self.auto_codec_combo.currentText()],
+            mp4=self.auto_mp4_check.isChecked(),
+            audio_only=self.auto_audio_check.isChecked(),
+            smallest=smallest)
+        if choice is None:
+            self.auto_result_label.setText("❌ No format matches these constraints")
+            return
+        self.table.blockSignals(True)
+        self.table.clearSelection()
+        self.table.blockSignals(False)
+        self.format_input.setText(choice['format'])
+        self.error_label.setVisible(False)
+        self.auto_mp4 = self.auto_mp4_check.isChecked() and not self.auto_audio_check.isChecked()
+
+        parts = []
+        if choice['video']:
+            parts.append(f"{choice['height'] or '?'}p {choice['video'].get('vcodec', '?').split('.')[0]}")
+        if choice['audio']:
+            parts.append(f"{choice['audio'].get('acodec', '?').split('.')[0]} audio")
+        size = DownloadPage._format_bytes(choice['size']) if choice['size'] else 'unknown size'
+        self.auto_result_label.setText(f"✅ {choice['format']}: {' + '.join(parts)} · estimated total {size}")
+
     def confirm_selection(self):
         text = self.format_input.text().strip()
         if not text:
@@ -334,7 +1324,7 @@ class FormatSelectionDialog(QDialog):
         return "bestvideo+bestaudio"
 
 class DownloadOptionsDialog(QDialog):
-    def __init__(self, media_type, parent=None):
+    def __init__(self, media_type, parent=None, selected_items=None):
         super().__init__(parent)
         self.setWindowTitle("Download Options")
         self.setMinimumWidth(550)
@@ -356,7 +1346,7 @@ class DownloadOptionsDialog(QDialog):
         merge_layout = QHBoxLayout()
         merge_layout.addWidget(QLabel("Merge/Convert to:"))
         self.merge_combo = QComboBox()
-        self.merge_combo.addItems(['original', 'mp4', 'mp3']) 
+        self.merge_combo.addItems(['original', 'mp4', 'audio (original, no re-encode)', 'mp3 (re-encode)'])
         merge_layout.addWidget(self.merge_combo, 1)
         card_layout.addLayout(merge_layout)
         
@@ -372,8 +1362,72 @@ class DownloadOptionsDialog(QDialog):
         card_layout.addLayout(sub_layout)
         
         self.subtitle_check.toggled.connect(self.subtitle_input.setEnabled)
+        
+        # Clip (time range), single videos only
+        if media_type == "video":
+            clip_layout = QHBoxLayout()
+            clip_layout.addWidget(QLabel("Clip:"))
+            self.clip_start_input = QLineEdit()
+            self.clip_start_input.setPlaceholderText("Start e.g. 00:01:30")
+            self.clip_end_input = QLineEdit()
+            self.clip_end_input.setPlaceholderText("End e.g. 00:02:00")
+            clip_layout.addWidget(self.clip_start_input)
+            clip_layout.addWidget(self.clip_end_input)
+            card_layout.addLayout(clip_layout)
+            
+            self.clip_error_label = QLabel("")
+            self.clip_error_label.setStyleSheet(f"color: {THEME_ERROR}; font-weight: bold; font-size: 13px;")
+            self.clip_error_label.setVisible(False)
+            card_layout.addWidget(self.clip_error_label)
+        
         layout.addWidget(card)
         
+        # Performance Options
+        perf_card = QFrame()
+        perf_card.setProperty("class", "card")
+        perf_layout = QVBoxLayout(perf_card)
+        perf_layout.addWidget(QLabel("Performance"))
+        
+        self.fragment_spin = QSpinBox()
+        self.fragment_spin.setRange(1, 16)
+        self.fragment_spin.setValue(1)
+        self.fragment_spin.setToolTip("Fragments of DASH/HLS formats downloaded at the same time.\n"
+                                      "Direct file links use this many connections (4 when left at 1)")
+        
+        self.chunk_spin = QSpinBox()
+        self.chunk_spin.setRange(0, 100)
+        self.chunk_spin.setValue(0)
+        self.chunk_spin.setSpecialValueText("Off")
+        self.chunk_spin.setSuffix(" MB")
+        self.chunk_spin.setToolTip("Download plain HTTP formats in requests of this size (helps against throttling)")
+        
+        self.buffer_spin = QSpinBox()
+        self.buffer_spin.setRange(0, 16384)
+        self.buffer_spin.setValue(0)
+        self.buffer_spin.setSpecialValueText("Default")
+        self.buffer_spin.setSuffix(" KiB")
+        self.buffer_spin.setToolTip("Initial read buffer of HTTP downloads (yt-dlp adapts it while downloading)")
+        
+        for text, spin in (("Concurrent fragments:", self.fragment_spin),
+                           ("HTTP chunk size:", self.chunk_spin),
+                           ("Buffer size:", self.buffer_spin)):
+            row = QHBoxLayout()
+            row.addWidget(QLabel(text))
+            row.addWidget(spin)
+            perf_layout.addLayout(row)
+        
+        if media_type == "playlist":
+            self.parallel_spin = QSpinBox()
+            self.parallel_spin.setRange(1, 8)
+            self.parallel_spin.setValue(1)
+            self.parallel_spin.setToolTip("Playlist entries downloaded at the same time")
+            row = QHBoxLayout()
+            row.addWidget(QLabel("Parallel entries:"))
+            row.addWidget(self.parallel_spin)
+            perf_layout.addLayout(row)
+        
+        layout.addWidget(perf_card)
+        
         # Playlist Specific Options
         if media_type == "playlist":
             playlist_card = QFrame()
@@ -407,9 +1461,34 @@ class DownloadOptionsDialog(QDialog):
             quality_layout.addWidget(self.quality_combo)
             p_layout.addLayout(quality_layout)
             
+            constraint_layout = QHBoxLayout()
+            constraint_layout.addWidget(QLabel("Codec:"))
+            self.codec_combo = QComboBox()
+            self.codec_combo.addItems(list(CODEC_PREFERENCES))
+            constraint_layout.addWidget(self.codec_combo)
+            constraint_layout.addWidget(QLabel("Max size per stream:"))
+            self.entry_size_spin = QSpinBox()
+            self.entry_size_spin.setRange(0, 100000)
+            self.entry_size_spin.setSingleStep(50)
+            self.entry_size_spin.setSuffix(" MB")
+            self.entry_size_spin.setSpecialValueText("No limit")
+            constraint_layout.addWidget(self.entry_size_spin)
+            self.smallest_check = QCheckBox("Smallest files")
+            self.smallest_check.setToolTip("Prefer the smallest format of each entry over the highest resolution")
+            constraint_layout.addWidget(self.smallest_check)
+            p_layout.addLayout(constraint_layout)
+            
+            self.sync_check = QCheckBox("Keep in sync (later syncs download only new entries)")
+            p_layout.addWidget(self.sync_check)
+            
             layout.addWidget(playlist_card)
             
             self.playlist_option.currentIndexChanged.connect(self.toggle_playlist_inputs)
+            
+            # Entries picked in the playlist entries table
+            if selected_items:
+                self.playlist_option.setCurrentIndex(2)
+                self.playlist_items_input.setText(selected_items)
 
         # Buttons
         btn_layout = QHBoxLayout()
@@ -420,11 +1499,36 @@ class DownloadOptionsDialog(QDialog):
         ok_btn = QPushButton("Start Download")
         ok_btn.setProperty("class", "success")
         ok_btn.setDefault(True)
-        ok_btn.clicked.connect(self.accept)
+        ok_btn.clicked.connect(self.confirm_options)
         btn_layout.addWidget(cancel_btn)
         btn_layout.addWidget(ok_btn)
         layout.addLayout(btn_layout)
 
+    def clip_section(self):
+        """Clip range as [start, end] seconds (end None = until the end), None if no time is given.
+        Times are `HH:MM:SS`, `MM:SS` or `SS`, read with `calculate_sec`."""
+        start = self.clip_start_input.text().strip()
+        end = self.clip_end_input.text().strip()
+        if not (start or end):
+            return None
+        # Seconds from the beginning: the difference with a zero time in the same format
+        to_sec = lambda t: float(calculate_sec(':'.join('0' * len(t.split(':'))), t))
+        start_sec = to_sec(start) if start else 0.0
+        end_sec = to_sec(end) if end else None
+        if end_sec is not None and end_sec <= start_sec:
+            raise ValueError("End Time must be after Start Time")
+        return [start_sec, end_sec]
+
+    def confirm_options(self):
+        if self.media_type == "video":
+            try:
+                self.clip_section()
+            except Exception as e:  # calculate_sec raises AssertionError/Exception on bad input
+                self.clip_error_label.setText(f"❌ {e}")
+                self.clip_error_label.setVisible(True)
+                return
+        self.accept()
+
     def toggle_playlist_inputs(self, index):
         self.playlist_limit_spin.setEnabled(index == 1)
         self.playlist_limit_spin.setVisible(index == 1)
@@ -435,11 +1539,22 @@ class DownloadOptionsDialog(QDialog):
         options = {
             'merge_format': self.merge_combo.currentText().split()[0],
             'subtitles': self.subtitle_check.isChecked(),
-            'subtitle_langs': [lang.strip() for lang in self.subtitle_input.text().split(',')] if self.subtitle_check.isChecked() else []
+            'subtitle_langs': [lang.strip() for lang in self.subtitle_input.text().split(',')] if self.subtitle_check.isChecked() else [],
+            'fragment_concurrency': self.fragment_spin.value(),
+            'http_chunk_mb': self.chunk_spin.value(),
+            'buffer_kib': self.buffer_spin.value()
         }
         
+        if self.media_type == "video":
+            options['section'] = self.clip_section()
+        
         if self.media_type == "playlist":
             options['quality_selection'] = self.quality_combo.currentText()
+            options['prefer_codecs'] = CODEC_PREFERENCES[self.codec_combo.currentText()]
+            options['max_size'] = self.entry_size_spin.value() * 1024 * 1024 or None
+            options['smallest'] = self.smallest_check.isChecked()
+            options['sync'] = self.sync_check.isChecked()
+            options['parallel_entries'] = self.parallel_spin.value()
             idx = self.playlist_option.currentIndex()
             options['playlist_mode'] = idx
             if idx == 1:
@@ -450,9 +1565,15 @@ class DownloadOptionsDialog(QDialog):
         return options
 
 class MetadataDisplayWidget(QFrame):
-    def __init__(self):
+    def __init__(self, thumbnail_loader=None):
         super().__init__()
         self.setProperty("class", "card")
+        # Shows the `thumbnail` field as an image preview when a loader is given
+        self.thumbnail_loader = thumbnail_loader
+        self.thumbnail_url = None
+        self.preview_label = None
+        if thumbnail_loader is not None:
+            thumbnail_loader.loaded.connect(self.on_thumbnail_loaded)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -474,6 +1595,8 @@ class MetadataDisplayWidget(QFrame):
         Recursively clears the content layout. 
         Crucial for removing nested layouts (Rows) created in display_metadata.
         """
+        self.thumbnail_url = None
+        self.preview_label = None
         if self.content_layout is not None:
             self._clear_layout_recursive(self.content_layout)
 
@@ -493,6 +1616,9 @@ class MetadataDisplayWidget(QFrame):
         title_lbl.setStyleSheet(f"color: {THEME_ACCENT}; font-weight: bold; font-size: 16px; margin-bottom: 10px;")
         self.content_layout.addWidget(title_lbl)
 
+        if self.thumbnail_loader is not None and data.get('thumbnail'):
+            self.show_thumbnail(data['thumbnail'])
+
         for key, value in data.items():
             if key.startswith('_') and key != "_type": continue 
             if value is None: continue
@@ -519,6 +1645,218 @@ class MetadataDisplayWidget(QFrame):
         
         self.content_layout.addStretch()
 
+    def show_thumbnail(self, url):
+        """Adds the preview, immediately from the memory cache or once the loader delivers it."""
+        self.thumbnail_url = url
+        self.preview_label = QLabel()
+        size = self.thumbnail_loader.size
+        self.preview_label.setFixedSize(size)
+        self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.preview_label.setStyleSheet(f"background-color: {THEME_INPUT_BG}; border-radius: 6px;")
+        self.content_layout.addWidget(self.preview_label)
+        pixmap = self.thumbnail_loader.request(url)
+        if pixmap is not None:
+            self.preview_label.setPixmap(pixmap)
+        else:
+            self.preview_label.setText("Loading preview...")
+
+    def on_thumbnail_loaded(self, url, pixmap):
+        if url != self.thumbnail_url or self.preview_label is None:
+            return  # Another video is shown by now
+        if pixmap.isNull():
+            self.preview_label.setText("No preview available")
+        else:
+            self.preview_label.setPixmap(pixmap)
+
+class PlaylistProgressModel(QAbstractListModel):
+    """
+    Per-entry download progress of a playlist.
+    Each entry is a small list `[title, downloaded, total, speed]`, so thousands of entries
+    cost a few hundred bytes each instead of a frame with a progress bar and three labels.
+    """
+    EntryRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        self._rows = {}  # entry id -> row
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return entry[0]
+        if role == self.EntryRole:
+            return entry
+        return None
+
+    def update_entry(self, entry_id, title, downloaded, total, speed):
+        """Adds or updates an entry; only the changed row is repainted (and only if visible)."""
+        row = self._rows.get(entry_id)
+        if row is None:
+            row = len(self._entries)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._entries.append([title, downloaded, total, speed])
+            self._rows[entry_id] = row
+            self.endInsertRows()
+            return
+        self._entries[row][1:] = [downloaded, total, speed]
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [self.EntryRole])
+
+    def clear(self):
+        self.beginResetModel()
+        self._entries = []
+        self._rows = {}
+        self.endResetModel()
+
+class PlaylistProgressDelegate(QStyledItemDelegate):
+    """Paints a playlist entry row: elided title | progress bar | speed and size."""
+    ROW_HEIGHT = 40
+    BAR_WIDTH = 260
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        title, downloaded, total, speed = index.data(PlaylistProgressModel.EntryRole)
+        percent = int(downloaded / total * 100) if downloaded and total else 0
+        rect = option.rect.adjusted(0, 5, 0, -5)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        font = painter.font()
+        font.setPixelSize(13)
+        painter.setFont(font)
+        fm = QFontMetrics(font)
+
+        # Title (left), elided to 45% of the row
+        title_rect = QRect(rect.left(), rect.top(), int(rect.width() * 0.45), rect.height())
+        painter.setPen(QColor("white"))
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+                         fm.elidedText(title, Qt.TextElideMode.ElideRight, title_rect.width()))
+
+        # Progress bar (center)
+        bar_rect = QRect(title_rect.right() + 10, rect.center().y() - 10, self.BAR_WIDTH, 20)
+        painter.setPen(QColor(THEME_BORDER))
+        painter.setBrush(QColor("#262637"))
+        painter.drawRoundedRect(bar_rect, 6, 6)
+        if percent:
+            chunk = QRect(bar_rect.left(), bar_rect.top(), int(bar_rect.width() * min(percent, 100) / 100), bar_rect.height())
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(THEME_ACCENT))
+            painter.drawRoundedRect(chunk, 6, 6)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor("black" if percent >= 45 else "white"))
+        painter.drawText(bar_rect, Qt.AlignmentFlag.AlignCenter, f"{percent}%")
+
+        # Speed and size (right)
+        font.setBold(False)
+        painter.setFont(font)
+        painter.setPen(QColor(THEME_TEXT))
+        info_rect = QRect(bar_rect.right() + 10, rect.top(), rect.right() - bar_rect.right() - 10, rect.height())
+        speed_str = f"{DownloadPage._format_bytes(speed)}/s" if speed is not None else 'N/A'
+        size_str = f"{DownloadPage._format_bytes(downloaded)} / {DownloadPage._format_bytes(total)}"
+        painter.drawText(info_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, f"Speed: {speed_str}\n{size_str}")
+        painter.restore()
+
+class PlaylistEntriesModel(QAbstractTableModel):
+    """
+    Entries of a playlist listed by `PlaylistEntriesWorker`, each one checkable for download.
+    Each entry is a list `[checked, index, id, title, duration, url, details]`.
+    """
+    HEADERS = ['', '#', 'Title', 'Duration', 'Details']
+    check_changed = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        self._rows = {}  # entry id -> row
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == 0:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        checked, number, _, title, duration, _, details = self._entries[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.CheckStateRole and col == 0:
+            return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            if col == 1:
+                return str(number)
+            if col == 2:
+                return title
+            if col == 3:
+                return format_duration(duration)
+            if col == 4:
+                return details or '…'
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role == Qt.ItemDataRole.CheckStateRole and index.column() == 0:
+            self._entries[index.row()][0] = Qt.CheckState(value) == Qt.CheckState.Checked
+            self.dataChanged.emit(index, index, [role])
+            self.check_changed.emit(index.row())
+            return True
+        return False
+
+    def append_entries(self, entries):
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        for e in entries:
+            self._rows[e['id']] = len(self._entries)
+            self._entries.append([True, e['index'], e['id'], e['title'], e['duration'], e['url'], None])
+        self.endInsertRows()
+
+    def entry(self, row):
+        return self._entries[row]
+
+    def set_details(self, entry_id, details, duration=None):
+        row = self._rows.get(entry_id)
+        if row is None:
+            return
+        self._entries[row][6] = details
+        if duration and not self._entries[row][4]:
+            self._entries[row][4] = duration
+        self.dataChanged.emit(self.index(row, 3), self.index(row, 4))
+
+    def set_all_checked(self, checked):
+        for e in self._entries:
+            e[0] = checked
+        if self._entries:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._entries) - 1, 0))
+
+    def checked_indices(self):
+        """Playlist indices (1-based, as used by `playlist_items`) of the checked entries."""
+        return [e[1] for e in self._entries if e[0]]
+
+    def clear(self):
+        self.beginResetModel()
+        self._entries = []
+        self._rows = {}
+        self.endResetModel()
+
 class DownloadPage(QWidget):
 
     @staticmethod
@@ -538,11 +1876,37 @@ class DownloadPage(QWidget):
         super().__init__()
         self.main_window = main_window
         self.current_view = "menu"
-        self.workers = []
+        self.active_item_id = None
+        self.verify_item_id = None  # finished download whose integrity check the view reports
+        self.fetch_worker = None
+        self.stale_fetch_workers = []
+        self.metadata_cache = MetadataCache()
+        self.entries_worker = None
+        self.entry_generation = 0
+        self.requested_entries = set()
+        self.entry_infos = {}  # entry id -> resolved (trimmed) info, used for size estimates
+        self.download_bytes = {}  # (entry id, file) -> (downloaded, total) bytes of the running download
+        self.entry_pool = QThreadPool(self)
+        self.entry_pool.setMaxThreadCount(4)
+        self.thumbnail_loader = ThumbnailLoader(self)
+        self.entry_signals = EntryDetailsSignals(self)
+        self.entry_signals.resolved.connect(self.on_entry_resolved)
         self.fetched_info = None
-        self.playlist_progress_widgets = {}
         self.download_params = {}
+        self.batch_workers = []
+        self.playlist_sync = PlaylistSync()
+        self.library = MediaLibrary()
+        self.queue_manager = DownloadQueueManager(DownloadQueue(), self)
+        self.queue_manager.item_started.connect(self.on_item_started)
+        self.queue_manager.item_progress.connect(self.on_item_progress)
+        self.queue_manager.item_log.connect(self.on_item_log)
+        self.queue_manager.item_finished.connect(self.on_finished)
+        self.queue_manager.item_verified.connect(self.on_verified)
         self.init_ui()
+        # Start the downloads left queued by the previous session, interrupted ones wait for the user
+        self.queue_manager.schedule()
+        if self.queue_manager.queue.interrupted():
+            QTimer.singleShot(0, self.offer_resume)
         
     def _update_progress_text_contrast(self, bar, value):
         """
@@ -559,43 +1923,22 @@ class DownloadPage(QWidget):
 
         # Define colors (matching the global variables in your file)
         # THEME_BORDER="#A6ADC8", THEME_ACCENT="#89b4fa", THEME_INPUT_BG="#313244"
-        
-        # Check if this is a Playlist Bar (height was set to 20 in previous code) 
-        # or Main Bar (standard height)
-        if bar.maximumHeight() == 20:
-            # --- PLAYLIST BAR STYLE ---
-            new_style = f"""
-                QProgressBar {{
-                    border: 1px solid #A6ADC8;
-                    border-radius: 6px;
-                    background-color: #262637;
-                    padding: 0px;
-                    color: {target_text_color};
-                    font-weight: bold;
-                    text-align: center;
-                }}
-                QProgressBar::chunk {{
-                    background-color: #89b4fa;
-                    border-radius: 6px;
-                }}
-            """
-        else:
-            # --- MAIN PROGRESS BAR STYLE ---
-            new_style = f"""
-                QProgressBar {{
-                    border: 2px solid #A6ADC8;
-                    border-radius: 10px;
-                    background-color: #313244;
-                    font-weight: bold;
-                    color: {target_text_color};
-                    padding: 2px;
-                    text-align: center;
-                }}
-                QProgressBar::chunk {{
-                    background-color: #89b4fa;
-                    border-radius: 10px;
-                }}
-            """
+        # (Playlist entries are painted by PlaylistProgressDelegate, so only the Main Bar uses this)
+        new_style = f"""
+            QProgressBar {{
+                border: 2px solid #A6ADC8;
+                border-radius: 10px;
+                background-color: #313244;
+                font-weight: bold;
+                color: {target_text_color};
+                padding: 2px;
+                text-align: center;
+            }}
+            QProgressBar::chunk {{
+                background-color: #89b4fa;
+                border-radius: 10px;
+            }}
+        """
             
         bar.setStyleSheet(new_style)
 
@@ -613,14 +1956,13 @@ class DownloadPage(QWidget):
         self.fetched_info = None
         self.fetched_formats = None
         self.download_params = {}
-        self.playlist_progress_widgets = {}
         self.fetched_url = None
-        
-        for w in self.workers:
-            if w.isRunning():
-                w.terminate()
-                w.wait()
-        self.workers = []
+        self.cancel_fetch()
+        for worker in self.batch_workers:
+            worker.cancel()
+        # Queued downloads keep running in the background, the view just stops following them
+        self.active_item_id = None
+        self.verify_item_id = None
 
     def prepare_new_fetch(self):
         """Clears UI elements and internal state for a new fetch without leaving the page."""
@@ -637,14 +1979,15 @@ class DownloadPage(QWidget):
         # Hide progress bars
         if hasattr(self, 'progress_container'):
             self.progress_container.setVisible(False)
+        if hasattr(self, 'estimate_label'):
+            self.estimate_label.setVisible(False)
         if hasattr(self, 'playlist_progress_container'):
             self.playlist_progress_container.setVisible(False)
             # Clear playlist progress items
-            while self.playlist_progress_layout.count():
-                child = self.playlist_progress_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-            self.playlist_progress_widgets.clear()
+            self.playlist_progress_model.clear()
+        if hasattr(self, 'entries_card'):
+            self.entries_card.setVisible(False)
+            self.entries_model.clear()
 
         # Clear logs
         if hasattr(self, 'status_text'):
@@ -653,14 +1996,12 @@ class DownloadPage(QWidget):
         # Clear previous internal data
         self.fetched_info = None
         self.fetched_formats = None
+        self.fetched_url = None
         self.download_params = {}
         
-        # Stop any previous workers that might still be lingering
-        for w in self.workers:
-            if w.isRunning():
-                w.terminate()
-                w.wait()
-        self.workers = []
+        # A new fetch supersedes the one still in flight
+        self.cancel_fetch()
+        self.active_item_id = None
 
     def show_menu(self):
         self.reset_state()
@@ -686,59 +2027,30 @@ class DownloadPage(QWidget):
         btn_layout = QVBoxLayout(btn_container)
         btn_layout.setSpacing(15)
         
-        # --- Video Button ---
-        video_btn = QPushButton()
-        video_btn.setFixedHeight(80)
-        video_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        video_btn.setProperty("class", "primary")
-        video_btn.clicked.connect(self.show_video_download)
-        
-        video_btn_layout = QHBoxLayout(video_btn)
-        video_btn_layout.setContentsMargins(20, 0, 20, 0)
-        video_btn_layout.setSpacing(15)
-        video_icon = QLabel("🎬")
-        video_icon.setStyleSheet("font-size: 36px; background: transparent; color: #11111b;")
-        video_text = QLabel("Single Video / Audio")
-        video_text.setStyleSheet("font-size: 18px; font-weight: bold; background: transparent; color: #11111b;")
-        video_btn_layout.addWidget(video_icon)
-        video_btn_layout.addWidget(video_text, 1, Qt.AlignmentFlag.AlignCenter)
-        btn_layout.addWidget(video_btn)
-        
-        # --- Playlist Button ---
-        playlist_btn = QPushButton()
-        playlist_btn.setFixedHeight(80)
-        playlist_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        playlist_btn.setProperty("class", "primary")
-        playlist_btn.clicked.connect(self.show_playlist_download)
-        
-        playlist_btn_layout = QHBoxLayout(playlist_btn)
-        playlist_btn_layout.setContentsMargins(20, 0, 20, 0)
-        playlist_btn_layout.setSpacing(15)
-        playlist_icon = QLabel("📑")
-        playlist_icon.setStyleSheet("font-size: 36px; background: transparent; color: #11111b;")
-        playlist_text = QLabel("Full Playlist")
-        playlist_text.setStyleSheet("font-size: 18px; font-weight: bold; background: transparent; color: #11111b;")
-        playlist_btn_layout.addWidget(playlist_icon)
-        playlist_btn_layout.addWidget(playlist_text, 1, Qt.AlignmentFlag.AlignCenter)
-        btn_layout.addWidget(playlist_btn)
-        
-        # --- History Button ---
-        history_btn = QPushButton()
-        history_btn.setFixedHeight(80)
-        history_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        history_btn.setProperty("class", "primary")
-        history_btn.clicked.connect(self.show_history)
-        
-        history_btn_layout = QHBoxLayout(history_btn)
-        history_btn_layout.setContentsMargins(20, 0, 20, 0)
-        history_btn_layout.setSpacing(15)
-        history_icon = QLabel("📜")
-        history_icon.setStyleSheet("font-size: 36px; background: transparent; color: #11111b;")
-        history_text = QLabel("History")
-        history_text.setStyleSheet("font-size: 18px; font-weight: bold; background: transparent; color: #11111b;")
-        history_btn_layout.addWidget(history_icon)
-        history_btn_layout.addWidget(history_text, 1, Qt.AlignmentFlag.AlignCenter)
-        btn_layout.addWidget(history_btn)
+        pages = [("🎬", "Single Video / Audio", self.show_video_download),
+                 ("📑", "Full Playlist", self.show_playlist_download),
+                 ("📜", "History", self.show_history),
+                 ("📥", "Download Queue", self.show_queue),
+                 ("🔄", "Playlist Sync", self.show_sync),
+                 ("📋", "Batch Import", self.show_batch),
+                 ("📚", "Library", self.show_library)]
+        for icon_text, label, page in pages:
+            btn = QPushButton()
+            btn.setFixedHeight(80)
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            btn.setProperty("class", "primary")
+            btn.clicked.connect(page)
+            
+            btn_inner_layout = QHBoxLayout(btn)
+            btn_inner_layout.setContentsMargins(20, 0, 20, 0)
+            btn_inner_layout.setSpacing(15)
+            icon = QLabel(icon_text)
+            icon.setStyleSheet("font-size: 36px; background: transparent; color: #11111b;")
+            text = QLabel(label)
+            text.setStyleSheet("font-size: 18px; font-weight: bold; background: transparent; color: #11111b;")
+            btn_inner_layout.addWidget(icon)
+            btn_inner_layout.addWidget(text, 1, Qt.AlignmentFlag.AlignCenter)
+            btn_layout.addWidget(btn)
         
         center_layout.addWidget(btn_container)
         self.main_layout.addWidget(center_widget)
@@ -794,9 +2106,51 @@ class DownloadPage(QWidget):
         input_layout.addLayout(url_layout)
         layout.addWidget(input_card)
         
-        self.metadata_widget = MetadataDisplayWidget()
+        self.metadata_widget = MetadataDisplayWidget(self.thumbnail_loader)
         layout.addWidget(self.metadata_widget)
         
+        # Playlist entries, streamed in by PlaylistEntriesWorker (playlist mode only)
+        self.entries_card = QFrame()
+        self.entries_card.setProperty("class", "card")
+        entries_layout = QVBoxLayout(self.entries_card)
+        entries_layout.setContentsMargins(15, 15, 15, 15)
+        entries_header = QHBoxLayout()
+        self.entries_label = QLabel("Playlist Entries")
+        self.entries_label.setStyleSheet(f"color: {THEME_ACCENT}; font-weight: bold; font-size: 16px;")
+        entries_header.addWidget(self.entries_label)
+        entries_header.addStretch()
+        for text, checked in (("Select All", True), ("Select None", False)):
+            btn = QPushButton(text)
+            btn.setProperty("class", "back")
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            btn.clicked.connect(lambda _, c=checked: self.entries_model.set_all_checked(c))
+            entries_header.addWidget(btn)
+        entries_layout.addLayout(entries_header)
+        
+        self.entries_model = PlaylistEntriesModel(self)
+        self.entries_model.check_changed.connect(self.on_entry_checked)
+        self.entries_view = QTableView()
+        self.entries_view.setModel(self.entries_model)
+        self.entries_view.verticalHeader().setVisible(False)
+        self.entries_view.verticalHeader().setDefaultSectionSize(30)
+        self.entries_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.entries_view.setMinimumHeight(300)
+        entries_header_view = self.entries_view.horizontalHeader()
+        entries_header_view.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        entries_header_view.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        entries_header_view.setSectionResizeMode(4, QHeaderView.ResizeMode.Interactive)
+        self.entries_view.setColumnWidth(4, 260)
+        entries_layout.addWidget(self.entries_view)
+        self.entries_card.setVisible(False)
+        layout.addWidget(self.entries_card)
+        
+        # Resolve full metadata for the rows the user scrolls to (debounced)
+        self.entries_scroll_timer = QTimer(self)
+        self.entries_scroll_timer.setSingleShot(True)
+        self.entries_scroll_timer.setInterval(200)
+        self.entries_scroll_timer.timeout.connect(self.resolve_visible_entries)
+        self.entries_view.verticalScrollBar().valueChanged.connect(self.entries_scroll_timer.start)
+        
         self.configure_download_btn = QPushButton("Configure Download")
         self.configure_download_btn.setFixedHeight(45)
         self.configure_download_btn.setProperty("class", "success")
@@ -840,6 +2194,11 @@ class DownloadPage(QWidget):
         self.confirmation_group.setVisible(False)
         layout.addWidget(self.confirmation_group)
         
+        # Running size estimate of the download
+        self.estimate_label = QLabel("")
+        self.estimate_label.setVisible(False)
+        layout.addWidget(self.estimate_label)
+        
         # Progress Bar Layout
         self.progress_container = QFrame()
         self.progress_container.setVisible(False)
@@ -861,11 +2220,26 @@ class DownloadPage(QWidget):
         progress_layout.addWidget(self.main_progress)
         layout.addWidget(self.progress_container)
 
-        self.playlist_progress_container = QWidget()
-        self.playlist_progress_layout = QVBoxLayout(self.playlist_progress_container)
+        # Virtualized list: only visible rows are painted, however long the playlist is
+        self.playlist_progress_model = PlaylistProgressModel(self)
+        self.playlist_progress_container = QListView()
+        self.playlist_progress_container.setModel(self.playlist_progress_model)
+        self.playlist_progress_container.setItemDelegate(PlaylistProgressDelegate(self.playlist_progress_container))
+        self.playlist_progress_container.setUniformItemSizes(True)
+        self.playlist_progress_container.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.playlist_progress_container.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.playlist_progress_container.setMinimumHeight(300)
         self.playlist_progress_container.setVisible(False)
         layout.addWidget(self.playlist_progress_container)
         
+        self.cancel_download_btn = QPushButton("Cancel Download")
+        self.cancel_download_btn.setFixedSize(140, 35)
+        self.cancel_download_btn.setProperty("class", "cancel")
+        self.cancel_download_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.cancel_download_btn.clicked.connect(self.cancel_download)
+        self.cancel_download_btn.setVisible(False)
+        layout.addWidget(self.cancel_download_btn, alignment=Qt.AlignmentFlag.AlignRight)
+        
         self.status_text = QTextEdit()
         self.status_text.setReadOnly(True)
         # Fixed height so output box doesn't collapse when many playlist items appear
@@ -899,6 +2273,143 @@ class DownloadPage(QWidget):
         self.clear_layout()
         history = HistoryPage(self)
         self.main_layout.addWidget(history)
+
+    def show_sync(self):
+        """Show the playlists saved for syncing."""
+        self.current_view = "sync"
+        self.active_item_id = None
+        self.clear_layout()
+        sync = SyncPage(self.playlist_sync, self)
+        sync.back_requested.connect(self.show_menu)
+        sync.sync_requested.connect(self.sync_playlists)
+        self.main_layout.addWidget(sync)
+
+    def sync_playlists(self, playlists):
+        """Queues a sync download for each playlist that is not already queued, then shows the queue."""
+        queued = {i['url'] for i in self.queue_manager.queue.items() if i.get('sync')}
+        for p in playlists:
+            if p['url'] in queued:
+                continue
+            self.queue_manager.enqueue({
+                'type': 'playlist', 'url': p['url'], 'opts': p['opts'], 'save_path': p['save_path'],
+                'title': f"🔄 {p['title']}", 'sync': True
+            })
+        self.show_queue()
+
+    def show_batch(self):
+        """Show the batch import page (many URLs at once, prefetched and queued with one format policy)."""
+        self.current_view = "batch"
+        self.active_item_id = None
+        self.clear_layout()
+        self.batch_page = BatchImportPage([i['url'] for i in self.queue_manager.queue.items()],
+                                          list(CODEC_PREFERENCES), self)
+        self.batch_page.back_requested.connect(self.show_menu)
+        self.batch_page.prefetch_requested.connect(self.start_batch_prefetch)
+        self.batch_page.queue_requested.connect(self.queue_batch)
+        self.main_layout.addWidget(self.batch_page)
+
+    def start_batch_prefetch(self, urls, workers):
+        worker = BatchPrefetchWorker(urls, self.metadata_cache, workers)
+        worker.fetched.connect(self.batch_page.set_result)
+        worker.finished.connect(lambda counts, w=worker: self.on_batch_prefetched(w, counts))
+        self.batch_workers.append(worker)
+        worker.start()
+
+    def on_batch_prefetched(self, worker, counts):
+        worker.wait()
+        self.batch_workers.remove(worker)
+        worker.deleteLater()
+        if counts.get('Cancelled') or self.current_view != "batch":
+            return
+        text = f"Metadata: {counts['ok']} ready ({counts['cached']} from cache)"
+        if counts['failed']:
+            text += f", {counts['failed']} failed"
+        self.batch_page.summary_label.setText(text)
+
+    def queue_batch(self, entries, policy):
+        """Queues the imported entries, each with the format picked by the shared policy."""
+        if not entries:
+            self.batch_page.summary_label.setText("⚠️ No ready items to queue")
+            return
+        options = {'merge_format': policy['merge_format'], 'subtitles': False, 'subtitle_langs': []}
+        prefer_codecs = CODEC_PREFERENCES.get(policy['codec'], ())
+        audio_only = policy['audio_only'] or policy['merge_format'] in ('audio', 'mp3')
+        base = 'Media Files Manager/Downloads'
+        items = []
+        for entry in entries:
+            info = entry['info']
+            opts = self._get_base_opts(options)
+            estimate = None
+            if entry['type'] == 'playlist':
+                opts['ignoreerrors'] = True
+                opts['outtmpl'] = f'{base}/%(playlist_title)s/%(playlist_index)s-%(title)s.%(ext)s'
+                save_path = f"{base}/{info.get('title', 'Playlist')}"
+                pick = None
+            else:
+                opts['outtmpl'] = f"{base}/%(title)s.%(ext)s"
+                save_path = base
+                pick = select_format(info.get('formats') or [], info.get('duration'), policy['max_size'],
+                                     policy['max_height'], prefer_codecs, policy['merge_format'] == 'mp4',
+                                     audio_only, smallest=policy.get('smallest', False))
+            if pick:
+                opts['format'], estimate = pick['format'], pick['size']
+            elif audio_only:
+                opts['format'] = NATIVE_AUDIO_FORMAT
+            else:
+                # Playlists, and videos whose formats did not match: the same constraints as a yt-dlp selector
+                opts['format'], format_sort = playlist_format(policy['max_size'], policy['max_height'], prefer_codecs,
+                                                              policy.get('smallest', False))
+                if format_sort:
+                    opts['format_sort'] = format_sort
+            items.append({'type': entry['type'], 'url': entry['url'], 'opts': opts, 'save_path': save_path,
+                          'title': info.get('title') or entry['url'], 'estimate': estimate})
+
+        total = sum(item['estimate'] or 0 for item in items)
+        if not self.check_disk_space({'save_path': base, 'estimate': total}):
+            return
+        for item in items:
+            self.queue_manager.enqueue(item)
+        self.batch_page.queued_keys.update(entry['key'] for entry in entries)
+        self.batch_page.remove_entries([entry['url'] for entry in entries])
+        self.batch_page.summary_label.setText(f"📥 Queued {len(items)} downloads")
+
+    def offer_resume(self):
+        """Asks whether to resume the downloads interrupted when the application was last closed."""
+        interrupted = self.queue_manager.queue.interrupted()
+        if not interrupted:
+            return
+        lines = []
+        for item in interrupted[:10]:
+            done = f" ({self._format_bytes(item['downloaded'])} done)" if item.get('downloaded') else ''
+            lines.append(f"• {item.get('title') or item.get('url')}{done}")
+        if len(interrupted) > 10:
+            lines.append(f"... and {len(interrupted) - 10} more")
+        answer = QMessageBox.question(
+            self, "Resume Downloads",
+            f"{len(interrupted)} download(s) were interrupted when the application was closed:\n\n"
+            + "\n".join(lines)
+            + "\n\nResume them now? Partially downloaded files are continued, not downloaded again.\n"
+              "Otherwise they stay in the Download Queue until resumed.")
+        if answer == QMessageBox.StandardButton.Yes:
+            self.queue_manager.resume_interrupted()
+
+    def show_library(self):
+        """Show the searchable library of downloaded files."""
+        self.current_view = "library"
+        self.active_item_id = None
+        self.clear_layout()
+        library = LibraryPage(self.library, self)
+        library.back_requested.connect(self.show_menu)
+        self.main_layout.addWidget(library)
+
+    def show_queue(self):
+        """Show the download queue with its controls."""
+        self.current_view = "queue"
+        self.active_item_id = None
+        self.clear_layout()
+        queue = QueuePage(self.queue_manager, self.metadata_cache, self)
+        queue.back_requested.connect(self.show_menu)
+        self.main_layout.addWidget(queue)
     
     def cancel_process(self):
         mode = self.current_view
@@ -910,6 +2421,22 @@ class DownloadPage(QWidget):
         else:
             self.show_menu()
 
+    def cancel_download(self):
+        """Stops the download followed by the view, optionally keeping its partial files for resume."""
+        if self.active_item_id is None:
+            return
+        answer = QMessageBox.question(
+            self, "Cancel Download",
+            "Keep the partially downloaded files?\n\n"
+            "Yes: keep them and pause the download in the queue so it can be resumed later.\n"
+            "No: delete them.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel)
+        if answer == QMessageBox.StandardButton.Cancel or self.active_item_id is None:
+            return
+        self.cancel_download_btn.setEnabled(False)
+        self.status_text.append("\n⏹ Cancelling download...")
+        self.queue_manager.cancel(self.active_item_id, answer == QMessageBox.StandardButton.Yes)
+
     def fetch_video_info(self):
         # Reset state safely before new fetch
         self.prepare_new_fetch()
@@ -920,55 +2447,7 @@ class DownloadPage(QWidget):
             return
         
         self.status_text.append("⏳ Fetching video information... Please wait.")
-        
-        try:
-            ydl_opts = {'skip_download': True, 'playlistend': 1, 'quiet': True}
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-            
-            if info.get('_type') == 'playlist' or info.get('playlist_count'):
-                self.status_text.append("❌ This is a playlist. Please use the Playlist mode.")
-                winsound.MessageBeep(winsound.MB_ICONHAND) # Sound for error
-                return
-            
-            data = {
-                "title": info.get("title"),
-                "description": info.get("description"),
-                "view_count": info.get("view_count"),
-                "like_count": info.get("like_count"),
-                "upload_date": info.get("upload_date"),
-                "channel": info.get("channel"),
-                "uploader": info.get("uploader"),
-                'duration': info.get("duration"),
-                'thumbnail': info.get("thumbnail"),
-                "webpage_url_domain": info.get("webpage_url_domain"),
-                "_type": info.get("_type")
-            }
-            self.metadata_widget.display_metadata(data)
-            
-            formats = []
-            for f in info.get('formats', []):
-                fs = f.get('filesize')
-                fs_str = f"{round(fs / (1024*1024), 2)}MB" if fs else 'N/A'
-                formats.append((
-                    f.get('format_id', 'N/A'),
-                    f.get('ext', 'N/A'),
-                    f.get('height', 'N/A'),
-                    f.get('format_note', 'N/A'),
-                    f.get('quality', 'N/A'), 
-                    fs_str
-                ))
-            
-            self.fetched_info = info
-            self.fetched_formats = formats
-            self.fetched_url = url
-            self.configure_download_btn.setVisible(True)
-            self.configure_download_btn.clicked.disconnect() if self.configure_download_btn.receivers(self.configure_download_btn.clicked) else None
-            self.configure_download_btn.clicked.connect(self.show_video_download_options)
-                    
-        except Exception as e:
-            self.status_text.append(f"❌ Error: {str(e)}")
-            winsound.MessageBeep(winsound.MB_ICONHAND) # Sound for error
+        self.start_fetch(url, 'video')
     
     def fetch_playlist_info(self):
         # Reset state safely before new fetch
@@ -980,46 +2459,187 @@ class DownloadPage(QWidget):
             return
             
         self.status_text.append("⏳ Fetching playlist information...")
-        
-        try:
-            ydl_opts = {'skip_download': True, 'playlistend': 1, 'quiet': True}
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-            
-            if info.get('_type') != 'playlist' and info.get('playlist_count') is None:
-                self.status_text.append("❌ Invalid Object Type! URL don't belong to Playlist.")
-                winsound.MessageBeep(winsound.MB_ICONHAND) # Sound for error
-                return
+        self.start_fetch(url, 'playlist')
 
-            data = {
-                "title": info.get("title"),
-                "description": info.get("description"),
-                "modified_date": info.get("modified_date"),
-                "view_count": info.get("view_count"),
-                "playlist_count": info.get("playlist_count"),
-                "channel": info.get("channel"),
-                'uploader': info.get("uploader"),
-                'thumbnail': info.get("thumbnail"),
-                "webpage_url_domain": info.get("webpage_url_domain"),
-                "_type": info.get("_type")
-            }
-            self.metadata_widget.display_metadata(data)
-            
-            self.fetched_info = info
-            self.fetched_url = url
-            self.configure_download_btn.setVisible(True)
-            self.configure_download_btn.clicked.disconnect() if self.configure_download_btn.receivers(self.configure_download_btn.clicked) else None
-            self.configure_download_btn.clicked.connect(self.show_playlist_download_options)
+    def start_fetch(self, url, media_type):
+        """
+        Runs metadata extraction in a `MetadataFetchWorker`, superseding any fetch in flight.
+        A cached result is shown immediately while the worker refreshes it in the background.
+        """
+        self.cancel_fetch()
+        try:
+            cached = self.metadata_cache.get(url, media_type)
+        except Exception:
+            cached = None
+        if cached:
+            self.status_text.append("⚡ Loaded from cache, refreshing in background...")
+            self.show_fetch_result(media_type, url, cached)
 
+        try:
+            worker = MetadataFetchWorker(url, media_type)
+            worker.finished.connect(lambda r, w=worker: self.on_fetch_finished(w, r))
+            self.fetch_worker = worker
+            worker.start()
+            if media_type == 'playlist':
+                self.start_entries_stream(url)
         except Exception as e:
-            self.status_text.append(f"❌ Error: {str(e)}")
+            self.fetch_worker = None
+            self.status_text.append(f"❌ Failed to start background process: {str(e)}")
+            winsound.MessageBeep(winsound.MB_ICONHAND)
+
+    def start_entries_stream(self, url):
+        """Lists the playlist entries with flat extraction, showing them as they arrive."""
+        self.entries_label.setText("Playlist Entries (listing...)")
+        worker = PlaylistEntriesWorker(url)
+        worker.entries_found.connect(lambda e, w=worker: self.on_entries_found(w, e))
+        worker.finished.connect(lambda r, w=worker: self.on_entries_finished(w, r))
+        self.entries_worker = worker
+        worker.start()
+
+    def on_entries_found(self, worker, entries):
+        if worker is not self.entries_worker:
+            return
+        self.entries_card.setVisible(True)
+        self.entries_model.append_entries(entries)
+        self.entries_label.setText(f"Playlist Entries ({self.entries_model.rowCount()} listed...)")
+        self.entries_scroll_timer.start()
+
+    def on_entries_finished(self, worker, result):
+        worker.wait()
+        if worker in self.stale_fetch_workers:
+            self.stale_fetch_workers.remove(worker)
+        if worker is not self.entries_worker:
+            return
+        self.entries_worker = None
+        self.entries_label.setText(f"Playlist Entries ({self.entries_model.rowCount()})")
+        if not result.get('State') and not result.get('Cancelled'):
+            self.status_text.append(f"⚠️ Could not list playlist entries: {result.get('Error')}")
+
+    def resolve_visible_entries(self):
+        """Resolves full metadata for the entries currently visible in the entries table."""
+        count = self.entries_model.rowCount()
+        if not count or not self.entries_view.isVisible():
+            return
+        top = max(self.entries_view.rowAt(0), 0)
+        bottom = self.entries_view.rowAt(self.entries_view.viewport().height() - 1)
+        bottom = count - 1 if bottom < 0 else bottom
+        for row in range(top, bottom + 1):
+            self.resolve_entry(row)
+
+    def on_entry_checked(self, row):
+        if self.entries_model.entry(row)[0]:
+            self.resolve_entry(row)
+
+    def resolve_entry(self, row):
+        """Fetches the full metadata of an entry once, from the cache or on the entry thread pool."""
+        _, _, entry_id, _, _, url, _ = self.entries_model.entry(row)
+        if entry_id in self.requested_entries or not url:
+            return
+        self.requested_entries.add(entry_id)
+        try:
+            cached = self.metadata_cache.get(url, 'video')
+        except Exception:
+            cached = None
+        if cached:
+            self.on_entry_resolved(self.entry_generation, entry_id, cached['Info'])
+            return
+        self.entry_pool.start(EntryDetailsTask(self.entry_generation, entry_id, url,
+                                               self.entry_signals, self.metadata_cache))
+
+    def on_entry_resolved(self, generation, entry_id, info):
+        if generation != self.entry_generation:
+            return
+        if info.get('Error'):
+            self.entries_model.set_details(entry_id, f"⚠️ {info['Error']}")
+            return
+        self.entry_infos[entry_id] = info
+        heights = [f['height'] for f in info.get('formats', []) if f.get('height')]
+        details = []
+        if heights:
+            details.append(f"{max(heights)}p")
+        if info.get('view_count') is not None:
+            details.append(f"{info['view_count']:,} views")
+        if info.get('upload_date'):
+            details.append(info['upload_date'])
+        self.entries_model.set_details(entry_id, " · ".join(details) or '-', info.get('duration'))
+
+    def cancel_fetch(self):
+        """Cancels the running fetch; its result is ignored once it returns."""
+        for attr in ('fetch_worker', 'entries_worker'):
+            worker = getattr(self, attr, None)
+            setattr(self, attr, None)
+            if worker is not None and worker.isRunning():
+                worker.cancel()
+                # Keep a reference until the thread exits so it is not destroyed while running
+                self.stale_fetch_workers.append(worker)
+        # Drop pending entry lookups; results still in flight are ignored
+        self.entry_generation += 1
+        self.requested_entries = set()
+        self.entry_infos = {}
+        self.entry_pool.clear()
+
+    def on_fetch_finished(self, worker, result):
+        worker.wait()
+        if worker in self.stale_fetch_workers:
+            self.stale_fetch_workers.remove(worker)
+        if worker is not self.fetch_worker or result.get('Cancelled'):
+            return
+        self.fetch_worker = None
+        refresh = self.fetched_url == worker.url
+
+        if not result.get('State'):
+            if refresh:
+                # Keep showing the cached copy
+                self.status_text.append(f"⚠️ Could not refresh cached info: {result.get('Error')}")
+                return
+            self.status_text.append(f"❌ Error: {result.get('Error')}")
             winsound.MessageBeep(winsound.MB_ICONHAND) # Sound for error
+            return
+
+        if self.show_fetch_result(worker.media_type, worker.url, result, refresh):
+            try:
+                self.metadata_cache.put(worker.url, worker.media_type, result['Info'], result['Data'], result['Formats'])
+            except Exception as e:
+                self.status_text.append(f"⚠️ Could not update metadata cache: {e}")
+
+    def show_fetch_result(self, media_type, url, result, refresh=False):
+        """
+        Validates a fetch result and renders it. When `refresh` is True the already shown
+        (cached) result is only updated in place. Returns True if the result was accepted.
+        """
+        info = result['Info']
+        if media_type == 'playlist':
+            if info.get('_type') != 'playlist' and info.get('playlist_count') is None:
+                self.status_text.append("❌ Invalid Object Type! URL don't belong to Playlist.")
+                winsound.MessageBeep(winsound.MB_ICONHAND) # Sound for error
+                return False
+            options_slot = self.show_playlist_download_options
+        else:
+            if info.get('_type') == 'playlist' or info.get('playlist_count'):
+                self.status_text.append("❌ This is a playlist. Please use the Playlist mode.")
+                winsound.MessageBeep(winsound.MB_ICONHAND) # Sound for error
+                return False
+            self.fetched_formats = result['Formats']
+            options_slot = self.show_video_download_options
+
+        self.metadata_widget.display_metadata(result['Data'])
+        self.fetched_info = info
+        self.fetched_url = url
+        if refresh:
+            return True
+        self.configure_download_btn.setVisible(True)
+        self.configure_download_btn.clicked.disconnect() if self.configure_download_btn.receivers(self.configure_download_btn.clicked) else None
+        self.configure_download_btn.clicked.connect(options_slot)
+        return True
 
     def show_video_download_options(self):
-        format_dialog = FormatSelectionDialog(self.fetched_formats, self)
+        format_dialog = FormatSelectionDialog(self.fetched_formats, self, self.fetched_info)
         if format_dialog.exec():
             fmt_str = format_dialog.get_selected_format()
             opt_dialog = DownloadOptionsDialog('video', self)
+            if format_dialog.auto_mp4:
+                # The automatic pick only holds mp4 compatible streams: merge them by stream copy
+                opt_dialog.merge_combo.setCurrentText('mp4')
             if opt_dialog.exec():                
                 options = opt_dialog.get_options()
                 opts = self._get_base_opts(options)
@@ -1027,18 +2647,53 @@ class DownloadPage(QWidget):
                 if 'ignoreerrors' in opts:
                     del opts['ignoreerrors']
 
+                # Audio mode without a picked format: take the best native audio stream only
+                if options['merge_format'] == 'audio' and fmt_str == 'bestvideo+bestaudio':
+                    fmt_str = NATIVE_AUDIO_FORMAT
                 opts['format'] = fmt_str
                 base = 'Media Files Manager/Downloads'
                 opts['outtmpl'] = f"{base}/%(title)s.%(ext)s"
+                section = options.get('section')
+                if section:
+                    # Clips get their range in the name so they never overwrite the full video
+                    opts['outtmpl'] = f"{base}/%(title)s (clip %(section_start)d-%(section_end)d).%(ext)s"
                 
                 self.download_params = {
                     'type': 'video', 'url': self.fetched_url, 'opts': opts, 
-                    'info': self.fetched_info, 'save_path': base
+                    'info': self.fetched_info, 'save_path': base, 'section': section,
+                    'estimate': estimate_format_size(self.fetched_info, fmt_str, section)
                 }
+                if self.fetched_info.get('direct') and options['merge_format'] == 'original' and not section:
+                    # A plain file link: fetched in parallel Range chunks, nothing to merge or post-process
+                    name = yt_dlp.utils.sanitize_filename(self.fetched_info.get('title') or 'download')
+                    ext = self.fetched_info.get('ext') or 'bin'
+                    connections = options.get('fragment_concurrency', 1)
+                    self.download_params['direct'] = True
+                    self.download_params['opts'] = opts = {
+                        'path': f"{base}/{name}.{ext}", 'connections': connections if connections > 1 else 4}
                 self.show_confirmation(opts)
+                self.show_size_estimate(self.download_params)
+                if section:
+                    end = self.format_clip_time(section[1]) if section[1] is not None else 'end'
+                    self.ydl_options_display.append(
+                        f"\n✂️ Clip: {self.format_clip_time(section[0])} → {end} (cut on keyframes, no re-encode)")
+
+    @staticmethod
+    def format_clip_time(seconds):
+        seconds = int(seconds)
+        return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
 
     def show_playlist_download_options(self):
-        opt_dialog = DownloadOptionsDialog('playlist', self)
+        selected_items = None
+        listed = self.entries_model.rowCount()
+        if listed:
+            checked = self.entries_model.checked_indices()
+            if not checked:
+                self.status_text.append("⚠️ No playlist entries selected")
+                return
+            if len(checked) < listed:
+                selected_items = items_to_ranges(checked)
+        opt_dialog = DownloadOptionsDialog('playlist', self, selected_items)
         if opt_dialog.exec():
             options = opt_dialog.get_options()
             opts = self._get_base_opts(options)
@@ -1054,24 +2709,122 @@ class DownloadPage(QWidget):
             elif mode == 2: opts['playlist_items'] = options['playlist_items']
             
             q_sel = options.get('quality_selection', '1080p')
-            if 'Audio Only' in q_sel: opts['format'] = 'bestaudio[ext=m4a]/bestaudio'
-            else: opts['format'] = f'bestvideo[height<={q_sel.replace("p", "")}]+bestaudio'
+            if options['merge_format'] == 'audio': opts['format'] = NATIVE_AUDIO_FORMAT
+            elif 'Audio Only' in q_sel: opts['format'] = 'bestaudio[ext=m4a]/bestaudio'
+            else:
+                opts['format'], format_sort = playlist_format(options.get('max_size'), int(q_sel.replace("p", "")),
+                                                              options.get('prefer_codecs', ()),
+                                                              options.get('smallest', False))
+                if format_sort:
+                    opts['format_sort'] = format_sort
+            
+            # Sync mode: the playlist's download archive skips entries that are already on disk
+            if options.get('sync'):
+                opts['download_archive'] = self.playlist_sync.archive_path(self.fetched_url)
             
             self.download_params = {
                 'type': 'playlist', 'url': self.fetched_url, 'opts': opts, 
-                'info': self.fetched_info, 'save_path': f"{base}/{self.fetched_info.get('title', 'Playlist')}"
+                'info': self.fetched_info, 'save_path': f"{base}/{self.fetched_info.get('title', 'Playlist')}",
+                'sync': options.get('sync', False),
+                'parallel_entries': options.get('parallel_entries', 1),
+                'estimate': self.estimate_playlist(options, opts)
             }
             self.show_confirmation(opts)
+            self.show_size_estimate(self.download_params)
+
+    def estimate_playlist(self, options, opts):
+        """Estimated size of the playlist entries that will be downloaded, from the entries resolved so far."""
+        rows = [self.entries_model.entry(r) for r in range(self.entries_model.rowCount())]
+        mode = options.get('playlist_mode', 0)
+        if mode == 1:
+            rows = [r for r in rows if r[1] <= options['playlist_end']]
+        elif mode == 2:
+            wanted = set(ranges_to_items(options.get('playlist_items', '')))
+            rows = [r for r in rows if r[1] in wanted]
+        if not rows:
+            return None
+        q_sel = options.get('quality_selection', '1080p')
+        audio_only = 'Audio Only' in q_sel or options['merge_format'] in ('audio', 'mp3')
+        constraints = {'audio_only': audio_only, 'prefer_codecs': options.get('prefer_codecs', ()),
+                       'smallest': options.get('smallest', False)}
+        if not audio_only:
+            constraints['max_height'] = int(q_sel.replace('p', ''))
+        entries = [(self.entry_infos.get(r[2]), r[4]) for r in rows]
+        total, known = estimate_playlist_size(entries, **constraints)
+        return {'bytes': total, 'known': known, 'count': len(entries)} if total else None
+
+    def show_size_estimate(self, params):
+        """Adds the estimated download size and the free space of the target volume to the confirmation."""
+        estimate = params.get('estimate')
+        if isinstance(estimate, dict):
+            size = estimate['bytes']
+            note = (f" (from {estimate['known']} of {estimate['count']} entries)"
+                    if estimate['known'] < estimate['count'] else '')
+        else:
+            size, note = estimate, ''
+        free = free_space(params['save_path'])
+        text = f"~{self._format_bytes(size)}{note}" if size else "unknown"
+        self.ydl_options_display.append(f"\n📦 Estimated size: {text} · Free space: {self._format_bytes(free)}")
+
+    @staticmethod
+    def estimate_bytes(params):
+        estimate = params.get('estimate')
+        return estimate['bytes'] if isinstance(estimate, dict) else estimate
+
+    def check_disk_space(self, params):
+        """Preflight: compares the estimated size (plus what queued and running downloads still need) with
+        the free space of the target volume. Returns False if the user chose not to start the download.
+        Failed, paused and waiting items are left out, they may never be downloaded again."""
+        needed = self.estimate_bytes(params)
+        if not needed:
+            return True
+        reserved = sum(max(0, (i.get('estimate') or 0) - (i.get('downloaded') or 0))
+                       for i in self.queue_manager.queue.items() if i['state'] in (QUEUED, RUNNING))
+        try:
+            state, free = preflight(params['save_path'], needed, reserved)
+        except OSError:
+            return True
+        if state == SPACE_INSUFFICIENT:
+            answer = QMessageBox.warning(
+                self, "Not Enough Disk Space",
+                f"This download needs about {self._format_bytes(needed)}"
+                + (f" and queued downloads about {self._format_bytes(reserved)} more" if reserved else '')
+                + f", but only {self._format_bytes(free)} is free on the target drive.\n\n"
+                  "The download will most likely fail part way. Start it anyway?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No)
+            return answer == QMessageBox.StandardButton.Yes
+        if state == SPACE_LOW:
+            self.status_text.append(f"⚠️ Low disk space: {self._format_bytes(free)} free, "
+                                    f"this download needs about {self._format_bytes(needed)}")
+        return True
 
     def _get_base_opts(self, options):
         opts = {
             'ffmpeg_location': 'C:\\ffmpeg\\ffmpeg-7.1.1-essentials_build\\bin',
         }
+        # Performance options are only passed when changed, otherwise yt-dlp's defaults apply
+        if options.get('fragment_concurrency', 1) > 1:
+            opts['concurrent_fragment_downloads'] = options['fragment_concurrency']
+        if options.get('buffer_kib'):
+            opts['buffersize'] = options['buffer_kib'] * 1024
+        if options.get('http_chunk_mb'):
+            opts['http_chunk_size'] = options['http_chunk_mb'] * 1024 * 1024
         
         pp = []
         merge_fmt = options['merge_format']
         
-        if merge_fmt == 'mp3':
+        if merge_fmt == 'audio':
+            # 'best' keeps the downloaded codec: m4a files are left untouched, others are
+            # remuxed with stream copy (e.g. webm -> opus). No transcode, no quality loss.
+            pp.append({
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'best',
+            })
+            pp.append({'key': 'FFmpegMetadata'})
+
+        elif merge_fmt == 'mp3':
+            # Explicitly requested codec: the only mode that re-encodes the audio
             pp.append({
                 'key': 'FFmpegExtractAudio',
                 'preferredcodec': 'mp3',
@@ -1112,20 +2865,16 @@ class DownloadPage(QWidget):
         self.confirm_download_btn.clicked.connect(self.execute_download)
 
     def execute_download(self):
+        if not self.check_disk_space(self.download_params):
+            return
         self.confirmation_group.setVisible(False)
         self.start_download(self.download_params)
 
     def start_download(self, params):
-        url = params['url']
-        opts = params['opts']
-        save_path = params['save_path']
-
         if params.get('type') == 'playlist':
             self.progress_container.setVisible(False)
             self.playlist_progress_container.setVisible(True)
-            while self.playlist_progress_layout.count():
-                self.playlist_progress_layout.takeAt(0).widget().deleteLater()
-            self.playlist_progress_widgets.clear()
+            self.playlist_progress_model.clear()
         else:
             self.progress_container.setVisible(True)
             self.main_progress.setValue(0)
@@ -1133,112 +2882,60 @@ class DownloadPage(QWidget):
             self.download_speed_label.setText("Speed: N/A")
             self.download_size_label.setText("0MB / 0MB")
 
-        self.status_text.append(f"\n🚀 Starting download: {params['info'].get('title')}")
-        
-        # Wrap thread creation in try-except for error handling
-        try:
-            worker = DownloadWorker(url, opts)
-            worker.progress.connect(self.update_progress)
-            worker.log_message.connect(self.append_log_message)
-            worker.finished.connect(lambda r: self.on_finished(r, url, save_path))
-            worker.start()
-            self.workers.append(worker)
-        except Exception as e:
-            self.status_text.append(f"❌ Failed to start background process: {str(e)}")
-            winsound.MessageBeep(winsound.MB_ICONHAND)
+        item = {
+            'type': params['type'], 'url': params['url'], 'opts': params['opts'],
+            'save_path': params['save_path'], 'title': params['info'].get('title'),
+            'sync': params.get('sync', False),
+            'parallel_entries': params.get('parallel_entries', 1),
+            'section': params.get('section'),
+            'direct': params.get('direct', False),
+            'estimate': self.estimate_bytes(params)
+        }
+        self.download_bytes = {}
+        self.estimate_label.setVisible(bool(item['estimate']))
+        self.update_estimate_label(item['estimate'])
+        if item['sync']:
+            self.playlist_sync.add(item['url'], item['title'], item['opts'], item['save_path'])
+        self.cancel_download_btn.setEnabled(True)
+        self.cancel_download_btn.setVisible(True)
+        self.active_item_id = self.queue_manager.enqueue(item)
+        if self.queue_manager.queue.get(self.active_item_id)['state'] != RUNNING:
+            self.status_text.append(f"\n📥 Added to download queue: {item['title']}")
+
+    def on_item_started(self, item_id):
+        if item_id == self.active_item_id:
+            self.status_text.append(f"\n🚀 Starting download: {self.queue_manager.queue.get(item_id).get('title')}")
+
+    def on_item_progress(self, item_id, d):
+        if item_id == self.active_item_id:
+            self.update_progress(d)
+
+    def on_item_log(self, item_id, msg):
+        if item_id == self.active_item_id:
+            self.append_log_message(msg)
 
     def update_progress(self, d):
+        """Applies a compact progress record (see `ProgressThrottle`) to the progress widgets."""
         try:
-            total_bytes = d.get('total_bytes') or d.get('total_bytes_estimate')
-            downloaded_bytes = d.get('downloaded_bytes')
+            finished = d.get('status') == 'finished'
+            downloaded_bytes = d.get('downloaded')
+            total_bytes = d.get('total') or (downloaded_bytes if finished else None)
             speed = d.get('speed')
-            if not (total_bytes and downloaded_bytes and speed is not None):
+            if not (total_bytes and downloaded_bytes and (speed is not None or finished)):
                 return
 
-            percent = int((downloaded_bytes / total_bytes) * 100)
-            speed_str = d.get('_speed_str', 'N/A')
+            percent = 100 if finished else int((downloaded_bytes / total_bytes) * 100)
+            speed_str = f"{self._format_bytes(speed)}/s" if speed is not None else 'N/A'
             
             downloaded_str = self._format_bytes(downloaded_bytes)
             total_str = self._format_bytes(total_bytes)
 
+            self.download_bytes[(d.get('id'), d.get('filename'))] = (downloaded_bytes, total_bytes)
+            self.update_estimate_label(self.estimate_bytes(self.download_params))
+
             if self.download_params.get('type') == 'playlist':
-                video_info = d.get('info_dict', {})
-                video_id = video_info.get('id') or video_info.get('title')
-
-                if video_id not in self.playlist_progress_widgets:
-                    title = f"{video_info.get('playlist_index', '?')}. {video_info.get('title', 'Unknown Video')}"
-
-                    item_widget = QFrame()
-                    # Horizontal row: title | progress bar | speed/size
-                    item_layout = QHBoxLayout(item_widget)
-                    item_layout.setContentsMargins(0, 5, 0, 5)
-                    item_layout.setSpacing(10)
-
-                    # Title label (left) - will elide long text and show full text on hover
-                    title_label = QLabel(title)
-                    title_label.setWordWrap(False)
-                    title_label.setStyleSheet("color: white; font-size: 13px;")
-                    title_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-                    title_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-
-                    title_label.setToolTip(title)  # always show full title on hover
-
-                    # truncate title based on available playlist width
-                    fm = QFontMetrics(title_label.font())
-                    max_title_w = int(self.playlist_progress_container.width() * 0.45) if self.playlist_progress_container.width() else 350
-                    elided_text = fm.elidedText(title, Qt.TextElideMode.ElideRight, max_title_w)
-                    title_label.setText(elided_text)
-
-                    # Slim progress bar (center) with visible percentage and improved contrast
-                    progress_bar = QProgressBar()
-                    # Increased height to 20px to ensure text fits comfortably
-                    progress_bar.setFixedHeight(20)
-                    progress_bar.setTextVisible(True)
-                    progress_bar.setFormat("%p%")
-
-                    progress_bar.setStyleSheet(f"""
-                        QProgressBar {{
-                            border: 1px solid {THEME_BORDER};
-                            border-radius: 6px;
-                            background-color: #262637;     /* darker track */
-                            padding: 0px;
-                            color: white;                  /* default readable */
-                            font-weight: bold;
-                            text-align: center;            /* ensure text is centered */
-                        }}
-                        QProgressBar::chunk {{
-                            background-color: {THEME_ACCENT};
-                            border-radius: 6px;
-                        }}
-                    """)
-
-                    progress_bar.setFixedWidth(260)
-
-                    # Right-side small labels (speed, size)
-                    right_col = QVBoxLayout()
-                    right_col.setContentsMargins(0, 0, 0, 0)
-                    right_col.setSpacing(2)
-                    speed_label = QLabel(f"Speed: {speed_str}")
-                    size_label = QLabel(f"{downloaded_str} / {total_str}")
-                    speed_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                    size_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                    right_col.addWidget(speed_label)
-                    right_col.addWidget(size_label)
-
-                    item_layout.addWidget(title_label)
-                    item_layout.addWidget(progress_bar)
-                    item_layout.addLayout(right_col)
-
-                    self.playlist_progress_layout.addWidget(item_widget)
-                    # store title_label too so we can update elision when container resizes if needed
-                    self.playlist_progress_widgets[video_id] = (progress_bar, speed_label, size_label, title_label)
-
-                # stored tuple: (progress_bar, speed_label, size_label, title_label)
-                bar = self.playlist_progress_widgets[video_id][0]
-                bar.setValue(percent)
-                self._update_progress_text_contrast(bar, percent)
-                self.playlist_progress_widgets[video_id][1].setText(f"Speed: {speed_str}")
-                self.playlist_progress_widgets[video_id][2].setText(f"{downloaded_str} / {total_str}")
+                title = f"{d.get('playlist_index') or '?'}. {d.get('title') or 'Unknown Video'}"
+                self.playlist_progress_model.update_entry(d.get('id'), title, downloaded_bytes, total_bytes, speed)
             else:
                 self.main_progress.setValue(percent)
                 self.main_progress.setFormat(f"{percent}%")
@@ -1248,39 +2945,84 @@ class DownloadPage(QWidget):
         except (ValueError, TypeError, ZeroDivisionError, KeyError):
             pass
 
+    def update_estimate_label(self, estimate):
+        """Shows the bytes downloaded so far against the estimate (raised when the download outgrows it)."""
+        if not estimate:
+            return
+        done = sum(downloaded for downloaded, _ in self.download_bytes.values())
+        known = sum(total for _, total in self.download_bytes.values())
+        self.estimate_label.setText(f"📦 Downloaded {self._format_bytes(done)} of "
+                                    f"~{self._format_bytes(max(estimate, known))} estimated")
+
     def append_log_message(self, msg):
         self.status_text.append(msg)
 
-    def on_finished(self, result, url, save_path):
+    def on_finished(self, item, result):
         now = ctime()
         is_success = result.get('State')
-        abs_path = os.path.abspath(save_path) # Always get absolute path
+        url = item.get('url')
+        abs_path = os.path.abspath(item.get('save_path', '')) # Always get absolute path
         
         # Determine Process Type string
-        proc_type_raw = self.download_params.get('type', 'video')
+        proc_type_raw = item.get('type', 'video')
         if proc_type_raw == 'video':
             proc_type_str = 'Video/Audio Download'
             success_msg = "Video/Audio Downloaded Successfully"
         else:
             proc_type_str = 'Playlist Download'
             success_msg = "Playlist Downloaded Successfully"
-
+        if item.get('sync') and is_success:
+            self.playlist_sync.mark_synced(url)
         if is_success:
-            # Prefix with checkmark, use specific success string, show ABSOLUTE path
-            self.status_text.append(f"\n✅ {success_msg}")
-            self.status_text.append(f"📁 Saved to: {abs_path}")
-            self.main_progress.setValue(100)
-            self.main_progress.setFormat("Done")
-            # REMOVED SUCCESS SOUND (winsound.MessageBeep(winsound.MB_OK)) as requested
-        else:
-            # Error handling: show exact error, keep error sound
-            msg = f"❌ Download failed: {result.get('Error')}"
-            self.main_progress.setFormat("Error")
-            self.status_text.append(f"\n{msg}")
-            winsound.MessageBeep(winsound.MB_ICONHAND) # Error Sound kept
+            self.add_to_library(item, result.get('Files') or [])
+        cancelled = result.get('Cancelled', False)
+        if cancelled:
+            kept = result.get('Partial')
+            cancel_msg = ("Download Cancelled (partial files kept, resume it from the queue)" if kept
+                          else "Download Cancelled (partial files deleted)")
+
+        # Only the download followed by the current view updates the UI
+        if item.get('id') == self.active_item_id:
+            self.active_item_id = None
+            self.cancel_download_btn.setVisible(False)
+            if cancelled:
+                self.status_text.append(f"⏹ {cancel_msg}")
+                self.main_progress.setFormat("Cancelled")
+            elif is_success:
+                # Prefix with checkmark, use specific success string, show ABSOLUTE path
+                self.status_text.append(f"\n✅ {success_msg}")
+                self.status_text.append(f"📁 Saved to: {abs_path}")
+                self.main_progress.setValue(100)
+                self.main_progress.setFormat("Done")
+                if self.queue_manager.queue.verify_downloads and result.get('Files'):
+                    self.verify_item_id = item.get('id')
+                    self.status_text.append("🔍 Checking the downloaded files...")
+                # REMOVED SUCCESS SOUND (winsound.MessageBeep(winsound.MB_OK)) as requested
+            else:
+                # Error handling: show exact error, keep error sound
+                msg = f"❌ Download failed: {result.get('Error')}"
+                self.main_progress.setFormat("Error")
+                self.status_text.append(f"\n{msg}")
+                winsound.MessageBeep(winsound.MB_ICONHAND) # Error Sound kept
             
         # Determine Log Message
+        if cancelled:
+            write_log({
+                'URL': url,
+                'Process': proc_type_str,
+                'State': 'Cancelled',
+                'Message': cancel_msg,
+                'Save Location': abs_path if kept else None,
+                'Datetime': now
+            }, 'Download')
+            return
         log_msg = success_msg if is_success else result.get('Error')
+        if is_success and result.get('EntryErrors'):
+            log_msg = f"{log_msg}, {len(result['EntryErrors'])} entries failed"
+        if item.get('failure'):
+            log_msg = f"{log_msg} [{item['failure']}]"
+        if result.get('Stats'):
+            log_msg = f"{log_msg} ({self.format_stats(result['Stats'])})"
 
         write_log({
             'URL': url,
@@ -1291,6 +3033,57 @@ class DownloadPage(QWidget):
             'Datetime': now
         }, 'Download')
 
+    @classmethod
+    def format_stats(cls, stats):
+        """One line summary of a `SpeedRecorder` summary, for the download log."""
+        parts = [f"{cls._format_bytes(stats['bytes'])} in {stats['wall_s']:.1f}s"]
+        if stats.get('avg_speed'):
+            parts.append(f"avg {cls._format_bytes(stats['avg_speed'])}/s")
+        if stats.get('peak_speed'):
+            parts.append(f"peak {cls._format_bytes(stats['peak_speed'])}/s, "
+                         f"low {cls._format_bytes(stats['min_speed'])}/s")
+        parts.append(f"{stats['retries']} retries")
+        if stats.get('file'):
+            parts.append(f"samples: {os.path.basename(stats['file'])}")
+        return ', '.join(parts)
+
+    def add_to_library(self, item, files):
+        """Records the downloaded files with their metadata in the searchable library."""
+        try:
+            for f in files:
+                if f.get('path'):
+                    metadata = dict(f.get('metadata') or {})
+                    metadata['url'] = metadata.get('url') or item.get('url')
+                    metadata['title'] = metadata.get('title') or item.get('title')
+                    self.library.add(f['path'], metadata)
+        except sqlite3.Error as e:
+            write_log({'URL': item.get('url'), 'Process': 'Library', 'State': 0,
+                       'Error': f'Could not add to the library: {e}', 'Datetime': ctime()}, 'Download')
+
+    def on_verified(self, item, result):
+        """Logs the integrity check of a finished download (see `DownloadVerifier`)."""
+        if result.get('State'):
+            msg = f"✅ Integrity check passed: {result.get('Message')}"
+        elif result.get('Requeued'):
+            msg = f"⚠️ Integrity check failed, queued again: {result.get('Error')}"
+        else:
+            msg = f"❌ Integrity check failed: {result.get('Error')}"
+        if item.get('id') == self.verify_item_id:
+            self.verify_item_id = None
+            self.status_text.append(msg)
+        broken = [r['File'] for r in result.get('Results', []) if not r['State'] and r.get('File')]
+        if broken:
+            self.library.remove(broken)
+        write_log({
+            'URL': item.get('url'),
+            'Process': 'Integrity Check',
+            'State': 1 if result.get('State') else 0,
+            'Message': result.get('Message') or ('Queued again' if result.get('Requeued') else 'Not queued again'),
+            'Save Location': os.path.abspath(item.get('save_path', '')),
+            'Error': result.get('Error'),
+            'Datetime': ctime()
+        }, 'Download')
+
     def clear_layout(self):
         if self.layout():
             while self.layout().count():
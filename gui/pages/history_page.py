@@ -93,7 +93,10 @@ class HistoryPage(QWidget):
             datetime_raw = row.get('Datetime', '')
 
             # Determine message and style
-            if message and message.strip():
+            if row.get('State') == 'Cancelled':
+                display_msg = message
+                bg = QColor(249, 226, 175, 80)  # light amber transparent
+            elif message and message.strip():
                 display_msg = message
                 bg = QColor(166, 227, 161, 80)  # light green with transparency
             else:
@@ -0,0 +1,117 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton,
+                             QLabel, QLineEdit, QHeaderView, QAbstractItemView)
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor
+from cli.user_input_handler import format_duration
+import os
+
+
+class LibraryPage(QWidget):
+    """Searches the downloaded files recorded in the `MediaLibrary` by title, description and channel.
+    Results are refreshed while typing (after a short pause). Double clicking a row opens the file.
+    """
+    back_requested = pyqtSignal()
+
+    search_delay = 200  # ms of typing pause before searching
+    result_limit = 500
+
+    def __init__(self, library, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self.results = []
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(8, 8, 8, 8)
+
+        top = QHBoxLayout()
+        back_btn = QPushButton("← Back")
+        back_btn.setFixedSize(100, 40)
+        back_btn.setProperty("class", "back")
+        back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        back_btn.clicked.connect(self.back_requested.emit)
+        top.addWidget(back_btn)
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search downloads by title, description or channel...")
+        self.search_input.setClearButtonEnabled(True)
+        top.addWidget(self.search_input, 1)
+        self.count_label = QLabel("")
+        top.addWidget(self.count_label)
+        self.layout.addLayout(top)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.search_delay)
+        self.search_timer.timeout.connect(self.search)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        self.search_input.returnPressed.connect(self.search)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(6)
+        self.table.setHorizontalHeaderLabels(['Title', 'Channel', 'Uploaded', 'Duration', 'Site', 'File'])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
+        self.table.itemDoubleClicked.connect(lambda item: self.open_file(item.row()))
+        self.layout.addWidget(self.table)
+
+        actions = QHBoxLayout()
+        open_btn = QPushButton("Open File")
+        open_btn.setProperty("class", "primary")
+        open_btn.clicked.connect(lambda: self.open_file(self.table.currentRow()))
+        folder_btn = QPushButton("Open Folder")
+        folder_btn.clicked.connect(lambda: self.open_folder(self.table.currentRow()))
+        clean_btn = QPushButton("Remove Missing Files")
+        clean_btn.setToolTip("Forget the files that were moved or deleted since they were downloaded")
+        clean_btn.clicked.connect(self.remove_missing)
+        for btn in (open_btn, folder_btn, clean_btn):
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            actions.addWidget(btn)
+        actions.addStretch()
+        self.layout.addLayout(actions)
+
+        self.search()
+
+    def search(self):
+        self.search_timer.stop()
+        query = self.search_input.text()
+        self.results = self.library.search(query, self.result_limit)
+        total = self.library.count()
+        if query.strip():
+            self.count_label.setText(f"{len(self.results)} of {total} files")
+        else:
+            self.count_label.setText(f"{total} files" + (f", latest {len(self.results)}" if total > len(self.results) else ""))
+        self.table.setRowCount(len(self.results))
+        for r, row in enumerate(self.results):
+            date = row['upload_date'] or ''
+            if len(date) == 8 and date.isdigit():
+                date = f"{date[:4]}-{date[4:6]}-{date[6:]}"
+            values = [row['title'] or os.path.basename(row['path']), row['channel'] or '', date,
+                      format_duration(row['duration'], ''), row['domain'] or row['extractor'] or '', row['path']]
+            missing = not os.path.exists(row['path'])
+            for c, value in enumerate(values):
+                cell = QTableWidgetItem(value)
+                cell.setToolTip(row['description'][:500] if c == 0 and row['description'] else value)
+                if missing:
+                    cell.setForeground(QColor(243, 139, 168))
+                    if c == 5:
+                        cell.setToolTip(f"Missing: {value}")
+                self.table.setItem(r, c, cell)
+
+    def open_file(self, row):
+        if 0 <= row < len(self.results) and os.path.exists(self.results[row]['path']):
+            os.startfile(self.results[row]['path'])
+
+    def open_folder(self, row):
+        if 0 <= row < len(self.results):
+            folder = os.path.dirname(self.results[row]['path'])
+            if os.path.isdir(folder):
+                os.startfile(folder)
+
+    def remove_missing(self):
+        self.library.remove(self.library.missing())
+        self.search()
@@ -0,0 +1,183 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+                             QPushButton, QLabel, QSpinBox, QCheckBox, QHeaderView, QAbstractItemView)
+from PyQt6.QtCore import Qt, pyqtSignal
+import time
+
+
+class QueuePage(QWidget):
+    """Shows the download queue as a table with controls to pause/resume, cancel, reorder,
+    change priority and remove items, and to set how many downloads run at once and the total speed limit.
+    The page only talks to the `DownloadQueueManager`, so closing it never affects downloads.
+    With a `MetadataCache`, its expiry time and size can be set here too.
+    """
+    back_requested = pyqtSignal()
+
+    def __init__(self, manager, metadata_cache=None, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.metadata_cache = metadata_cache
+        self.rows = {}  # item id -> row
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(8, 8, 8, 8)
+
+        # Top row: back button and concurrency setting
+        top = QHBoxLayout()
+        back_btn = QPushButton("← Back")
+        back_btn.setFixedSize(100, 40)
+        back_btn.setProperty("class", "back")
+        back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        back_btn.clicked.connect(self.back_requested.emit)
+        top.addWidget(back_btn)
+        top.addStretch()
+        top.addWidget(QLabel("Concurrent downloads:"))
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, 16)
+        self.concurrency_spin.setValue(self.manager.queue.max_concurrent)
+        self.concurrency_spin.valueChanged.connect(self.manager.set_max_concurrent)
+        top.addWidget(self.concurrency_spin)
+        top.addWidget(QLabel("Speed limit:"))
+        self.rate_spin = QSpinBox()
+        self.rate_spin.setRange(0, 1024 * 1024)
+        self.rate_spin.setSingleStep(256)
+        self.rate_spin.setSuffix(" KB/s")
+        self.rate_spin.setSpecialValueText("Unlimited")
+        self.rate_spin.setValue(self.manager.queue.rate_limit // 1024)
+        self.rate_spin.setToolTip("Total speed shared by all downloads, higher priorities get a bigger share")
+        self.rate_spin.valueChanged.connect(lambda kb: self.manager.set_rate_limit(kb * 1024))
+        top.addWidget(self.rate_spin)
+        top.addWidget(QLabel("Post-processing jobs:"))
+        self.postprocess_spin = QSpinBox()
+        self.postprocess_spin.setRange(1, 16)
+        self.postprocess_spin.setValue(self.manager.queue.postprocess_workers)
+        self.postprocess_spin.setToolTip("ffmpeg jobs (metadata, subtitles, audio extraction) running next to the downloads")
+        self.postprocess_spin.valueChanged.connect(self.manager.set_postprocess_workers)
+        top.addWidget(self.postprocess_spin)
+        self.verify_check = QCheckBox("Verify downloads")
+        self.verify_check.setChecked(self.manager.queue.verify_downloads)
+        self.verify_check.setToolTip("Check finished files (size, and container/duration with ffprobe) "
+                                     "in the background and download broken ones again")
+        self.verify_check.toggled.connect(self.manager.set_verify_downloads)
+        top.addWidget(self.verify_check)
+        self.layout.addLayout(top)
+
+        if metadata_cache is not None:
+            cache_row = QHBoxLayout()
+            cache_row.addStretch()
+            cache_row.addWidget(QLabel("Metadata cache: keep for"))
+            self.cache_ttl_spin = QSpinBox()
+            self.cache_ttl_spin.setRange(0, 24 * 365)
+            self.cache_ttl_spin.setSuffix(" h")
+            self.cache_ttl_spin.setSpecialValueText("Off")
+            self.cache_ttl_spin.setValue(metadata_cache.ttl // 3600)
+            self.cache_ttl_spin.setToolTip("Fetched video and playlist details are reused for this long")
+            self.cache_ttl_spin.valueChanged.connect(lambda hours: metadata_cache.configure(ttl=hours * 3600))
+            cache_row.addWidget(self.cache_ttl_spin)
+            cache_row.addWidget(QLabel("at most"))
+            self.cache_size_spin = QSpinBox()
+            self.cache_size_spin.setRange(1, 100000)
+            self.cache_size_spin.setSingleStep(100)
+            self.cache_size_spin.setSuffix(" entries")
+            self.cache_size_spin.setValue(metadata_cache.max_entries)
+            self.cache_size_spin.setToolTip("The least recently used details are dropped first")
+            self.cache_size_spin.valueChanged.connect(lambda count: metadata_cache.configure(max_entries=count))
+            cache_row.addWidget(self.cache_size_spin)
+            self.layout.addLayout(cache_row)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(5)
+        self.table.setHorizontalHeaderLabels(['Title', 'Type', 'Priority', 'State', 'Progress'])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.layout.addWidget(self.table)
+
+        # Bottom row: item actions, each applied to the selected item
+        actions = QHBoxLayout()
+        for text, slot in (("Pause", self._pause),
+                           ("Resume", lambda i: self.manager.resume(i)),
+                           ("▲ Move Up", lambda i: self.manager.move(i, -1)),
+                           ("▼ Move Down", lambda i: self.manager.move(i, 1)),
+                           ("Priority +", lambda i: self._shift_priority(i, 1)),
+                           ("Priority −", lambda i: self._shift_priority(i, -1)),
+                           ("Cancel", lambda i: self.manager.cancel(i, keep_partial=False)),
+                           ("Remove", lambda i: self.manager.remove(i))):
+            btn = QPushButton(text)
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            btn.clicked.connect(lambda _, s=slot: self._apply(s))
+            actions.addWidget(btn)
+        retry_btn = QPushButton("Retry Failed")
+        retry_btn.setToolTip("Queue every failed download again (playlists skip the files already downloaded)")
+        retry_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        retry_btn.clicked.connect(self.manager.retry_failed)
+        actions.addWidget(retry_btn)
+        self.layout.addLayout(actions)
+
+        self.manager.queue_changed.connect(self.refresh)
+        self.manager.item_progress.connect(self._on_progress)
+        self.refresh()
+
+    def selected_id(self):
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.table.item(rows[0].row(), 0).data(Qt.ItemDataRole.UserRole)
+
+    def _apply(self, slot):
+        item_id = self.selected_id()
+        if item_id is not None:
+            slot(item_id)
+
+    def _pause(self, item_id):
+        # A running download is stopped with its partial files kept, it continues from them when resumed
+        if item_id in self.manager.workers:
+            self.manager.cancel(item_id, keep_partial=True)
+        else:
+            self.manager.pause(item_id)
+
+    def _shift_priority(self, item_id, step):
+        item = self.manager.queue.get(item_id)
+        if item is not None:
+            self.manager.set_priority(item_id, item['priority'] + step)
+
+    def refresh(self):
+        """Rebuild the table from the queue, keeping the selected item selected."""
+        selected = self.selected_id()
+        items = self.manager.queue.items()
+        self.rows = {}
+        self.table.setRowCount(len(items))
+        for r, item in enumerate(items):
+            self.rows[item['id']] = r
+            values = [item.get('title') or item.get('url'), item.get('type', ''), str(item['priority']),
+                      item['state'], self._details(item)]
+            for c, value in enumerate(values):
+                cell = QTableWidgetItem(value)
+                cell.setToolTip(value)
+                if c == 0:
+                    cell.setData(Qt.ItemDataRole.UserRole, item['id'])
+                self.table.setItem(r, c, cell)
+            if item['id'] == selected:
+                self.table.selectRow(r)
+
+    @staticmethod
+    def _details(item):
+        """Progress column text of an item that is not running: why it failed, or when it is retried."""
+        if item['state'] == 'Failed':
+            return f"[{item['failure']}] {item.get('error', '')}" if item.get('failure') else item.get('error', '')
+        if item['state'] == 'Waiting':
+            at = time.strftime('%H:%M:%S', time.localtime(item.get('retry_at', 0)))
+            return f"Retry {item.get('retry_attempts', 1)} at {at}: {item.get('error', '')}"
+        return ''
+
+    def _on_progress(self, item_id, d):
+        row = self.rows.get(item_id)
+        if row is None:
+            return
+        total, done, speed = d.get('total'), d.get('downloaded'), d.get('speed')
+        if total and done:
+            speed_str = f"{speed / (1024 * 1024):.2f}MB/s" if speed else ''
+            self.table.item(row, 4).setText(f"{int(done / total * 100)}%  {speed_str}")
@@ -0,0 +1,77 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+                             QPushButton, QHeaderView, QAbstractItemView)
+from PyQt6.QtCore import Qt, pyqtSignal
+from time import ctime
+
+
+class SyncPage(QWidget):
+    """Lists the playlists saved for syncing. Syncing a playlist queues it as a download
+    that only fetches the entries missing from its download archive.
+    """
+    back_requested = pyqtSignal()
+    sync_requested = pyqtSignal(list)  # list of saved playlist dicts
+
+    def __init__(self, playlist_sync, parent=None):
+        super().__init__(parent)
+        self.playlist_sync = playlist_sync
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(8, 8, 8, 8)
+
+        top = QHBoxLayout()
+        back_btn = QPushButton("← Back")
+        back_btn.setFixedSize(100, 40)
+        back_btn.setProperty("class", "back")
+        back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        back_btn.clicked.connect(self.back_requested.emit)
+        top.addWidget(back_btn)
+        top.addStretch()
+        self.layout.addLayout(top)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(4)
+        self.table.setHorizontalHeaderLabels(['Playlist', 'Downloaded Entries', 'Last Synced', 'URL'])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        self.layout.addWidget(self.table)
+
+        actions = QHBoxLayout()
+        sync_selected_btn = QPushButton("Sync Selected")
+        sync_selected_btn.clicked.connect(lambda: self.sync_requested.emit(self.selected_playlists()))
+        sync_all_btn = QPushButton("Sync All")
+        sync_all_btn.setProperty("class", "success")
+        sync_all_btn.clicked.connect(lambda: self.sync_requested.emit(self.playlist_sync.playlists()))
+        remove_btn = QPushButton("Remove")
+        remove_btn.clicked.connect(self.remove_selected)
+        for btn in (sync_selected_btn, sync_all_btn, remove_btn):
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            actions.addWidget(btn)
+        self.layout.addLayout(actions)
+
+        self.refresh()
+
+    def selected_playlists(self):
+        rows = sorted({i.row() for i in self.table.selectionModel().selectedRows()})
+        return [self.playlist_sync.get(self.table.item(r, 3).text()) for r in rows]
+
+    def remove_selected(self):
+        for playlist in self.selected_playlists():
+            self.playlist_sync.remove(playlist['url'])
+        self.refresh()
+
+    def refresh(self):
+        playlists = self.playlist_sync.playlists()
+        self.table.setRowCount(len(playlists))
+        for r, p in enumerate(playlists):
+            values = [p['title'] or p['url'], str(self.playlist_sync.archived_count(p['url'])),
+                      ctime(p['last_synced']) if p.get('last_synced') else 'Never', p['url']]
+            for c, value in enumerate(values):
+                cell = QTableWidgetItem(value)
+                cell.setToolTip(value)
+                self.table.setItem(r, c, cell)
@@ -0,0 +1,127 @@
+'''
+Checks of `HTTPDownloader` against a local `MediaServer`: a full parallel download, a cancelled download
+resumed from its `.part.json` resume data, the single request fallback of servers without Range support,
+and that an existing file is never overwritten.
+
+Usage (from the repository root)::
+
+    python -m unittest tests.test_http_downloader
+'''
+from benchmarks.media_server import MediaServer
+from cli.http_downloader import HTTPDownloader
+import unittest
+import tempfile
+import requests
+import json
+import os
+
+CHUNK = 256 * 1024
+
+
+def content(url: str) -> bytes:
+    '''Reference bytes of a file, fetched with one plain request'''
+    r = requests.get(url, timeout=30)
+    r.raise_for_status()
+    return r.content
+
+
+class HTTPDownloaderTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.path = os.path.join(self.folder.name, 'video.mp4')
+
+    def serve(self, **kwargs) -> MediaServer:
+        server = MediaServer(**kwargs).start()
+        self.addCleanup(server.stop)
+        return server
+
+    def ranges(self, server: MediaServer, since: int = 0) -> list:
+        '''Range headers of the chunk requests (not the probe) received after the first `since` requests'''
+        return [r[1] for r in server.requests[since:] if r[1] not in (None, 'bytes=0-0')]
+
+    def assertDownloaded(self, result: dict, url: str, size: int):
+        self.assertTrue(result['State'], result.get('Error'))
+        self.assertEqual(result['Path'], self.path)
+        self.assertEqual(result['Size'], size)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), content(url))
+        self.assertFalse(os.path.exists(self.path + '.part'))
+        self.assertFalse(os.path.exists(self.path + '.part.json'))
+
+    def test_full_download(self):
+        size = 5 * CHUNK + 1234
+        server = self.serve()
+        url = server.media_url(size)
+        result = HTTPDownloader(url, self.path, connections=4, chunk_size=CHUNK).download()
+        self.assertDownloaded(result, url, size)
+        self.assertEqual(result['Expected'], size)
+        expected = {f'bytes={start}-{min(start + CHUNK, size) - 1}' for start in range(0, size, CHUNK)}
+        self.assertEqual(sorted(self.ranges(server)), sorted(expected))
+
+    def test_resume_after_cancel(self):
+        size = 8 * CHUNK
+        server = self.serve(rate=2 * CHUNK)
+        cancelled = []
+
+        def progress(d):
+            if d['downloaded_bytes'] >= 3 * CHUNK:
+                cancelled.append(True)
+
+        first = HTTPDownloader(server.media_url(size), self.path, connections=2, chunk_size=CHUNK,
+                               progress=progress, is_cancelled=lambda: bool(cancelled))
+        result = first.download()
+        self.assertFalse(result['State'])
+        self.assertTrue(result.get('Cancelled'))
+        self.assertFalse(os.path.exists(self.path))
+        self.assertTrue(os.path.exists(first.part_path))
+        with open(first.state_path, encoding='utf-8') as f:
+            done = {f'bytes={start}-{end}' for start, end in json.load(f)['done']}
+        self.assertTrue(0 < len(done) < size // CHUNK, done)
+
+        requested = len(server.requests)
+        server.rate = 0
+        result = HTTPDownloader(server.media_url(size), self.path, connections=2, chunk_size=CHUNK).download()
+        self.assertDownloaded(result, server.media_url(size), size)
+        # Only the chunks missing from the resume data are fetched again
+        missing = {f'bytes={start}-{start + CHUNK - 1}' for start in range(0, size, CHUNK)} - done
+        self.assertEqual(sorted(self.ranges(server, requested)), sorted(missing))
+
+    def test_resume_data_of_other_file_is_ignored(self):
+        size = 4 * CHUNK
+        server = self.serve()
+        with open(self.path + '.part', 'wb') as f:
+            f.write(b'\0' * size)
+        with open(self.path + '.part.json', 'w', encoding='utf-8') as f:
+            json.dump({'url': server.media_url(size + 1), 'size': size + 1, 'done': [[0, CHUNK - 1]]}, f)
+        result = HTTPDownloader(server.media_url(size), self.path, connections=2, chunk_size=CHUNK).download()
+        self.assertDownloaded(result, server.media_url(size), size)
+        self.assertEqual(len(self.ranges(server)), size // CHUNK)
+
+    def test_no_range_fallback(self):
+        size = 3 * CHUNK + 77
+        server = self.serve(ranges=False)
+        result = HTTPDownloader(server.media_url(size), self.path, connections=4, chunk_size=CHUNK).download()
+        # The probe and a single plain request, no chunks
+        self.assertEqual(len(server.requests), 2)
+        self.assertIsNone(server.requests[-1][1])
+        self.assertDownloaded(result, server.media_url(size), size)
+
+    def test_existing_file_is_kept(self):
+        size = 2 * CHUNK
+        server = self.serve()
+        for name in ('video.mp4', 'video (1).mp4'):
+            with open(os.path.join(self.folder.name, name), 'wb') as f:
+                f.write(b'keep')
+        result = HTTPDownloader(server.media_url(size), self.path, chunk_size=CHUNK).download()
+        self.assertTrue(result['State'], result.get('Error'))
+        self.assertEqual(result['Path'], os.path.join(self.folder.name, 'video (2).mp4'))
+        for name in ('video.mp4', 'video (1).mp4'):
+            with open(os.path.join(self.folder.name, name), 'rb') as f:
+                self.assertEqual(f.read(), b'keep')
+        with open(result['Path'], 'rb') as f:
+            self.assertEqual(f.read(), content(server.media_url(size)))
+
+
+if __name__ == '__main__':
+    unittest.main()